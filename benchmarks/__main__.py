@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+"""
+Runs the benchmark suite, optionally saving the results as a baseline or
+comparing them with one.
+
+Run with: python -m benchmarks [--save] [--threshold 0.25] [-k pattern]
+Exits with status 1 if a benchmark regressed by more than the threshold.
+"""
+import argparse
+import os
+import sys
+
+from src import white_box
+
+from . import (  # pylint: disable=unused-import
+    bench_import,
+    bench_memoize,
+    bench_white_box,
+)
+from .suite import (
+    BENCHMARKS,
+    compare,
+    format_groups,
+    format_result,
+    load_baseline,
+    run,
+    save_baseline,
+    uncovered,
+)
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def parse_args(argv=None):
+    """
+    Parses the command line.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "--baseline", default=DEFAULT_BASELINE, help="JSON baseline file"
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="save the results as the baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="fail when a benchmark is slower than the baseline by more than "
+        "this fraction (default: 0.25)",
+    )
+    parser.add_argument(
+        "-k", dest="pattern", help="only run benchmarks whose name contains this"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.02)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Runs the suite and returns the exit status.
+    """
+    args = parse_args(argv)
+    missing = uncovered(white_box)
+    if missing:
+        print(f"warning: no benchmark covers {', '.join(missing)}", file=sys.stderr)
+
+    names = [name for name in BENCHMARKS if not args.pattern or args.pattern in name]
+    results = run(
+        names,
+        args.repeat,
+        args.min_time,
+        report=lambda name, result: print(format_result(name, result)),
+    )
+    print()
+    print("\n".join(format_groups(results)))
+
+    if args.save:
+        if os.path.exists(args.baseline):
+            # Keep the baselines of the benchmarks that were not run
+            results = {**load_baseline(args.baseline), **results}
+        save_baseline(args.baseline, results)
+        print(f"\nSaved {len(results)} results to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}; run with --save to create it")
+        return 0
+
+    regressions = compare(results, load_baseline(args.baseline), args.threshold)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.name}: {regression.baseline * 1e3:.3f} ms -> "
+            f"{regression.current * 1e3:.3f} ms (+{regression.change:.0%})"
+        )
+    if regressions:
+        return 1
+
+    print(f"\nNo regression over {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+"""
+Multi-threaded throughput benchmark of BankingSystem.transfer_money.
+Checks that the ledger neither creates nor loses money.
+
+Pure-Python transfers hold the GIL, so their throughput can't grow with
+threads. The second run gives every customer account a simulated write
+latency while it is locked, as a persistent ledger would have: threads
+then scale as long as transfers lock disjoint accounts.
+
+Run with: python -m benchmarks.bench_banking
+"""
+import math
+import random
+import threading
+import time
+
+from src.events import NullSink
+from src.white_box.banking import BankingSystem
+
+
+class SlowLock:
+    """
+    Lock sleeping for a given latency, GIL released, each time it is taken.
+    """
+
+    def __init__(self, latency):
+        self.latency = latency
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        self._lock.acquire()
+        time.sleep(self.latency)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._lock.release()
+
+
+def open_accounts(bank, accounts, latency):
+    """
+    Opens and logs in the given number of accounts, which sleep for latency
+    seconds each time they are locked. Returns their numbers.
+    """
+    names = [f"acc{i}" for i in range(accounts)]
+    for name in names:
+        account = bank.open_account(name)
+        if latency:
+            account.lock = SlowLock(latency)
+        bank.logged_in_users.add(name)
+    return names
+
+
+def run(threads, transfers_per_thread, accounts=1000, seed=0, latency=0.0):
+    """
+    Runs random transfers from several threads and returns the elapsed time.
+    Customer accounts sleep for latency seconds each time they are locked.
+    """
+    bank = BankingSystem(sink=NullSink())
+    names = open_accounts(bank, accounts, latency)
+    opening_total = math.fsum(account.balance for account in bank.accounts.values())
+
+    def worker(worker_seed):
+        rng = random.Random(worker_seed)
+        for _ in range(transfers_per_thread):
+            sender, receiver = rng.sample(names, 2)
+            transaction_type = rng.choice(["regular", "express", "scheduled"])
+            bank.transfer_money(sender, receiver, rng.randint(1, 200), transaction_type)
+
+    workers = [
+        threading.Thread(target=worker, args=(seed + i,)) for i in range(threads)
+    ]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    closing_total = (
+        math.fsum(account.balance for account in bank.accounts.values())
+        + bank.fee_account.balance
+    )
+    assert math.isclose(opening_total, closing_total, rel_tol=1e-12), (
+        opening_total,
+        closing_total,
+    )
+    return elapsed
+
+
+def main(transfers=200_000, slow_transfers=5_000, latency=0.0001):
+    """
+    Prints the transfer throughput for different numbers of threads, without
+    and with a ledger write latency.
+    """
+    for threads in (1, 2, 4, 8):
+        elapsed = run(threads, transfers // threads)
+        print(f"{threads} threads: {transfers / elapsed:,.0f} transfers/s")
+
+    print(f"With a {latency * 1e6:.0f} us ledger write latency:")
+    for threads in (1, 2, 4, 8):
+        elapsed = run(threads, slow_transfers // threads, latency=latency)
+        print(f"{threads} threads: {slow_transfers / elapsed:,.0f} transfers/s")
+
+
+if __name__ == "__main__":
+    main()
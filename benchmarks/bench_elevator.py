@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+"""
+Elevator bank simulation benchmark: a 40-floor building with 8 cars and a
+million random hall calls.
+
+Run with: python -m benchmarks.bench_elevator
+"""
+import random
+import time
+
+from src.elevator_sim import ElevatorSimulation, nearest_car, round_robin
+
+
+def hall_calls(count, floors, rate, seed=0):
+    """
+    Generates Poisson-distributed hall calls, half of them from the lobby.
+    """
+    rng = random.Random(seed)
+    now = 0.0
+    for _ in range(count):
+        now += rng.expovariate(rate)
+        origin = 0 if rng.random() < 0.5 else rng.randrange(1, floors)
+        destination = rng.randrange(floors)
+        while destination == origin:
+            destination = rng.randrange(floors)
+        yield now, origin, destination
+
+
+def main(calls=1_000_000, floors=40, cars=8, rate=0.15):
+    """
+    Runs the scenario with each dispatch policy and prints the results.
+    """
+    scenario = list(hall_calls(calls, floors, rate))
+    for name, dispatch in (("nearest", nearest_car), ("round-robin", round_robin())):
+        simulation = ElevatorSimulation(cars, floors, dispatch)
+        start = time.perf_counter()
+        report = simulation.run(scenario)
+        elapsed = time.perf_counter() - start
+
+        waits = ", ".join(
+            f"p{p}={value:.1f}s" for p, value in report.wait_percentiles().items()
+        )
+        print(
+            f"{name:>11}: {report.events:,} events in {elapsed:.2f}s"
+            f" ({report.events / elapsed:,.0f} events/s), waits {waits}"
+        )
+
+
+if __name__ == "__main__":
+    main()
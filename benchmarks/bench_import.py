@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+"""
+Import-time benchmarks of src.white_box, each in a fresh interpreter.
+
+The suite times whole interpreter runs of every scenario against a bare
+start-up, in the "import" group, so that baselines catch a subsystem that
+starts importing NumPy or re again. Run as a script, this module prints the
+python -X importtime breakdown of each scenario: the modules it imports on
+top of the interpreter start-up, by cumulative import time.
+
+Run with: python -m benchmarks.bench_import
+"""
+import os
+import subprocess
+import sys
+
+from .suite import benchmark
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Statement run by each scenario, the first one being the bare start-up
+SCENARIOS = {
+    "startup": "pass",
+    "package": "import src.white_box",
+    "validator": "from src.white_box import validate_email",
+    "url": "from src.white_box import validate_url; validate_url('http://a.b')",
+    "batch": "from src.white_box import check_file_sizes",
+    "rules": "from src.white_box import check_loan_eligibility",
+    "banking": "from src.white_box import BankingSystem",
+    "everything": "from src.white_box import *",
+}
+
+
+def _run(statement, *options):
+    """
+    Runs a statement in a fresh interpreter from the repository root and
+    returns what it wrote to stderr.
+    """
+    completed = subprocess.run(
+        [sys.executable, *options, "-c", statement],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return completed.stderr
+
+
+def import_times(statement):
+    """
+    Returns the cumulative import time, in microseconds, of every module
+    imported at the top level by a statement, as reported by -X importtime.
+    """
+    times = {}
+    for line in _run(statement, "-X", "importtime").splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit() and not name[1:].startswith(" "):
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def _register(scenario):
+    """
+    Registers the benchmark of an interpreter running a scenario.
+    """
+    statement = SCENARIOS[scenario]
+
+    @benchmark(name=f"import.{scenario}", group="import")
+    def setup():
+        return lambda: _run(statement)
+
+
+for _scenario in SCENARIOS:
+    _register(_scenario)
+
+
+def main(top=5):
+    """
+    Prints the import time of each scenario on top of the start-up, with its
+    slowest modules.
+    """
+    startup = import_times(SCENARIOS["startup"])
+    for scenario, statement in SCENARIOS.items():
+        times = {
+            name: time
+            for name, time in import_times(statement).items()
+            if name not in startup
+        }
+        slowest = sorted(times.items(), key=lambda item: -item[1])[:top]
+        details = ", ".join(f"{name} {time / 1e3:.1f}" for name, time in slowest)
+        print(f"{scenario:>10}: {sum(times.values()) / 1e3:6.1f} ms ({details})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+"""
+Throughput benchmark of the loan scorer over an applicant file, against the
+single-core loop calling check_loan_eligibility per row.
+
+Run with: python -m benchmarks.bench_loans
+"""
+import csv
+import os
+import random
+import tempfile
+import time
+
+from src.loan_scorer import LoanScorer
+from src.white_box.rules import check_loan_eligibility
+
+
+def write_applicants(path, rows, seed=0):
+    """
+    Writes a CSV applicant file with an id, income and credit score per row.
+    """
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("id,income,credit_score\n")
+        for index in range(rows):
+            income = round(rng.lognormvariate(10.5, 0.6), 2)
+            file.write(f"{index},{income},{rng.randint(300, 850)}\n")
+
+
+def score_loop(source, destination):
+    """
+    Scores the file one row at a time, as the overnight job did.
+    """
+    with open(source, encoding="utf-8", newline="") as infile, open(
+        destination, "w", encoding="utf-8", newline=""
+    ) as outfile:
+        reader, writer = csv.reader(infile), csv.writer(outfile)
+        writer.writerow([*next(reader), "eligibility"])
+        for row in reader:
+            writer.writerow([*row, check_loan_eligibility(float(row[1]), int(row[2]))])
+
+
+def main(rows=2_000_000):
+    """
+    Runs the benchmark and prints the rows per second of each configuration.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "applicants.csv")
+        destination = os.path.join(directory, "scored.csv")
+        write_applicants(source, rows)
+
+        start = time.perf_counter()
+        score_loop(source, destination)
+        print(f"{'loop':>12}: {rows / (time.perf_counter() - start):,.0f} rows/s")
+
+        workers = 1
+        while workers <= (os.cpu_count() or 1):
+            progress = LoanScorer(workers=workers).score_file(source, destination)
+            print(f"{workers:>4} workers: {progress.rows_per_second:,.0f} rows/s")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks of the pure classifier functions of src.white_box with and
+without memoization, over streams of repeated inputs, and over inputs that
+never repeat (every lookup misses). Each group compares the plain function
+with LRU, ARC and thread-safe ARC caches of CACHE_SIZE entries.
+
+Run with: python -m benchmarks -k memoize
+"""
+import random
+
+from src import white_box as wb
+from src.memoize import memoize
+
+from .suite import benchmark
+
+SIZE = 10_000
+SEED = 0
+CACHE_SIZE = 256
+
+
+def _scores(rng):
+    return [rng.randint(0, 100) for _ in range(SIZE)]
+
+
+def _prices(rng):
+    catalog = [round(rng.lognormvariate(4, 1), 2) for _ in range(200)]
+    return [rng.choice(catalog) for _ in range(SIZE)]
+
+
+def _ages(rng):
+    return [rng.randint(0, 100) for _ in range(SIZE)]
+
+
+def _quantities(rng):
+    return [rng.randint(1, 30) for _ in range(SIZE)]
+
+
+def _file_sizes(rng):
+    return [int(rng.lognormvariate(11, 2)) for _ in range(SIZE)]
+
+
+def _unique_scores(rng):
+    return [rng.uniform(0, 100) for _ in range(SIZE)]
+
+
+# Function benchmarked and its inputs, by case
+CASES = {
+    "get_grade": ("get_grade", _scores),
+    "categorize_product": ("categorize_product", _prices),
+    "verify_age": ("verify_age", _ages),
+    "calculate_quantity_discount": ("calculate_quantity_discount", _quantities),
+    "check_file_size": ("check_file_size", _file_sizes),
+    "get_grade_misses": ("get_grade", _unique_scores),
+}
+
+VARIANTS = {
+    "plain": None,
+    "lru": {"policy": "lru"},
+    "arc": {"policy": "arc"},
+    "arc_locked": {"policy": "arc", "thread_safe": True},
+}
+
+
+def _register(case, variant):
+    """
+    Registers the benchmark of a function under a caching variant.
+    """
+    function_name, inputs = CASES[case]
+    options = VARIANTS[variant]
+
+    @benchmark(name=f"memoize.{case}.{variant}", items=SIZE, group=f"memoize {case}")
+    def setup():
+        func = getattr(wb, function_name)
+        if options is not None:
+            func = memoize(func, CACHE_SIZE, **options)
+        values = inputs(random.Random(SEED))
+        return lambda: [func(value) for value in values]
+
+
+for _case in CASES:
+    for _variant in VARIANTS:
+        _register(_case, _variant)
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the single-pass password validator against the original
+regex-based implementation.
+
+Run with: python -m benchmarks.bench_passwords
+"""
+import random
+import re
+import string
+import timeit
+from collections import Counter
+
+from src.white_box.validators import validate_password, validate_passwords
+
+
+def validate_password_regex(password):
+    """
+    Original implementation, scanning the password once per rule.
+    """
+    if len(password) < 8:
+        return False
+
+    if (
+        not re.search(r"[A-Z]", password)
+        or not re.search(r"[a-z]", password)
+        or not re.search(r"\d", password)
+        or not re.search(r"[!@#$%&]", password)
+    ):
+        return False
+
+    return True
+
+
+def make_passwords(count, seed=0):
+    """
+    Builds a mix of valid and invalid passwords of realistic lengths.
+    """
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits + "!@#$%&?-_"
+    return ["".join(rng.choices(alphabet, k=rng.randint(4, 24))) for _ in range(count)]
+
+
+def main(count=200_000, repeat=5):
+    """
+    Runs the benchmark and prints the best time of each implementation.
+    """
+    passwords = make_passwords(count)
+    assert [validate_password(p) for p in passwords] == [
+        validate_password_regex(p) for p in passwords
+    ]
+
+    cases = {
+        "regex": lambda: [validate_password_regex(p) for p in passwords],
+        "single-pass": lambda: [validate_password(p) for p in passwords],
+        "stream": lambda: list(validate_passwords(passwords)),
+        "stream+counts": lambda: list(validate_passwords(passwords, Counter())),
+    }
+    for name, case in cases.items():
+        best = min(timeit.repeat(case, number=1, repeat=repeat))
+        print(f"{name:>14}: {best:.3f}s ({count / best / 1e6:.2f}M passwords/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+"""
+Session store benchmarks: memory per session and multi-threaded throughput
+with different numbers of shards.
+
+Run with: python -m benchmarks.bench_sessions
+"""
+import random
+import threading
+import time
+import tracemalloc
+
+from src.sessions import SessionStore
+
+
+def memory_per_session(sessions=1_000_000):
+    """
+    Returns the bytes allocated per session, not counting the keys.
+    """
+    keys = [f"user{number}" for number in range(sessions)]
+    store = SessionStore()
+    tracemalloc.start()
+    for key in keys:
+        store.login(key)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated / sessions
+
+
+def throughput(shards, threads, operations=400_000, users=100_000):
+    """
+    Returns the login/lookup/logout operations per second of several threads
+    sharing a store.
+    """
+    store = SessionStore(shards=shards)
+
+    def worker(seed):
+        rng = random.Random(seed)
+        for _ in range(operations // threads // 3):
+            key = rng.randrange(users)
+            store.login(key)
+            store.is_active(key)
+            store.logout(key)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return operations / (time.perf_counter() - start)
+
+
+def main():
+    """
+    Prints the benchmark results.
+    """
+    print(f"memory: {memory_per_session():.0f} bytes/session")
+    for shards in (1, 16, 64):
+        for threads in (1, 4, 8):
+            rate = throughput(shards, threads)
+            print(f"{shards:>2} shards, {threads} threads: {rate:,.0f} ops/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+"""
+Throughput benchmark of the streaming URL validator over an access log.
+
+Run with: python -m benchmarks.bench_urls
+"""
+import os
+import random
+import tempfile
+import time
+from collections import Counter
+
+from src.white_box.validators import read_log_urls, validate_urls
+
+HOSTS = ["example.com", "api.example.org", "cdn-1.example.net", "10.0.0.1", "-bad"]
+SCHEMES = ["http://", "https://", "ftp://", ""]
+
+
+def write_log(path, lines, seed=0):
+    """
+    Writes an access log with one request URL per line, in the third field.
+    """
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as file:
+        for index in range(lines):
+            url = rng.choice(SCHEMES) + rng.choice(HOSTS)
+            url += "/" + "/".join(
+                str(rng.randrange(1000)) for _ in range(rng.randint(0, 6))
+            )
+            file.write(f"10.1.{index % 256}.{index % 200} GET {url} 200\n")
+
+
+def main(lines=1_000_000):
+    """
+    Runs the benchmark and prints the throughput of each way of reading.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "access.log")
+        write_log(path, lines)
+        megabytes = os.path.getsize(path) / 1e6
+
+        for use_mmap in (False, True):
+            for counts in (None, Counter()):
+                start = time.perf_counter()
+                urls = read_log_urls(path, field=2, use_mmap=use_mmap)
+                valid = sum(validate_urls(urls, counts))
+                elapsed = time.perf_counter() - start
+
+                name = ("mmap" if use_mmap else "lines") + (
+                    "+counts" if counts is not None else ""
+                )
+                print(
+                    f"{name:>12}: {elapsed:.3f}s ({megabytes / elapsed:.1f} MB/s, "
+                    f"{valid} of {lines} valid)"
+                )
+        print(f"failures: {dict(counts)}")
+
+
+if __name__ == "__main__":
+    main()
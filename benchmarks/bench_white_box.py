@@ -0,0 +1,580 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks of every public function and class of src.white_box, over
+seeded random inputs shaped like production traffic. Scalar functions are
+timed over a loop of SIZE inputs so that they can be compared per item with
+their batch variants.
+
+Run with: python -m benchmarks (see benchmarks/__main__.py)
+"""
+import asyncio
+import contextlib
+import io
+import os
+import random
+import string
+import tempfile
+from array import array
+
+import numpy as np
+
+from src import white_box as wb
+from src.events import NullSink
+
+from .bench_passwords import make_passwords
+from .bench_urls import write_log
+from .suite import benchmark
+
+SIZE = 10_000
+SEED = 0
+
+# pylint: disable=missing-function-docstring
+
+
+def _rng():
+    return random.Random(SEED)
+
+
+def _card_number(rng, valid):
+    """
+    Random 16-digit card number, with a correct Luhn checksum if valid.
+    """
+    digits = [rng.randrange(10) for _ in range(15)]
+    total = 0
+    for index, digit in enumerate(reversed(digits)):
+        doubled = digit * 2 if index % 2 == 0 else digit
+        total += doubled - 9 if doubled > 9 else doubled
+    check = (10 - total % 10) % 10
+    if not valid:
+        check = (check + rng.randrange(1, 10)) % 10
+    return "".join(map(str, digits)) + str(check)
+
+
+def _orders(rng, count):
+    return [
+        [
+            {"quantity": rng.randint(1, 20), "price": round(rng.uniform(1, 100), 2)}
+            for _ in range(rng.randint(1, 5))
+        ]
+        for _ in range(count)
+    ]
+
+
+# Arithmetic and classification
+
+
+@benchmark(items=SIZE)
+def is_even():
+    rng = _rng()
+    numbers = [rng.randint(-1000, 1000) for _ in range(SIZE)]
+    return lambda: [wb.is_even(number) for number in numbers]
+
+
+@benchmark(items=SIZE)
+def divide():
+    rng = _rng()
+    pairs = [
+        (rng.randint(-1000, 1000), rng.choice([0] + [*range(1, 10)]))
+        for _ in range(SIZE)
+    ]
+    return lambda: [wb.divide(a, b) for a, b in pairs]
+
+
+@benchmark(items=SIZE, group="grades")
+def get_grade():
+    rng = _rng()
+    scores = [rng.uniform(0, 100) for _ in range(SIZE)]
+    return lambda: [wb.get_grade(score) for score in scores]
+
+
+@benchmark(name="GRADES.lookup_many", items=SIZE, group="grades")
+def get_grade_batch():
+    rng = _rng()
+    scores = np.array([rng.uniform(0, 100) for _ in range(SIZE)])
+    return lambda: wb.GRADES.lookup_many(scores)
+
+
+@benchmark(items=SIZE)
+def is_triangle():
+    rng = _rng()
+    sides = [
+        (rng.randint(1, 20), rng.randint(1, 20), rng.randint(1, 20))
+        for _ in range(SIZE)
+    ]
+    return lambda: [wb.is_triangle(a, b, c) for a, b, c in sides]
+
+
+@benchmark(items=SIZE)
+def check_number_status():
+    rng = _rng()
+    numbers = [rng.randint(-1000, 1000) for _ in range(SIZE)]
+    return lambda: [wb.check_number_status(number) for number in numbers]
+
+
+@benchmark(items=SIZE)
+def verify_age():
+    rng = _rng()
+    ages = [rng.randint(0, 100) for _ in range(SIZE)]
+    return lambda: [wb.verify_age(age) for age in ages]
+
+
+@benchmark(items=SIZE)
+def categorize_product():
+    rng = _rng()
+    prices = [rng.lognormvariate(4, 1) for _ in range(SIZE)]
+    return lambda: [wb.categorize_product(price) for price in prices]
+
+
+@benchmark(items=SIZE)
+def check_flight_eligibility():
+    rng = _rng()
+    passengers = [(rng.randint(0, 90), rng.random() < 0.2) for _ in range(SIZE)]
+    return lambda: [wb.check_flight_eligibility(*passenger) for passenger in passengers]
+
+
+def _applicants():
+    rng = _rng()
+    return [(rng.lognormvariate(10.5, 0.6), rng.randint(300, 850)) for _ in range(SIZE)]
+
+
+@benchmark(items=SIZE, group="loans")
+def check_loan_eligibility():
+    applicants = _applicants()
+    return lambda: [wb.check_loan_eligibility(*applicant) for applicant in applicants]
+
+
+@benchmark(name="LOAN_RULES.decide_many", items=SIZE, group="loans")
+def loan_rules_decide_many():
+    columns = [np.array(column) for column in zip(*_applicants())]
+    return lambda: wb.LOAN_RULES.decide_many(*columns)
+
+
+@benchmark(items=SIZE)
+def grade_quiz():
+    rng = _rng()
+    quizzes = [(rng.randint(0, 10), rng.randint(0, 10)) for _ in range(SIZE)]
+    return lambda: [wb.grade_quiz(*quiz) for quiz in quizzes]
+
+
+@benchmark(items=SIZE)
+def get_weather_advisory():
+    rng = _rng()
+    readings = [(rng.gauss(20, 10), rng.uniform(0, 100)) for _ in range(SIZE)]
+    return lambda: [wb.get_weather_advisory(*reading) for reading in readings]
+
+
+# Passwords, logins and emails
+
+
+@benchmark(items=SIZE, group="passwords")
+def validate_password():
+    passwords = make_passwords(SIZE)
+    return lambda: [wb.validate_password(password) for password in passwords]
+
+
+@benchmark(items=SIZE, group="passwords")
+def password_failures():
+    passwords = make_passwords(SIZE)
+    return lambda: [wb.password_failures(password) for password in passwords]
+
+
+@benchmark(items=SIZE, group="passwords")
+def validate_passwords():
+    passwords = make_passwords(SIZE)
+    return lambda: list(wb.validate_passwords(passwords, {}))
+
+
+@benchmark(items=SIZE)
+def validate_login():
+    rng = _rng()
+    logins = [("u" * rng.randint(1, 25), "p" * rng.randint(1, 20)) for _ in range(SIZE)]
+    return lambda: [wb.validate_login(*login) for login in logins]
+
+
+@benchmark(items=SIZE)
+def authenticate_user():
+    rng = _rng()
+    attempts = [
+        (
+            ("admin", rng.choice(["admin123", "guess"]))
+            if rng.random() < 0.1
+            else ("u" * rng.randint(1, 10), "p" * rng.randint(1, 12))
+        )
+        for _ in range(SIZE)
+    ]
+    return lambda: [wb.authenticate_user(*attempt) for attempt in attempts]
+
+
+@benchmark(items=SIZE)
+def validate_email():
+    rng = _rng()
+    emails = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 30)))
+        + rng.choice(["@example.com", ".example.com", "@mail.org"])
+        for _ in range(SIZE)
+    ]
+    return lambda: [wb.validate_email(email) for email in emails]
+
+
+# Orders, discounts and shipping
+
+
+@benchmark(items=SIZE)
+def calculate_total_discount():
+    rng = _rng()
+    amounts = [rng.lognormvariate(5, 1) for _ in range(SIZE)]
+    return lambda: [wb.calculate_total_discount(amount) for amount in amounts]
+
+
+@benchmark(items=SIZE)
+def calculate_quantity_discount():
+    rng = _rng()
+    quantities = [rng.randint(1, 30) for _ in range(SIZE)]
+    return lambda: [wb.calculate_quantity_discount(quantity) for quantity in quantities]
+
+
+@benchmark(items=SIZE, group="orders")
+def calculate_order_total():
+    orders = _orders(_rng(), SIZE // 3)
+    return lambda: [wb.calculate_order_total(items) for items in orders]
+
+
+@benchmark(items=SIZE, group="orders")
+def calculate_order_totals():
+    rows = [
+        (order_id, item["quantity"], item["price"])
+        for order_id, items in enumerate(_orders(_rng(), SIZE // 3))
+        for item in items
+    ]
+    order_ids, quantities, prices = (np.array(column) for column in zip(*rows))
+    return lambda: wb.calculate_order_totals(order_ids, quantities, prices)
+
+
+@benchmark(items=SIZE)
+def calculate_items_shipping_cost():
+    rng = _rng()
+    shipments = [
+        (
+            [{"weight": rng.uniform(0.1, 4)} for _ in range(rng.randint(1, 4))],
+            rng.choice(["standard", "express"]),
+        )
+        for _ in range(SIZE)
+    ]
+    return lambda: [
+        wb.calculate_items_shipping_cost(*shipment) for shipment in shipments
+    ]
+
+
+@benchmark(items=SIZE, group="shipping")
+def calculate_shipping_cost():
+    rng = _rng()
+    packages = [
+        (
+            rng.uniform(0.1, 10),
+            rng.randint(1, 60),
+            rng.randint(1, 60),
+            rng.randint(1, 60),
+        )
+        for _ in range(SIZE)
+    ]
+    return lambda: [wb.calculate_shipping_cost(*package) for package in packages]
+
+
+@benchmark(name="SHIPPING_QUOTER.package_costs", items=SIZE, group="shipping")
+def calculate_shipping_costs():
+    rng = _rng()
+    columns = np.array(
+        [
+            (
+                rng.uniform(0.1, 10),
+                rng.randint(1, 60),
+                rng.randint(1, 60),
+                rng.randint(1, 60),
+            )
+            for _ in range(SIZE)
+        ]
+    ).T
+    return lambda: wb.SHIPPING_QUOTER.package_costs(*columns)
+
+
+# Temperatures, cards, dates, URLs and files
+
+
+@benchmark(items=SIZE, group="temperatures")
+def celsius_to_fahrenheit():
+    rng = _rng()
+    samples = [rng.gauss(20, 40) for _ in range(SIZE)]
+    return lambda: [wb.celsius_to_fahrenheit(sample) for sample in samples]
+
+
+@benchmark(items=SIZE, group="temperatures")
+def celsius_to_fahrenheit_many():
+    samples = array("d", (_rng().gauss(20, 40) for _ in range(SIZE)))
+    out = array("d", bytes(len(samples) * 8))
+    return lambda: wb.celsius_to_fahrenheit_many(samples, out)
+
+
+@benchmark(items=SIZE * 10, group="temperatures")
+def convert_celsius_file():
+    directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+    source = os.path.join(directory.name, "celsius.f32")
+    destination = os.path.join(directory.name, "fahrenheit.f32")
+    np.random.default_rng(SEED).normal(20, 40, SIZE * 10).astype(np.float32).tofile(
+        source
+    )
+
+    def convert():
+        wb.convert_celsius_file(source, destination, chunk_size=SIZE)
+        return directory  # Keeps the directory alive as long as the benchmark
+
+    return convert
+
+
+@benchmark(items=SIZE, group="cards")
+def validate_credit_card():
+    rng = _rng()
+    cards = [_card_number(rng, rng.random() < 0.8) for _ in range(SIZE)]
+    return lambda: [wb.validate_credit_card(card) for card in cards]
+
+
+@benchmark(items=SIZE, group="cards")
+def validate_credit_cards():
+    rng = _rng()
+    cards = np.array([_card_number(rng, rng.random() < 0.8) for _ in range(SIZE)])
+    return lambda: wb.validate_credit_cards(cards)
+
+
+def _dates(rng):
+    return [
+        (rng.randint(1890, 2110), rng.randint(0, 13), rng.randint(0, 32))
+        for _ in range(SIZE)
+    ]
+
+
+@benchmark(items=SIZE, group="dates")
+def validate_date():
+    dates = _dates(_rng())
+    return lambda: [wb.validate_date(*date) for date in dates]
+
+
+@benchmark(items=SIZE, group="dates")
+def validate_dates():
+    years, months, days = (np.array(column) for column in zip(*_dates(_rng())))
+    return lambda: wb.validate_dates(years, months, days)
+
+
+@benchmark(items=SIZE, group="dates", covers=("parse_iso_dates",))
+def validate_iso_dates():
+    dates = np.array([f"{y:04d}-{m:02d}-{d:02d}" for y, m, d in _dates(_rng())])
+    return lambda: wb.validate_iso_dates(dates)
+
+
+def _urls(rng):
+    return [
+        rng.choice(["http://", "https://", "ftp://", ""])
+        + rng.choice(["example.com", "api.example.org", "10.0.0.1", "-bad"])
+        + "/" * rng.randint(0, 1)
+        + "a" * rng.choice([0, 10, 300])
+        for _ in range(SIZE)
+    ]
+
+
+@benchmark(items=SIZE, group="urls")
+def validate_url():
+    urls = _urls(_rng())
+    return lambda: [wb.validate_url(url) for url in urls]
+
+
+@benchmark(items=SIZE, group="urls")
+def url_failure():
+    urls = _urls(_rng())
+    return lambda: [wb.url_failure(url) for url in urls]
+
+
+@benchmark(items=SIZE, group="urls")
+def validate_urls():
+    urls = _urls(_rng())
+    return lambda: list(wb.validate_urls(urls, {}))
+
+
+@benchmark(items=SIZE, group="urls")
+def read_log_urls():
+    directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+    path = os.path.join(directory.name, "access.log")
+    write_log(path, SIZE, SEED)
+
+    def read():
+        list(wb.read_log_urls(path, field=2))
+        return directory
+
+    return read
+
+
+@benchmark(items=SIZE, group="file sizes")
+def check_file_size():
+    sizes = [int(_rng().lognormvariate(11, 2)) for _ in range(SIZE)]
+    return lambda: [wb.check_file_size(size) for size in sizes]
+
+
+@benchmark(items=SIZE, group="file sizes")
+def check_file_sizes():
+    sizes = np.array([int(_rng().lognormvariate(11, 2)) for _ in range(SIZE)])
+    return lambda: wb.check_file_sizes(sizes)
+
+
+# State machines
+
+
+def _events(machine, events):
+    rng = _rng()
+    methods = [getattr(machine, event) for event in events]
+    return [rng.choice(methods) for _ in range(SIZE)]
+
+
+@benchmark(items=SIZE)
+def VendingMachine():  # pylint: disable=invalid-name
+    calls = _events(wb.VendingMachine(), ["insert_coin", "select_drink"])
+    return lambda: [call() for call in calls]
+
+
+@benchmark(items=SIZE)
+def TrafficLight():  # pylint: disable=invalid-name
+    light = wb.TrafficLight()
+    calls = _events(light, ["change_state", "get_current_state"])
+    return lambda: [call() for call in calls]
+
+
+@benchmark(items=SIZE)
+def UserAuthentication():  # pylint: disable=invalid-name
+    calls = _events(wb.UserAuthentication("alice"), ["login", "logout"])
+    return lambda: [call() for call in calls]
+
+
+@benchmark(items=SIZE)
+def DocumentEditingSystem():  # pylint: disable=invalid-name
+    calls = _events(wb.DocumentEditingSystem(), ["edit_document", "save_document"])
+    return lambda: [call() for call in calls]
+
+
+@benchmark(items=SIZE)
+def ElevatorSystem():  # pylint: disable=invalid-name
+    calls = _events(wb.ElevatorSystem(), ["move_up", "move_down", "stop"])
+    return lambda: [call() for call in calls]
+
+
+# Banking and shopping
+
+
+def _bank(accounts=100):
+    bank = wb.BankingSystem(sink=NullSink())
+    names = [f"acc{index}" for index in range(accounts)]
+    for name in names:
+        bank.open_account(name, 10**9)
+        bank.logged_in_users.add(name)
+    return bank, names
+
+
+def _transfers(names):
+    rng = _rng()
+    return [
+        (*rng.sample(names, 2), rng.randint(1, 200), rng.choice(list(wb.TRANSFER_FEES)))
+        for _ in range(SIZE)
+    ]
+
+
+@benchmark(items=SIZE)
+def BankAccount():  # pylint: disable=invalid-name
+    account = wb.BankAccount("acc", 1000, NullSink())
+    return lambda: [account.view_account() for _ in range(SIZE)]
+
+
+@benchmark(items=SIZE)
+def lock_accounts():
+    sink = NullSink()
+    accounts = [wb.BankAccount(f"acc{index}", 0, sink) for index in range(100)]
+    rng = _rng()
+    pairs = [rng.sample(accounts, 2) for _ in range(SIZE)]
+
+    def lock():
+        for pair in pairs:
+            with wb.lock_accounts(*pair):
+                pass
+
+    return lock
+
+
+@benchmark(name="BankingSystem.authenticate", items=SIZE)
+def authenticate():
+    bank = wb.BankingSystem(sink=NullSink())
+    rng = _rng()
+    attempts = [("user123", rng.choice(["pass123", "wrong"])) for _ in range(SIZE)]
+
+    def login():
+        for attempt in attempts:
+            bank.authenticate(*attempt)
+            bank.logged_in_users.discard("user123")
+
+    return login
+
+
+@benchmark(
+    name="BankingSystem.transfer_money",
+    items=SIZE,
+    group="transfers",
+    covers=("BankingSystem",),
+)
+def transfer_money():
+    bank, names = _bank()
+    transfers = _transfers(names)
+    return lambda: [bank.transfer_money(*transfer) for transfer in transfers]
+
+
+@benchmark(name="BankingSystem.settle_transfers", items=SIZE, group="transfers")
+def settle_transfers():
+    bank, names = _bank()
+    transfers = _transfers(names)
+    return lambda: bank.settle_transfers(transfers)
+
+
+@benchmark(name="BankingSystem.authenticate_async", items=100)
+def authenticate_async():
+    bank = wb.BankingSystem(sink=NullSink())
+
+    async def login():
+        for _ in range(100):
+            await bank.authenticate_async("user123", "pass123")
+            bank.logged_in_users.discard("user123")
+
+    return lambda: asyncio.run(login())
+
+
+@benchmark(items=SIZE)
+def Product():  # pylint: disable=invalid-name
+    products = [wb.Product(f"product{index}", index) for index in range(SIZE)]
+
+    def view():
+        with contextlib.redirect_stdout(io.StringIO()):
+            for product in products:
+                product.view_product()
+
+    return view
+
+
+@benchmark(items=SIZE)
+def ShoppingCart():  # pylint: disable=invalid-name
+    rng = _rng()
+    products = [wb.Product(f"product{index}", index + 0.99) for index in range(100)]
+    operations = [(rng.random() < 0.7, rng.choice(products)) for _ in range(SIZE)]
+
+    def shop():
+        cart = wb.ShoppingCart(sink=NullSink())
+        for add, product in operations:
+            if add:
+                cart.add_product(product, 2)
+            else:
+                cart.remove_product(product)
+        cart.view_cart()
+        cart.checkout()
+
+    return shop
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark registry, timer and JSON baselines.
+
+Benchmarks are registered with the benchmark decorator on a setup function
+that prepares the inputs and returns the callable to time. Each benchmark
+processes a number of items per call, so scalar loops and batch variants of
+the same group can be compared per item.
+"""
+import inspect
+import json
+import os
+import platform
+import sys
+import timeit
+from collections import namedtuple
+
+import numpy as np
+
+from src.instrumentation import public_definitions
+
+Benchmark = namedtuple("Benchmark", ["name", "setup", "items", "group", "covers"])
+
+Regression = namedtuple("Regression", ["name", "baseline", "current", "change"])
+
+BENCHMARKS = {}
+
+
+def benchmark(name=None, items=1, group=None, covers=()):
+    """
+    Registers the decorated setup function as a benchmark. covers names the
+    public functions and classes it exercises besides the one it is named
+    after.
+    """
+
+    def register(setup):
+        key = setup.__name__ if name is None else name
+        if key in BENCHMARKS:
+            raise ValueError(f"Benchmark {key} is already registered")
+
+        BENCHMARKS[key] = Benchmark(key, setup, items, group, (key, *covers))
+        return setup
+
+    return register
+
+
+def time_callable(func, repeat=5, min_time=0.02):
+    """
+    Returns the best time of a call, in seconds, out of repeat runs of enough
+    calls to last at least min_time.
+    """
+    number = 1
+    while True:
+        elapsed = timeit.timeit(func, number=number)
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+
+    times = timeit.repeat(func, number=number, repeat=max(repeat - 1, 0))
+    return min([elapsed, *times]) / number
+
+
+def run(names=None, repeat=5, min_time=0.02, report=None):
+    """
+    Runs the registered benchmarks, or the given ones, and returns their
+    results by name. report, if given, is called with each name and result.
+    """
+    results = {}
+    for name in BENCHMARKS if names is None else names:
+        bench = BENCHMARKS[name]
+        seconds = time_callable(bench.setup(), repeat, min_time)
+        results[name] = {
+            "seconds": seconds,
+            "items": bench.items,
+            "per_item": seconds / bench.items,
+            "group": bench.group,
+        }
+        if report is not None:
+            report(name, results[name])
+    return results
+
+
+def compare(results, baseline, threshold=0.25):
+    """
+    Returns the benchmarks whose time per call grew by more than threshold
+    (a fraction) over the baseline results, worst first. Benchmarks missing
+    from either side are skipped.
+    """
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+
+        change = result["seconds"] / previous["seconds"] - 1
+        if change > threshold:
+            regressions.append(
+                Regression(name, previous["seconds"], result["seconds"], change)
+            )
+    return sorted(regressions, key=lambda regression: -regression.change)
+
+
+def uncovered(module):
+    """
+    Returns the public functions and classes defined in a module that no
+    registered benchmark covers.
+    """
+    covered = {name for bench in BENCHMARKS.values() for name in bench.covers}
+    return [
+        name
+        for name, value in public_definitions(module).items()
+        if (inspect.isfunction(value) or inspect.isclass(value)) and name not in covered
+    ]
+
+
+def environment():
+    """
+    Describes the machine the benchmarks ran on, stored with the baselines
+    since they are only comparable on the same machine.
+    """
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def save_baseline(path, results):
+    """
+    Writes results to a JSON baseline file.
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"environment": environment(), "results": results}, file, indent=2)
+        file.write("\n")
+
+
+def load_baseline(path):
+    """
+    Reads the results of a JSON baseline file. Warns on stderr if it was
+    recorded in another environment.
+    """
+    with open(path, encoding="utf-8") as file:
+        baseline = json.load(file)
+
+    if baseline.get("environment") != environment():
+        print(f"warning: {path} was recorded in another environment", file=sys.stderr)
+    return baseline["results"]
+
+
+def format_result(name, result):
+    """
+    Formats one result as a line of the report.
+    """
+    per_item = result["per_item"] * 1e9
+    return f"{name:<40} {result['seconds'] * 1e3:>10.3f} ms {per_item:>12.1f} ns/item"
+
+
+def format_groups(results):
+    """
+    Formats the benchmarks of each group side by side, with their speedup
+    over the first one of the group (the scalar variant).
+    """
+    groups = {}
+    for name, result in results.items():
+        if result["group"] is not None:
+            groups.setdefault(result["group"], []).append((name, result))
+
+    lines = []
+    for group, members in groups.items():
+        lines.append(f"[{group}]")
+        reference = members[0][1]["per_item"]
+        for name, result in members:
+            speedup = reference / result["per_item"]
+            lines.append(
+                f"  {name:<38} {result['per_item'] * 1e9:>12.1f} ns/item"
+                f" {speedup:>8.1f}x"
+            )
+    return lines
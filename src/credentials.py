@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+"""
+Salted password hashes with off-thread verification.
+"""
+import asyncio
+import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+ALGORITHMS = ("pbkdf2_sha256", "scrypt")
+DEFAULT_COSTS = {"pbkdf2_sha256": 600_000, "scrypt": 2**14}
+
+
+def hash_password(password, salt, algorithm, cost):
+    """
+    Returns the hash of a password. cost is the number of iterations for
+    PBKDF2 and the CPU/memory cost parameter n for scrypt. Module-level so
+    it can run on a process pool.
+    """
+    if algorithm == "pbkdf2_sha256":
+        return hashlib.pbkdf2_hmac("sha256", password.encode(), salt, cost)
+    if algorithm == "scrypt":
+        return hashlib.scrypt(password.encode(), salt=salt, n=cost, r=8, p=1)
+    raise ValueError(f"Unknown password hashing algorithm: {algorithm!r}")
+
+
+class CredentialStore:  # pylint: disable=too-many-instance-attributes
+    """
+    Store of salted password hashes.
+
+    Hashing is deliberately slow, so verification can be offloaded to a
+    bounded thread pool (or any executor, e.g. a process pool) through
+    authenticate_async. Successful verifications are cached for cache_ttl
+    seconds as a keyed digest of the password, so users that authenticate
+    repeatedly skip the expensive hash.
+    """
+
+    def __init__(
+        self,
+        algorithm="pbkdf2_sha256",
+        cost=None,
+        executor=None,
+        max_workers=4,
+        cache_ttl=30.0,
+        cache_size=10000,
+        clock=time.monotonic,
+    ):  # pylint: disable=too-many-arguments
+        """
+        Sets the hashing parameters, the executor and the cache settings.
+        """
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown password hashing algorithm: {algorithm!r}")
+
+        self.algorithm = algorithm
+        self.cost = DEFAULT_COSTS[algorithm] if cost is None else cost
+        self.max_workers = max_workers
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.clock = clock
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._executor_lock = threading.Lock()
+        self._records = {}  # username -> (salt, hash, algorithm, cost)
+        self._cache = OrderedDict()  # username -> (expiry, password digest)
+        self._cache_lock = threading.Lock()
+        self._cache_key = os.urandom(32)
+        # Hashed against for unknown users, so that they cost as much as
+        # known ones and the response time doesn't reveal which exist
+        self._dummy_record = (os.urandom(16), os.urandom(32), algorithm, self.cost)
+
+    @classmethod
+    def from_plaintext(cls, users, **options):
+        """
+        Builds a store from a dict of usernames and plaintext passwords.
+        """
+        store = cls(**options)
+        for username, password in users.items():
+            store.set_password(username, password)
+        return store
+
+    @property
+    def executor(self):
+        """
+        Executor running the verifications, created on first use.
+        """
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(self.max_workers)
+        return self._executor
+
+    def __contains__(self, username):
+        """
+        Whether the store has credentials for the user.
+        """
+        return username in self._records
+
+    def set_password(self, username, password):
+        """
+        Stores the salted hash of a user's password.
+        """
+        salt = os.urandom(16)
+        digest = hash_password(password, salt, self.algorithm, self.cost)
+        self._records[username] = (salt, digest, self.algorithm, self.cost)
+        with self._cache_lock:
+            self._cache.pop(username, None)
+
+    def remove(self, username):
+        """
+        Removes a user's credentials.
+        """
+        self._records.pop(username, None)
+        with self._cache_lock:
+            self._cache.pop(username, None)
+
+    def verify(self, username, password):
+        """
+        Checks a user's password, hashing it in the calling thread unless a
+        recent successful verification is cached. Unknown users are hashed
+        against a dummy record, which never matches.
+        """
+        record = self._records.get(username, self._dummy_record)
+        if self._cached(username, password):
+            return True
+
+        salt, _, algorithm, cost = record
+        digest = hash_password(password, salt, algorithm, cost)
+        return self._check(username, password, digest, record)
+
+    async def authenticate_async(self, username, password):
+        """
+        Checks a user's password, hashing it on the executor so the event
+        loop is not blocked. Unknown users are hashed like in verify.
+        """
+        record = self._records.get(username, self._dummy_record)
+        if self._cached(username, password):
+            return True
+
+        salt, _, algorithm, cost = record
+        digest = await asyncio.get_running_loop().run_in_executor(
+            self.executor, hash_password, password, salt, algorithm, cost
+        )
+        return self._check(username, password, digest, record)
+
+    def close(self):
+        """
+        Shuts down the executor if the store created it.
+        """
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+
+    def _password_digest(self, password):
+        """
+        Fast keyed digest of a password, used as the cache entry.
+        """
+        return hmac.new(self._cache_key, password.encode(), hashlib.sha256).digest()
+
+    def _cached(self, username, password):
+        """
+        Whether a successful verification of this password is cached.
+        """
+        entry = self._cache.get(username)
+        if entry is None:
+            return False
+
+        expiry, digest = entry
+        if expiry <= self.clock():
+            with self._cache_lock:
+                self._cache.pop(username, None)
+            return False
+        return hmac.compare_digest(digest, self._password_digest(password))
+
+    def _check(self, username, password, digest, record):
+        """
+        Compares a computed hash with the one of the record it was computed
+        for and caches a success.
+        """
+        if not hmac.compare_digest(digest, record[1]):
+            return False
+        if self._records.get(username) is not record:
+            return False  # The password changed while it was being hashed
+
+        if self.cache_ttl > 0:
+            entry = (self.clock() + self.cache_ttl, self._password_digest(password))
+            with self._cache_lock:
+                self._cache[username] = entry
+                self._cache.move_to_end(username)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return True
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+
+"""
+Decision-table engine for multi-condition rules.
+"""
+import itertools
+import keyword
+import math
+
+import numpy as np
+
+_CLOSURES = ("left", "right", "both", "neither")
+_HIT_POLICIES = ("first", "unique")
+
+
+class DecisionTable:
+    """
+    Maps a few inputs to a result through a declared list of rules.
+
+    Each rule is a (conditions, result) pair, where conditions maps input
+    names to a (low, high) range, optionally followed by which ends of the
+    range are closed as in IntervalTable ("left" by default), or to True or
+    False for an input tested for truthiness. None bounds are unbounded and
+    inputs without a condition match anything. The first rule whose
+    conditions all hold gives the result, or the default if none does.
+
+    The rules are compiled into a Python function for scalar calls (decide)
+    and evaluated as NumPy masks for columns (decide_many). When the table is
+    built, the input space is split into the cells delimited by the rule
+    bounds, and every rule is checked against every cell: rules that never
+    decide a cell are unreachable and rejected, and pairs of rules that match
+    a cell together with different results are recorded in overlaps. With
+    the "unique" hit policy, overlaps are rejected too.
+    """
+
+    def __init__(
+        self, inputs, rules, default=None, hit_policy="first", max_cells=1_000_000
+    ):
+        """
+        Validates and compiles the rules. The analysis is skipped, leaving
+        overlaps as None, if the input space has more than max_cells cells.
+        """
+        for name in inputs:
+            if not name.isidentifier() or keyword.iskeyword(name):
+                raise ValueError(f"Invalid input name: {name!r}")
+        if len(set(inputs)) != len(inputs):
+            raise ValueError("Input names must be unique")
+        if hit_policy not in _HIT_POLICIES:
+            raise ValueError(f"Unknown hit policy: {hit_policy!r}")
+
+        self.inputs = list(inputs)
+        self.rules = [
+            self._normalize(conditions, result) for conditions, result in rules
+        ]
+        self.default = default
+        self.hit_policy = hit_policy
+        self.source, self.decide = self._compile()
+        self.overlaps = self._analyze(max_cells)
+
+    def _normalize(self, conditions, result):
+        """
+        Converts the conditions of a rule to a tuple of (input index, low,
+        high, closed) ranges, or (input index, truth) tests.
+        """
+        normalized = []
+        for name, condition in conditions.items():
+            if name not in self.inputs:
+                raise ValueError(f"Unknown input {name!r} in rule for {result!r}")
+
+            index = self.inputs.index(name)
+            if isinstance(condition, bool):
+                normalized.append((index, condition))
+                continue
+
+            low, high, *closed = condition
+            closed = closed[0] if closed else "left"
+            if closed not in _CLOSURES:
+                raise ValueError(f"Invalid range closure: {closed!r}")
+            if low is not None and high is not None and low > high:
+                raise ValueError(f"Empty range for {name!r} in rule for {result!r}")
+            normalized.append((index, low, high, closed))
+
+        return tuple(sorted(normalized)), result
+
+    def _condition_source(self, namespace, suffix, condition):
+        """
+        Returns the source of the test for one condition, binding its bounds
+        in the namespace with the given suffix, or None if it always holds.
+        """
+        input_name = self.inputs[condition[0]]
+        if len(condition) == 2:
+            return input_name if condition[1] else f"not {input_name}"
+
+        _, low, high, closed = condition
+        test = input_name
+        if low is not None:
+            namespace[f"_low{suffix}"] = low
+            operator = "<=" if closed in ("left", "both") else "<"
+            test = f"_low{suffix} {operator} {test}"
+        if high is not None:
+            namespace[f"_high{suffix}"] = high
+            operator = "<=" if closed in ("right", "both") else "<"
+            test = f"{test} {operator} _high{suffix}"
+        return None if test == input_name else test
+
+    def _compile(self, name="decide"):
+        """
+        Generates the source of the scalar function, an if-chain with the
+        bounds and results bound as globals, and compiles it.
+        """
+        namespace = {"_default": self.default}
+        lines = [f"def {name}({', '.join(self.inputs)}):"]
+        for number, (conditions, result) in enumerate(self.rules):
+            tests = []
+            for position, condition in enumerate(conditions):
+                test = self._condition_source(
+                    namespace, f"{number}_{position}", condition
+                )
+                if test is not None:
+                    tests.append(test)
+
+            namespace[f"_result{number}"] = result
+            lines.append(f"    if {' and '.join(tests) or 'True'}:")
+            lines.append(f"        return _result{number}")
+        lines.append("    return _default")
+
+        source = "\n".join(lines) + "\n"
+        code = compile(source, "<decision table>", "exec")
+        exec(code, namespace)  # pylint: disable=exec-used
+        return source, namespace[name]
+
+    def function(self, name, doc=None, module=None):
+        """
+        Builds a standalone function deciding scalar inputs, taking them as
+        arguments named after the inputs, to be bound as a module function.
+        """
+        _, func = self._compile(name)
+        func.__doc__ = doc
+        if module is not None:
+            func.__module__ = module
+        return func
+
+    def rule_masks(self, *columns):
+        """
+        Returns one boolean mask per rule, telling which rows of the input
+        columns match its conditions.
+        """
+        if len(columns) != len(self.inputs):
+            raise ValueError(f"Expected {len(self.inputs)} input columns")
+
+        columns = [np.asarray(column) for column in columns]
+        shape = np.broadcast_shapes(*(column.shape for column in columns))
+        masks = []
+        for conditions, _ in self.rules:
+            mask = np.ones(shape, dtype=bool)
+            for condition in conditions:
+                column = columns[condition[0]]
+                if len(condition) == 2:
+                    truth = column.astype(bool)
+                    mask &= truth if condition[1] else ~truth
+                    continue
+
+                _, low, high, closed = condition
+                if low is not None:
+                    if closed in ("left", "both"):
+                        mask &= column >= low
+                    else:
+                        mask &= column > low
+                if high is not None:
+                    if closed in ("right", "both"):
+                        mask &= column <= high
+                    else:
+                        mask &= column < high
+            masks.append(mask)
+        return masks
+
+    def decide_many(self, *columns):
+        """
+        Returns the result for every row of the input columns.
+        """
+        masks = self.rule_masks(*columns)
+        results = [result for _, result in self.rules]
+        if not masks:
+            shape = np.broadcast_shapes(*(np.shape(column) for column in columns))
+            return np.full(shape, self.default)
+        return np.select(masks, results, default=self.default)
+
+    def _analyze(self, max_cells):
+        """
+        Evaluates the rules on one point of every cell of the input space,
+        rejecting unreachable rules, and returns the overlapping rule pairs.
+        """
+        if not self.rules:
+            return []
+
+        points = [_cell_points(self.rules, index) for index in range(len(self.inputs))]
+        if math.prod(len(axis) for axis in points) > max_cells:
+            return None
+
+        grid = np.meshgrid(*points, indexing="ij")
+        masks = self.rule_masks(*(axis.ravel() for axis in grid))
+
+        decided = np.zeros(masks[0].shape, dtype=bool)
+        for (_, result), mask in zip(self.rules, masks):
+            if not np.any(mask & ~decided):
+                raise ValueError(f"Rule for {result!r} is unreachable")
+            decided |= mask
+
+        overlaps = []
+        for (first, (_, result)), (second, (_, other)) in itertools.combinations(
+            enumerate(self.rules), 2
+        ):
+            if result != other and np.any(masks[first] & masks[second]):
+                overlaps.append((first, second))
+        if overlaps and self.hit_policy == "unique":
+            first, second = overlaps[0]
+            raise ValueError(
+                f"Rules for {self.rules[first][1]!r} and "
+                f"{self.rules[second][1]!r} overlap"
+            )
+        return overlaps
+
+
+def _cell_points(rules, index):
+    """
+    Returns one point in every cell the rule bounds split an input into:
+    each bound, and a point between consecutive bounds and beyond the ends.
+    """
+    bounds = set()
+    truth = False
+    for conditions, _ in rules:
+        for condition in conditions:
+            if condition[0] != index:
+                continue
+            if len(condition) == 2:
+                truth = True
+            else:
+                bounds.update(bound for bound in condition[1:3] if bound is not None)
+
+    if truth:
+        if bounds:
+            raise ValueError("An input cannot have both range and truth conditions")
+        return np.array([False, True])
+
+    bounds = sorted(bounds)
+    points = []
+    for low, high in zip([-math.inf, *bounds], [*bounds, math.inf]):
+        middle = _between(low, high)
+        if middle is not None:
+            points.append(middle)
+        if high in bounds:
+            points.append(high)
+    return np.array(points, dtype=np.float64)
+
+
+def _between(low, high):
+    """
+    Returns a number strictly between two numbers, or None if there is none.
+    """
+    if math.isinf(low) and math.isinf(high):
+        middle = 0.0 if low < high else math.nan
+    elif math.isinf(low):
+        middle = high - max(1.0, abs(high))
+    elif math.isinf(high):
+        middle = low + max(1.0, abs(low))
+    else:
+        middle = low / 2 + high / 2
+    return middle if low < middle < high else None
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+
+"""
+Discrete-event simulation of elevator banks built on ElevatorSystem.
+"""
+import heapq
+import itertools
+from collections import deque
+
+import numpy as np
+
+from .white_box.fsm import ElevatorSystem
+
+# Event kinds. Simultaneous events are handled in the order they were
+# scheduled, and hall calls after the events due at the same time.
+_ARRIVE, _DEPART, _CALL = range(3)
+
+# What a car is doing with its current call
+_PICKUP, _DELIVER = range(2)
+
+
+class Car:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    """
+    One elevator car of a simulated bank.
+    """
+
+    __slots__ = (
+        "index",
+        "elevator",
+        "floor",
+        "target",
+        "calls",
+        "call",
+        "phase",
+        "idle",
+    )
+
+    def __init__(self, index, floor=0):
+        """
+        Places an idle car at the given floor.
+        """
+        self.index = index
+        self.elevator = ElevatorSystem()
+        self.floor = floor
+        self.target = floor
+        self.calls = deque()  # Calls assigned to the car and not started yet
+        self.call = None  # Call being served, as a (time, origin, destination)
+        self.phase = None
+        self.idle = True  # False from the start of a call to the last drop-off
+
+    def last_floor(self):
+        """
+        Floor the car will be at after serving every assigned call.
+        """
+        if self.calls:
+            return self.calls[-1][2]
+        if self.call is not None:
+            return self.call[2]
+        return self.floor
+
+
+def nearest_car(cars, call):
+    """
+    Dispatch policy sending each call to the car with the fewest pending calls,
+    breaking ties by the distance from where that car will end up.
+    """
+    origin = call[1]
+    best, best_key = None, None
+    for car in cars:
+        key = (len(car.calls) + (not car.idle), abs(car.last_floor() - origin))
+        if best_key is None or key < best_key:
+            best, best_key = car, key
+    return best
+
+
+def round_robin():
+    """
+    Returns a dispatch policy assigning calls to the cars in turn.
+    """
+    turns = itertools.count()
+
+    def dispatch(cars, call):  # pylint: disable=unused-argument
+        return cars[next(turns) % len(cars)]
+
+    return dispatch
+
+
+class SimulationReport:
+    """
+    Results of a simulation run.
+    """
+
+    def __init__(self, waits, trips, events, end_time):
+        """
+        Stores the wait times (hall call to pickup) and trip times (hall call
+        to arrival) of the served calls.
+        """
+        self.waits = np.asarray(waits, dtype=np.float64)
+        self.trips = np.asarray(trips, dtype=np.float64)
+        self.events = events
+        self.end_time = end_time
+
+    @property
+    def served(self):
+        """
+        Number of calls served.
+        """
+        return len(self.trips)
+
+    def wait_percentiles(self, percentiles=(50, 90, 99)):
+        """
+        Returns a dict with the given percentiles of the wait times.
+        """
+        if not self.waits.size:
+            return {p: 0.0 for p in percentiles}
+        values = np.percentile(self.waits, percentiles)
+        return dict(zip(percentiles, values.tolist()))
+
+
+class ElevatorSimulation:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    """
+    Heap-based discrete-event simulator of a bank of elevators.
+
+    Hall calls are (time, origin floor, destination floor) tuples. The
+    dispatch policy is called with the cars and every new call and returns
+    the car to assign it to; each car serves its calls in order, travelling
+    floor_time per floor and stopping stop_time at every pickup and drop-off.
+    """
+
+    def __init__(
+        self, cars=1, floors=10, dispatch=nearest_car, floor_time=1.0, stop_time=5.0
+    ):
+        """
+        Sets up an idle bank of cars at the ground floor.
+        """
+        self.floors = floors
+        self.cars = [Car(index) for index in range(cars)]
+        self.dispatch = dispatch
+        self.floor_time = floor_time
+        self.stop_time = stop_time
+        self.now = 0.0
+        self._events = []
+        self._sequence = itertools.count()
+
+    def run(self, calls, until=None):
+        """
+        Simulates the given hall calls, which must be sorted by time, until
+        every call is served (or the until time is reached).
+        """
+        # The loop is the hot path: attribute lookups and helper calls are
+        # hoisted into locals and scheduling and event handling are inlined.
+        # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+        events, push, pop = self._events, heapq.heappush, heapq.heappop
+        sequence, cars, dispatch = self._sequence, self.cars, self.dispatch
+        floor_time, stop_time = self.floor_time, self.stop_time
+        waits, trips = [], []
+        handled, now = 0, self.now
+        calls = iter(calls)
+        next_call = next(calls, None)
+
+        while events or next_call is not None:
+            if next_call is not None and (not events or next_call[0] < events[0][0]):
+                time, kind, car = next_call[0], _CALL, None
+            else:
+                event = pop(events)
+                time, _, kind, car = event
+
+            if until is not None and time > until:
+                if kind != _CALL:
+                    push(events, event)  # Keeps its place among simultaneous events
+                now = max(now, until)
+                break
+
+            now = time
+            handled += 1
+
+            if kind == _CALL:
+                call, next_call = next_call, next(calls, None)
+                self._check_call(call)
+                car = dispatch(cars, call)
+                car.calls.append(call)
+                if not car.idle:
+                    continue
+                floor = self._start_next_call(car)
+
+            elif kind == _ARRIVE:
+                car.elevator.stop()  # Has no effect if the car did not move
+                car.floor = car.target
+                if car.phase == _PICKUP:
+                    waits.append(time - car.call[0])
+                    car.phase = _DELIVER
+                else:
+                    trips.append(time - car.call[0])
+                    car.call = car.phase = None
+                push(events, (time + stop_time, next(sequence), _DEPART, car))
+                continue
+
+            elif car.call is not None:  # Departing with a passenger
+                floor = car.call[2]
+            else:
+                floor = self._start_next_call(car)
+                if floor is None:
+                    continue
+
+            # Start moving the car to the floor
+            car.target = floor
+            if floor > car.floor:
+                car.elevator.move_up()
+                travel = (floor - car.floor) * floor_time
+            elif floor < car.floor:
+                car.elevator.move_down()
+                travel = (car.floor - floor) * floor_time
+            else:
+                travel = 0.0
+            push(events, (time + travel, next(sequence), _ARRIVE, car))
+
+        self.now = now
+        return SimulationReport(waits, trips, handled, now)
+
+    def _check_call(self, call):
+        """
+        Validates the floors of a hall call.
+        """
+        _, origin, destination = call
+        if not (0 <= origin < self.floors and 0 <= destination < self.floors):
+            raise ValueError(f"Invalid floors in call {call!r}")
+
+    @staticmethod
+    def _start_next_call(car):
+        """
+        Assigns a car its next call and returns the floor to pick it up at,
+        or leaves the car idle and returns None if there is no call.
+        """
+        car.idle = not car.calls
+        if car.idle:
+            return None
+
+        car.call = car.calls.popleft()
+        car.phase = _PICKUP
+        return car.call[1]
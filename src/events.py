@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+
+"""
+Pluggable sinks for the messages emitted by the banking and cart classes.
+
+Every sink has an emit(name, message, /, **fields) method receiving the event
+name, its human-readable message and the structured fields behind it.
+"""
+import queue
+import sys
+import threading
+from collections import namedtuple
+
+Event = namedtuple("Event", ["name", "message", "fields"])
+
+
+class EventSink:
+    """
+    Base event sink.
+    """
+
+    def emit(self, name, message, /, **fields):
+        """
+        Handles an event.
+        """
+        raise NotImplementedError
+
+    def flush(self):
+        """
+        Writes out any pending events.
+        """
+
+    def close(self):
+        """
+        Flushes the sink and releases its resources.
+        """
+        self.flush()
+
+
+class PrintSink(EventSink):
+    """
+    Prints every message as soon as it is emitted. This is the default sink.
+    """
+
+    def emit(self, name, message, /, **fields):
+        """
+        Prints the event message.
+        """
+        print(message)
+
+
+class NullSink(EventSink):
+    """
+    Discards every event, e.g. for benchmarks.
+    """
+
+    def emit(self, name, message, /, **fields):
+        """
+        Ignores the event.
+        """
+
+
+class MemorySink(EventSink):
+    """
+    Keeps every event in a list, e.g. for tests.
+    """
+
+    def __init__(self):
+        """
+        Starts with no events.
+        """
+        self.events = []
+
+    def emit(self, name, message, /, **fields):
+        """
+        Records the event.
+        """
+        self.events.append(Event(name, message, fields))
+
+    @property
+    def messages(self):
+        """
+        Messages of the recorded events.
+        """
+        return [event.message for event in self.events]
+
+
+class BufferedSink(EventSink):
+    """
+    Buffers messages and writes them to a stream in batches, with a single
+    write call per batch. The stream defaults to the current sys.stdout.
+    """
+
+    def __init__(self, stream=None, batch_size=1000):
+        """
+        Sets the output stream and the number of messages per batch.
+        """
+        self.stream = stream
+        self.batch_size = batch_size
+        self._buffer = []
+        self._lock = threading.Lock()
+
+    def emit(self, name, message, /, **fields):
+        """
+        Adds the message to the buffer, flushing it when the batch is full.
+        """
+        with self._lock:
+            self._buffer.append(message)
+            if len(self._buffer) < self.batch_size:
+                return
+            batch, self._buffer = self._buffer, []
+
+        self._write(batch)
+
+    def flush(self):
+        """
+        Writes all buffered messages.
+        """
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+
+        if batch:
+            self._write(batch)
+
+    def _write(self, batch):
+        """
+        Writes a batch of messages, one per line.
+        """
+        stream = sys.stdout if self.stream is None else self.stream
+        stream.write("\n".join(batch) + "\n")
+
+
+class BackgroundSink(EventSink):
+    """
+    Hands events over to another sink from a background thread, so emitting
+    only costs a queue insertion. The queue is bounded and emitting blocks
+    when it is full.
+
+    Errors raised by the wrapped sink are counted in errors and reported to
+    on_error (printed to stderr by default), and the writer thread carries
+    on with the next event. Emitting or flushing after the sink was closed,
+    or once the writer thread has died, raises a RuntimeError instead of
+    blocking forever.
+    """
+
+    _CLOSE = object()
+    _POLL_SECONDS = 0.1  # How often blocked callers check the writer thread
+
+    def __init__(self, sink=None, max_queued=10000, on_error=None):
+        """
+        Starts the writer thread forwarding events to the given sink
+        (a BufferedSink writing to stdout by default).
+        """
+        self.sink = BufferedSink() if sink is None else sink
+        self.on_error = _report_error if on_error is None else on_error
+        self.errors = 0
+        self._closed = False
+        self._queue = queue.Queue(max_queued)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def emit(self, name, message, /, **fields):
+        """
+        Queues the event for the writer thread.
+        """
+        self._check_running()
+        item = (name, message, fields)
+        while True:
+            try:
+                self._queue.put(item, timeout=self._POLL_SECONDS)
+                return
+            except queue.Full:
+                self._check_running()
+
+    def flush(self):
+        """
+        Waits until every queued event has been written.
+        """
+        self._check_running()
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                self._check_running()
+                self._queue.all_tasks_done.wait(self._POLL_SECONDS)
+        self.sink.flush()
+
+    def close(self):
+        """
+        Writes the pending events and stops the writer thread.
+        """
+        if self._closed:
+            return
+
+        self._closed = True
+        if self._thread.is_alive():
+            self._queue.put(self._CLOSE)
+            self._thread.join()
+        self.sink.close()
+
+    def _check_running(self):
+        """
+        Raises a RuntimeError if events can no longer be written.
+        """
+        if self._closed:
+            raise RuntimeError("BackgroundSink is closed")
+        if not self._thread.is_alive():
+            raise RuntimeError("BackgroundSink writer thread has stopped")
+
+    def _run(self):
+        """
+        Writer thread loop.
+        """
+        while True:
+            item = self._queue.get()
+            try:
+                if item is self._CLOSE:
+                    return
+                name, message, fields = item
+                try:
+                    self.sink.emit(name, message, **fields)
+                    if self._queue.empty():
+                        self.sink.flush()
+                except Exception as error:  # pylint: disable=broad-except
+                    self.errors += 1
+                    self.on_error(error, Event(name, message, fields))
+            finally:
+                self._queue.task_done()
+
+
+def _report_error(error, event):
+    """
+    Prints an error of the sink wrapped by a BackgroundSink to stderr.
+    """
+    print(
+        f"BackgroundSink: {event.name} event not written: {error!r}",
+        file=sys.stderr,
+    )
+
+
+default_sink = PrintSink()
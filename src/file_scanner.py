@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+"""
+Parallel directory scanner applying the file size rule.
+"""
+import os
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import numpy as np
+
+from .white_box.batch import check_file_sizes
+from .white_box.validators import FILE_SIZE_LIMIT
+
+# Files of a scanned batch: paths, sizes in bytes and the size rule result
+ScanBatch = namedtuple("ScanBatch", ["paths", "sizes", "valid"])
+
+
+class ScanProgress:  # pylint: disable=too-few-public-methods
+    """
+    Counters of a running scan.
+    """
+
+    __slots__ = ("directories", "files", "bytes", "invalid", "errors")
+
+    def __init__(self):
+        """
+        Sets every counter to zero.
+        """
+        self.directories = 0
+        self.files = 0
+        self.bytes = 0
+        self.invalid = 0
+        self.errors = 0  # Directories or files that could not be read
+
+    def __repr__(self):
+        """
+        Shows the counters.
+        """
+        fields = ", ".join(f"{name}={getattr(self, name)}" for name in self.__slots__)
+        return f"ScanProgress({fields})"
+
+
+def _directory_key(stat):
+    """
+    Identifies a directory by its device and inode numbers.
+    """
+    return stat.st_dev, stat.st_ino
+
+
+def _scan_directory(path, follow_symlinks):
+    """
+    Lists a directory. Returns its subdirectories, as (path, key) pairs, the
+    paths and sizes of its files, and the number of entries that could not
+    be read. The keys identify the directories when symbolic links are
+    followed, so that loops can be detected, and are None otherwise.
+    """
+    directories, paths, sizes, errors = [], [], [], 0
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=follow_symlinks):
+                        key = None
+                        if follow_symlinks:
+                            key = _directory_key(entry.stat(follow_symlinks=True))
+                        directories.append((entry.path, key))
+                    elif entry.is_file(follow_symlinks=follow_symlinks):
+                        # DirEntry caches its stat result
+                        sizes.append(
+                            entry.stat(follow_symlinks=follow_symlinks).st_size
+                        )
+                        paths.append(entry.path)
+                except OSError:
+                    errors += 1
+    except OSError:
+        errors += 1
+
+    return directories, paths, sizes, errors
+
+
+def _unvisited(directories, visited):
+    """
+    Yields the paths of the (path, key) directories whose key is not in the
+    visited set, adding it. Directories without a key are always yielded.
+    """
+    for path, key in directories:
+        if key is None or key not in visited:
+            visited.add(key)
+            yield path
+
+
+class FileScanner:  # pylint: disable=too-many-instance-attributes
+    """
+    Walks directory trees with os.scandir on a thread pool and checks the
+    size of every file against a limit.
+
+    Each directory is listed by one task, and its subdirectories are queued
+    as new tasks as soon as it is done, so large trees are listed in
+    parallel. Files are collected into batches of batch_size and checked
+    with check_file_sizes, and the batches are streamed to the caller while
+    the scan goes on. The progress callback, if any, is called with the
+    counters every progress_every files and once at the end.
+
+    When symbolic links are followed, every directory is entered once, by
+    device and inode number, so links back up the tree don't loop.
+    """
+
+    def __init__(
+        self,
+        limit=FILE_SIZE_LIMIT,
+        workers=8,
+        batch_size=4096,
+        follow_symlinks=False,
+        progress=None,
+        progress_every=100000,
+    ):  # pylint: disable=too-many-arguments
+        """
+        Sets the size limit in bytes and the scan settings.
+        """
+        self.limit = limit
+        self.workers = workers
+        self.batch_size = batch_size
+        self.follow_symlinks = follow_symlinks
+        self.callback = progress
+        self.progress_every = progress_every
+        self.progress = ScanProgress()
+
+    def scan(self, *roots):
+        """
+        Scans the given directories, yielding ScanBatch tuples of the files
+        found, in no particular order.
+        """
+        progress = self.progress = ScanProgress()
+        paths, sizes = [], []
+        reported = 0
+        visited = set()  # Keys of the directories entered
+
+        with ThreadPoolExecutor(self.workers) as executor:
+            pending = {
+                executor.submit(_scan_directory, root, self.follow_symlinks)
+                for root in _unvisited(
+                    ((root, self._root_key(root)) for root in roots), visited
+                )
+            }
+            try:
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        directories, new_paths, new_sizes, errors = future.result()
+                        pending.update(
+                            executor.submit(
+                                _scan_directory, directory, self.follow_symlinks
+                            )
+                            for directory in _unvisited(directories, visited)
+                        )
+                        progress.directories += 1
+                        progress.errors += errors
+                        paths.extend(new_paths)
+                        sizes.extend(new_sizes)
+
+                    while len(paths) >= self.batch_size:
+                        yield self._batch(
+                            paths[: self.batch_size], sizes[: self.batch_size]
+                        )
+                        del paths[: self.batch_size], sizes[: self.batch_size]
+
+                    if progress.files - reported >= self.progress_every:
+                        reported = progress.files
+                        self._report()
+
+                if paths:
+                    yield self._batch(paths, sizes)
+                self._report()
+            finally:
+                # The caller may stop iterating before the scan is over
+                for future in pending:
+                    future.cancel()
+
+    def scan_invalid(self, *roots):
+        """
+        Scans the given directories, yielding the path and size of every
+        file over the limit.
+        """
+        for batch in self.scan(*roots):
+            for index in np.flatnonzero(~batch.valid):
+                yield batch.paths[index], int(batch.sizes[index])
+
+    def _root_key(self, root):
+        """
+        Returns the key of a root directory if symbolic links are followed.
+        """
+        if not self.follow_symlinks:
+            return None
+        try:
+            return _directory_key(os.stat(root))
+        except OSError:
+            return None  # Reported as an error when listed
+
+    def _batch(self, paths, sizes):
+        """
+        Checks a batch of files and updates the counters.
+        """
+        sizes = np.array(sizes, dtype=np.int64)
+        valid = check_file_sizes(sizes, self.limit)
+        self.progress.files += len(paths)
+        self.progress.bytes += int(sizes.sum())
+        self.progress.invalid += len(paths) - int(np.count_nonzero(valid))
+        return ScanBatch(paths, sizes, valid)
+
+    def _report(self):
+        """
+        Passes the counters to the progress callback.
+        """
+        if self.callback is not None:
+            self.callback(self.progress)
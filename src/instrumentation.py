@@ -0,0 +1,516 @@
+# -*- coding: utf-8 -*-
+
+"""
+Opt-in instrumentation of functions and methods: call counts, outcome
+counts and latency histograms.
+"""
+import functools
+import inspect
+import math
+import threading
+import time
+
+# Latency buckets exported to Prometheus, in seconds
+PROMETHEUS_BUCKETS = (
+    1e-7,
+    2.5e-7,
+    5e-7,
+    1e-6,
+    2.5e-6,
+    5e-6,
+    1e-5,
+    2.5e-5,
+    5e-5,
+    1e-4,
+    2.5e-4,
+    5e-4,
+    1e-3,
+    2.5e-3,
+    5e-3,
+    1e-2,
+    2.5e-2,
+    5e-2,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+OTHER_OUTCOME = "other"
+
+
+class Histogram:
+    """
+    HDR-style log-linear histogram of non-negative integers.
+
+    Values below 2**precision get a bucket each; above that, every power of
+    two is split into 2**(precision - 1) buckets, so a value is known within
+    a relative error of 2**(1 - precision) whatever its magnitude, and
+    finding its bucket is a couple of integer operations. Only non-empty
+    buckets are stored.
+    """
+
+    def __init__(self, precision=5):
+        """
+        Sets the number of significant bits kept per value.
+        """
+        self.precision = precision
+        self.counts = {}  # bucket index -> count
+        self.count = 0
+        self.sum = 0
+        self.min = None
+        self.max = None
+
+    def bucket(self, value):
+        """
+        Returns the index of the bucket of a value.
+        """
+        shift = value.bit_length() - self.precision
+        if shift <= 0:
+            return value
+        # The top precision bits of the value, the first one being set
+        return (shift << (self.precision - 1)) + (value >> shift)
+
+    def record(self, value):
+        """
+        Adds a value to the histogram.
+        """
+        self.add(self.bucket(value), 1, value, value, value)
+
+    def add(self, index, count, total, lowest, highest):
+        """
+        Adds count values to a bucket, along with their sum and extremes.
+        """
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.count += count
+        self.sum += total
+        if self.min is None or lowest < self.min:
+            self.min = lowest
+        if self.max is None or highest > self.max:
+            self.max = highest
+
+    def bucket_bounds(self, index):
+        """
+        Returns the lowest and highest values of a bucket.
+        """
+        size = 1 << self.precision
+        if index < size:
+            return index, index
+
+        half = size >> 1
+        shift = index // half - 1
+        mantissa = index % half + half
+        return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+    def buckets(self):
+        """
+        Returns the (highest value, count) of every non-empty bucket, in
+        increasing order.
+        """
+        return [
+            (self.bucket_bounds(index)[1], self.counts[index])
+            for index in sorted(self.counts)
+        ]
+
+    def percentile(self, percent):
+        """
+        Returns the highest value of the bucket holding the given percentile,
+        capped at the largest value recorded, or None if the histogram is
+        empty.
+        """
+        if not self.count:
+            return None
+
+        rank = max(percent / 100 * self.count, 1)
+        seen = 0
+        for highest, count in self.buckets():
+            seen += count
+            if seen >= rank:
+                return min(highest, self.max)
+        return self.max
+
+    def count_at_most(self, value):
+        """
+        Returns how many recorded values are in buckets whose highest value is
+        at most the given one.
+        """
+        return sum(count for highest, count in self.buckets() if highest <= value)
+
+
+def _default_outcome(result):
+    """
+    Outcome of a call: the result itself when it names a branch (a string,
+    a bool or None), otherwise the name of its type.
+    """
+    if result is None or isinstance(result, (str, bool)):
+        return result
+    return type(result).__name__
+
+
+# Outcome key of the calls that raised
+_ERROR = object()
+
+
+class Instrument:  # pylint: disable=too-many-instance-attributes
+    """
+    Statistics of one instrumented function.
+
+    Each call increments a single counter, keyed by its outcome and latency
+    bucket; the call, outcome and latency totals are derived from these
+    counters when they are read.
+    """
+
+    def __init__(self, name, outcome=_default_outcome, max_outcomes=64, precision=5):
+        """
+        Sets the function that maps results to outcomes and the maximum number
+        of distinct outcomes kept, beyond which they are counted as "other".
+        """
+        self.name = name
+        self.outcome = outcome
+        self.max_outcomes = max_outcomes
+        self.precision = precision
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        """
+        Zeroes the statistics.
+        """
+        with self.lock:
+            self._counts = {}  # (outcome, latency bucket) -> count
+            self._outcomes = set()
+            self._sum = 0
+            self._min = math.inf
+            self._max = 0
+
+    def record(self, nanoseconds, result=None, error=False):
+        """
+        Records a call and its result, or that it raised.
+        """
+        if error:
+            outcome = _ERROR
+        elif self.outcome is None:
+            outcome = None
+        else:
+            outcome = self.outcome(result)
+
+        shift = nanoseconds.bit_length() - self.precision
+        if shift > 0:
+            bucket = (shift << (self.precision - 1)) + (nanoseconds >> shift)
+        else:
+            bucket = nanoseconds
+
+        with self.lock:
+            counts, key = self._counts, (outcome, bucket)
+            count = counts.get(key)
+            if count is None:
+                key = self._new_key(outcome, bucket)
+                count = counts.get(key, 0)
+            counts[key] = count + 1
+            self._sum += nanoseconds
+            self._max = max(self._max, nanoseconds)
+            self._min = min(self._min, nanoseconds)
+
+    def _new_key(self, outcome, bucket):
+        """
+        Returns the counter key of an outcome and bucket not seen together
+        yet, folding outcomes over the limit into "other".
+        """
+        if outcome not in self._outcomes:
+            if outcome is not _ERROR and len(self._outcomes) >= self.max_outcomes:
+                outcome = OTHER_OUTCOME
+            self._outcomes.add(outcome)
+        return outcome, bucket
+
+    def totals(self):
+        """
+        Returns the number of calls, of errors, the count of each outcome and
+        the latency histogram in nanoseconds.
+        """
+        with self.lock:
+            counts = list(self._counts.items())
+            total, lowest, highest = self._sum, self._min, self._max
+
+        outcomes = {}
+        buckets = {}
+        for (outcome, bucket), count in counts:
+            outcomes[outcome] = outcomes.get(outcome, 0) + count
+            buckets[bucket] = buckets.get(bucket, 0) + count
+
+        latency = Histogram(self.precision)
+        latency.counts = buckets
+        latency.count = sum(buckets.values())
+        latency.sum = total
+        if latency.count:
+            latency.min, latency.max = lowest, highest
+
+        errors = outcomes.pop(_ERROR, 0)
+        if self.outcome is None:
+            outcomes.clear()
+        return latency.count, errors, outcomes, latency
+
+    def snapshot(self):
+        """
+        Returns the statistics as a dict; latencies are in seconds.
+        """
+        calls, errors, outcomes, latency = self.totals()
+        values = [("min", latency.min), ("max", latency.max)]
+        values += [
+            (f"p{percent}", latency.percentile(percent))
+            for percent in (50, 90, 99, 99.9)
+        ]
+        return {
+            "calls": calls,
+            "errors": errors,
+            "outcomes": {str(key): count for key, count in outcomes.items()},
+            "latency": {
+                "count": latency.count,
+                "sum": latency.sum / 1e9,
+                **{
+                    key: None if value is None else value / 1e9 for key, value in values
+                },
+            },
+        }
+
+
+def public_definitions(module):
+    """
+    Returns the public names of a module with their values: those listed in
+    its __all__, which imports the lazily loaded ones (PEP 562), or else the
+    functions and classes defined in the module itself.
+    """
+    if hasattr(module, "__all__"):
+        return {name: getattr(module, name) for name in module.__all__}
+
+    return {
+        name: value
+        for name, value in vars(module).items()
+        if not name.startswith("_")
+        and (inspect.isfunction(value) or inspect.isclass(value))
+        and value.__module__ == module.__name__
+    }
+
+
+def _instrumented(func, instrument):
+    """
+    Wraps a function so that every call is recorded by the instrument.
+    """
+    clock = time.perf_counter_ns
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException:
+            instrument.record(clock() - start, error=True)
+            raise
+        instrument.record(clock() - start, result)
+        return result
+
+    return wrapper
+
+
+def _escape(value):
+    """
+    Escapes a Prometheus label value.
+    """
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _sample(metric, labels, value):
+    """
+    Formats a Prometheus sample.
+    """
+    return f"{metric}{{{labels}}} {value}"
+
+
+def _instrument_samples(prefix, name, instrument, buckets):
+    """
+    Returns the Prometheus call, error, outcome and latency samples of an
+    instrument, as four lists.
+    """
+    function = f'function="{_escape(name)}"'
+    count, error_count, outcome_counts, latency = instrument.totals()
+    outcomes = [
+        _sample(
+            f"{prefix}_outcomes_total",
+            f'{function},outcome="{_escape(outcome)}"',
+            outcome_count,
+        )
+        for outcome, outcome_count in outcome_counts.items()
+    ]
+
+    metric = f"{prefix}_latency_seconds"
+    latencies = [
+        _sample(
+            f"{metric}_bucket",
+            f'{function},le="{bound}"',
+            latency.count_at_most(int(bound * 1e9)),
+        )
+        for bound in buckets
+    ]
+    latencies += [
+        _sample(f"{metric}_bucket", f'{function},le="+Inf"', latency.count),
+        _sample(f"{metric}_sum", function, latency.sum / 1e9),
+        _sample(f"{metric}_count", function, latency.count),
+    ]
+    return (
+        [_sample(f"{prefix}_calls_total", function, count)],
+        [_sample(f"{prefix}_errors_total", function, error_count)],
+        outcomes,
+        latencies,
+    )
+
+
+class Registry:
+    """
+    Registry of instrumented functions.
+
+    Enabling a function replaces the attribute it is looked up through (on
+    its module or class) with a recording wrapper, and disabling it puts the
+    original back, so functions that are not instrumented run exactly as
+    before at no cost. Code that imported the function itself before it was
+    enabled keeps calling the original, and generator functions are only
+    timed until they return their generator.
+    """
+
+    def __init__(self, precision=5, max_outcomes=64):
+        """
+        Sets the histogram precision and outcome limit of new instruments.
+        """
+        self.precision = precision
+        self.max_outcomes = max_outcomes
+        self.instruments = {}
+        self._originals = {}  # name -> (owner, attribute, original value)
+        self._lock = threading.Lock()
+
+    def enable(self, owner, path, outcome=_default_outcome):
+        """
+        Instruments the function or method at the dotted path in a module or
+        class, e.g. enable(white_box, "BankingSystem.transfer_money").
+        outcome maps results to the outcomes counted (None to count none).
+        Returns the instrument.
+        """
+        *parents, attribute = path.split(".")
+        for parent in parents:
+            owner = getattr(owner, parent)
+        name = f"{owner.__qualname__}.{attribute}" if inspect.isclass(owner) else path
+        getattr(owner, attribute)  # Imports the names of lazy modules (PEP 562)
+
+        with self._lock:
+            if name in self._originals:
+                return self.instruments[name]
+
+            original = inspect.getattr_static(owner, attribute)
+            if isinstance(original, (staticmethod, classmethod)):
+                func = original.__func__
+            elif callable(original):
+                func = original
+            else:
+                raise TypeError(f"{name} is not a function or method")
+
+            instrument = self.instruments.get(name)
+            if instrument is None:
+                instrument = Instrument(
+                    name, outcome, self.max_outcomes, self.precision
+                )
+                self.instruments[name] = instrument
+            else:
+                instrument.outcome = outcome
+
+            wrapper = _instrumented(func, instrument)
+            if isinstance(original, (staticmethod, classmethod)):
+                wrapper = type(original)(wrapper)
+            setattr(owner, attribute, wrapper)
+            self._originals[name] = (owner, attribute, original)
+
+        return instrument
+
+    def enable_all(self, module, outcome=_default_outcome):
+        """
+        Instruments every public function defined in a module, or listed
+        in its __all__ (e.g. the lazily imported names of a package).
+        """
+        for name, value in public_definitions(module).items():
+            if inspect.isfunction(value):
+                self.enable(module, name, outcome)
+
+    def disable(self, name):
+        """
+        Restores an instrumented function. Its statistics are kept.
+        """
+        with self._lock:
+            entry = self._originals.pop(name, None)
+            if entry is not None:
+                owner, attribute, original = entry
+                setattr(owner, attribute, original)
+
+    def disable_all(self):
+        """
+        Restores every instrumented function.
+        """
+        for name in list(self._originals):
+            self.disable(name)
+
+    @property
+    def enabled(self):
+        """
+        Names of the functions currently instrumented.
+        """
+        return sorted(self._originals)
+
+    def reset(self):
+        """
+        Zeroes the statistics of the functions that are instrumented and
+        forgets the others.
+        """
+        with self._lock:
+            for name in list(self.instruments):
+                if name in self._originals:
+                    self.instruments[name].clear()
+                else:
+                    del self.instruments[name]
+
+    def snapshot(self):
+        """
+        Returns the statistics of every instrument as a dict.
+        """
+        return {
+            name: instrument.snapshot()
+            for name, instrument in sorted(self.instruments.items())
+        }
+
+    def to_prometheus(self, prefix="white_box", buckets=PROMETHEUS_BUCKETS):
+        """
+        Returns the statistics in the Prometheus text exposition format.
+        Histogram buckets are approximated from the HDR buckets.
+        """
+        samples_by_metric = ([], [], [], [])
+        for name, instrument in sorted(self.instruments.items()):
+            for samples, instrument_samples in zip(
+                samples_by_metric,
+                _instrument_samples(prefix, name, instrument, buckets),
+            ):
+                samples += instrument_samples
+
+        lines = []
+        for (metric, kind, description), samples in zip(
+            (
+                ("calls_total", "counter", "Calls of instrumented functions."),
+                ("errors_total", "counter", "Calls that raised an exception."),
+                ("outcomes_total", "counter", "Calls by outcome."),
+                ("latency_seconds", "histogram", "Latency of calls."),
+            ),
+            samples_by_metric,
+        ):
+            lines.append(f"# HELP {prefix}_{metric} {description}")
+            lines.append(f"# TYPE {prefix}_{metric} {kind}")
+            lines += samples
+        return "\n".join(lines) + "\n"
+
+
+default_registry = Registry()
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+"""
+Interval-table lookup engine for banded classifiers.
+"""
+import math
+from bisect import bisect_right
+
+_CLOSURES = ("left", "right", "both", "neither")
+
+
+class IntervalTable:
+    """
+    Maps numbers to values through a declared table of contiguous ranges.
+
+    Each row is a (low, high, value) tuple, optionally followed by which ends
+    of the range are closed: "left" (the default), "right", "both" or
+    "neither". Rows must neither overlap nor leave gaps between them, which
+    is checked when the table is built. Numbers outside the covered ranges
+    (and NaN) map to the default value, or raise a ValueError if there is
+    none. A range closed at an infinite high end contains infinity.
+    """
+
+    def __init__(self, rows, default=None):
+        """
+        Builds the table, normalizing every range to a [start, end) pair of
+        floats so lookups are a single bisection.
+        """
+        self.default = default
+        rows = list(rows)
+        ranges = sorted((_normalize(row) for row in rows), key=lambda item: item[:2])
+        if not ranges:
+            raise ValueError("Interval table needs at least one row")
+
+        for (_, end, value), (start, _, next_value) in zip(ranges, ranges[1:]):
+            if end > start:
+                raise ValueError(f"Ranges for {value!r} and {next_value!r} overlap")
+            if end < start:
+                raise ValueError(f"Ranges for {value!r} and {next_value!r} leave a gap")
+
+        self.edges = [start for start, _, _ in ranges] + [ranges[-1][1]]
+        self.values = [value for _, _, value in ranges]
+        # No float is past infinity, so the last range can't be normalized
+        # to contain it and infinity is looked up separately
+        self._closed_at_inf = any(
+            row[1] == math.inf and row[3:4] in (("right",), ("both",)) for row in rows
+        )
+        self._arrays = None  # NumPy tables of lookup_many, built on first use
+
+    def lookup(self, number):
+        """
+        Returns the value of the range containing the number.
+        """
+        index = bisect_right(self.edges, number)
+        if 0 < index < len(self.edges):
+            return self.values[index - 1]
+        if number == math.inf and self._closed_at_inf:
+            return self.values[-1]
+
+        if self.default is None:
+            raise ValueError(f"{number!r} is outside the table ranges")
+
+        return self.default
+
+    def lookup_many(self, numbers):
+        """
+        Returns a NumPy array with the value of the range containing each
+        number of the given array or buffer.
+        """
+        # NumPy is only imported by batch lookups, so that scalar lookups
+        # stay cheap to import
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        if self._arrays is None:
+            # Lookup table padded with the default for numbers below/above
+            # all ranges (without a default, those numbers are rejected
+            # before use)
+            padding = self.values[0] if self.default is None else self.default
+            self._arrays = (
+                np.array(self.edges, dtype=np.float64),
+                np.array([padding, *self.values, padding]),
+            )
+        edges, padded = self._arrays
+
+        numbers = np.asarray(numbers)
+        indices = np.searchsorted(edges, numbers, side="right")
+        if self._closed_at_inf:
+            indices = np.where(numbers == math.inf, len(self.values), indices)
+        if self.default is None:
+            outside = (indices == 0) | (indices == len(self.edges))
+            if outside.any():
+                raise ValueError("Some numbers are outside the table ranges")
+
+        return padded[indices]
+
+
+def _normalize(row):
+    """
+    Converts a table row to a (start, end, value) triple where the range is
+    start <= number < end.
+    """
+    low, high, value, *closed = row
+    closed = closed[0] if closed else "left"
+    if closed not in _CLOSURES:
+        raise ValueError(f"Invalid range closure: {closed!r}")
+    if low > high or (low == high and closed != "both"):
+        raise ValueError(f"Empty range for {value!r}")
+
+    start = low if closed in ("left", "both") else math.nextafter(low, math.inf)
+    end = math.nextafter(high, math.inf) if closed in ("right", "both") else high
+    return float(start), float(end), value
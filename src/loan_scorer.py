@@ -0,0 +1,405 @@
+# -*- coding: utf-8 -*-
+
+"""
+Streaming batch scorer applying the loan eligibility rules to applicant files.
+"""
+import csv
+import json
+import math
+import os
+import time
+from collections import Counter, deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from operator import itemgetter
+
+import numpy as np
+
+from .decision import DecisionTable
+
+# Income and credit score boundaries of the loan tiers, as used by
+# check_loan_eligibility
+LoanTiers = namedtuple(
+    "LoanTiers",
+    ["min_income", "max_income", "standard_score", "premium_score"],
+    defaults=(30000, 60000, 700, 750),
+)
+
+FORMATS = ("csv", "jsonl")
+
+# Result of rows whose income or credit score is missing or not a number, and
+# of JSONL lines that are not JSON objects
+INVALID_ROW = "Invalid Row"
+
+
+def loan_table(tiers=LoanTiers()):
+    """
+    Builds the decision table of check_loan_eligibility with the given tier
+    boundaries.
+    """
+    middle_income = (tiers.min_income, tiers.max_income, "both")
+    return DecisionTable(
+        ["income", "credit_score"],
+        [
+            ({"income": (None, tiers.min_income)}, "Not Eligible"),
+            (
+                {
+                    "income": middle_income,
+                    "credit_score": (tiers.standard_score, None, "neither"),
+                },
+                "Standard Loan",
+            ),
+            ({"income": middle_income}, "Secured Loan"),
+            ({"credit_score": (tiers.premium_score, None, "neither")}, "Premium Loan"),
+        ],
+        default="Standard Loan",
+    )
+
+
+class ScoreProgress:  # pylint: disable=too-few-public-methods
+    """
+    Counters of a running scoring job. rows, invalid and results cover the
+    whole file, including the part scored before a resume, while seconds
+    and rows_per_second only cover the current run.
+    """
+
+    __slots__ = ("rows", "invalid", "results", "chunks", "run_rows", "seconds")
+
+    def __init__(self, rows=0, invalid=0, results=None):
+        """
+        Starts the counters, from those of a checkpoint if resuming.
+        """
+        self.rows = rows
+        self.invalid = invalid
+        self.results = Counter(results or {})  # Rows per result
+        self.chunks = 0
+        self.run_rows = 0
+        self.seconds = 0.0
+
+    @property
+    def rows_per_second(self):
+        """
+        Returns the throughput of the current run.
+        """
+        return self.run_rows / self.seconds if self.seconds else 0.0
+
+    def __repr__(self):
+        """
+        Shows the counters.
+        """
+        return (
+            f"ScoreProgress(rows={self.rows}, invalid={self.invalid}, "
+            f"chunks={self.chunks}, rows_per_second={self.rows_per_second:.0f})"
+        )
+
+
+class _ChunkScorer:  # pylint: disable=too-few-public-methods
+    """
+    Parses, scores and formats chunks of lines, in a worker process.
+    """
+
+    def __init__(self, tiers, fmt, fields, columns, result_field):
+        """
+        Builds the decision table. columns are the CSV column indexes of the
+        income and credit score, fields their JSONL keys.
+        """
+        self.table = loan_table(tiers)
+        self.fmt = fmt
+        self.fields = fields
+        self.columns = columns
+        self.result_field = result_field
+
+    def __call__(self, lines):
+        """
+        Scores a chunk of lines. Returns the output lines as bytes, and the
+        number of rows per result.
+        """
+        text = b"".join(lines).decode("utf-8").splitlines()
+        text = [line for line in text if line.strip()]
+        if self.fmt == "csv":
+            records = list(csv.reader(text))
+            incomes, scores = (_column(records, key) for key in self.columns)
+        else:
+            records = [_json_record(line) for line in text]
+            incomes, scores = (_column(records, key) for key in self.fields)
+
+        valid = np.isfinite(incomes) & np.isfinite(scores)
+        results = self.table.decide_many(incomes, scores)
+        results = np.where(valid, results, INVALID_ROW).tolist()
+
+        if self.fmt == "csv":
+            output = [f"{line},{result}\n" for line, result in zip(text, results)]
+        else:
+            output = []
+            for line, record, result in zip(text, records, results):
+                if record is None:
+                    # Kept as a string, as it can't take the result field
+                    record = {"input": line}
+                record[self.result_field] = result
+                output.append(json.dumps(record) + "\n")
+        return "".join(output).encode("utf-8"), Counter(results)
+
+
+def _json_record(line):
+    """
+    Parses a JSONL line, returning None unless it is a JSON object.
+    """
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def _column(records, key):
+    """
+    Returns the values of a field of the records as floats, NaN where they
+    are missing or not a number (booleans included).
+    """
+    try:
+        values = list(map(itemgetter(key), records))
+        if bool not in set(map(type, values)):
+            return np.array(values, dtype=np.float64)
+    except (LookupError, TypeError, ValueError):
+        pass
+
+    values = np.full(len(records), math.nan)
+    for index, record in enumerate(records):
+        try:
+            value = record[key]
+            if not isinstance(value, bool):
+                values[index] = float(value)
+        except (LookupError, TypeError, ValueError):
+            pass
+    return values
+
+
+_WORKER_SCORER = None
+
+
+def _init_worker(*args):
+    """
+    Builds the chunk scorer of a worker process, once.
+    """
+    global _WORKER_SCORER  # pylint: disable=global-statement
+    _WORKER_SCORER = _ChunkScorer(*args)
+
+
+def _score_in_worker(lines):
+    """
+    Scores a chunk of lines with the chunk scorer of the worker process.
+    """
+    return _WORKER_SCORER(lines)
+
+
+class LoanScorer:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    """
+    Applies the loan eligibility rules to every applicant of a CSV or JSONL
+    file, one row per line, and writes each row with its result appended.
+    Rows whose income or credit score is missing or not a number get
+    INVALID_ROW, and JSONL lines that are not JSON objects are written as an
+    object holding the line under "input" and INVALID_ROW as the result.
+
+    The file is read in chunks of chunk_size lines, which are parsed, scored
+    with decide_many and formatted on a process pool. At most max_pending
+    chunks are in flight at once, so memory use does not depend on the file
+    size, and results are written in input order. After each written chunk
+    the input and output offsets are saved to the checkpoint file, if any,
+    and a job interrupted midway resumes from there when run again. The
+    progress callback, if any, is called with the counters after each chunk.
+    """
+
+    def __init__(
+        self,
+        tiers=LoanTiers(),
+        workers=None,
+        chunk_size=50000,
+        max_pending=None,
+        fields=("income", "credit_score"),
+        result_field="eligibility",
+        progress=None,
+    ):  # pylint: disable=too-many-arguments
+        """
+        Sets the tier boundaries and the job settings. workers defaults to
+        the number of CPUs, and max_pending to twice the number of workers.
+        """
+        self.tiers = LoanTiers(*tiers)
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.max_pending = max_pending or 2 * self.workers
+        self.fields = tuple(fields)
+        self.result_field = result_field
+        self.callback = progress
+        self.progress = ScoreProgress()
+
+        # Fails early on tier boundaries that make a tier unreachable
+        loan_table(self.tiers)
+
+    def score_file(self, source, destination, fmt=None, checkpoint=None):
+        """
+        Scores the applicants of the source file into the destination file.
+        The format is guessed from the source extension unless given.
+        Returns the counters. The checkpoint file is removed once the whole
+        file is scored.
+        """
+        fmt = fmt or _guess_format(source)
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown format: {fmt!r}")
+
+        checkpoint = _Checkpoint(checkpoint, source, self.tiers)
+        state = checkpoint.state
+        self.progress = ScoreProgress(state["rows"], state["invalid"], state["results"])
+
+        with open(source, "rb") as infile, open(
+            destination, "r+b" if state["output_offset"] else "wb"
+        ) as outfile:
+            header = infile.readline() if fmt == "csv" else b""
+            columns = _csv_columns(header, self.fields) if fmt == "csv" else ()
+            if state["input_offset"]:
+                infile.seek(state["input_offset"])
+                outfile.seek(state["output_offset"])
+                outfile.truncate()
+            elif header:
+                result_field = self.result_field.encode("utf-8")
+                outfile.write(header.rstrip(b"\r\n") + b"," + result_field + b"\n")
+
+            initargs = (self.tiers, fmt, self.fields, columns, self.result_field)
+            self._run(infile, outfile, initargs, checkpoint)
+
+        checkpoint.remove()
+        return self.progress
+
+    def _run(self, infile, outfile, initargs, checkpoint):
+        """
+        Streams the chunks of the input through the process pool, and writes
+        their results in order.
+        """
+        input_offset = infile.tell()
+        start = time.perf_counter()
+        pending = deque()
+
+        with ProcessPoolExecutor(
+            self.workers, initializer=_init_worker, initargs=initargs
+        ) as executor:
+            try:
+                while True:
+                    lines = list(islice(infile, self.chunk_size))
+                    if lines:
+                        input_offset += sum(len(line) for line in lines)
+                        pending.append(
+                            (executor.submit(_score_in_worker, lines), input_offset)
+                        )
+                    if not pending:
+                        break
+                    if lines and len(pending) < self.max_pending:
+                        continue
+
+                    future, offset = pending.popleft()
+                    output, counts = future.result()
+                    outfile.write(output)
+                    self._count(counts, start)
+                    checkpoint.save(outfile, offset, self.progress)
+                    if self.callback is not None:
+                        self.callback(self.progress)
+            finally:
+                # Chunks not written yet are scored again on resume
+                for future, _ in pending:
+                    future.cancel()
+
+    def _count(self, counts, start):
+        """
+        Updates the counters with the results of a chunk.
+        """
+        progress = self.progress
+        rows = sum(counts.values())
+        progress.chunks += 1
+        progress.rows += rows
+        progress.run_rows += rows
+        progress.invalid += counts.get(INVALID_ROW, 0)
+        progress.results.update(counts)
+        progress.seconds = time.perf_counter() - start
+
+
+class _Checkpoint:
+    """
+    Offsets of the input and output files up to which a job is done, saved
+    to a JSON file with the counters.
+    """
+
+    def __init__(self, path, source, tiers):
+        """
+        Loads the checkpoint file if there is one, checking that it belongs
+        to the same file and tiers.
+        """
+        self.path = path
+        self.state = {
+            "source": os.path.abspath(source),
+            "tiers": list(tiers),
+            "input_offset": 0,
+            "output_offset": 0,
+            "rows": 0,
+            "invalid": 0,
+            "results": {},
+        }
+        if path is None or not os.path.exists(path):
+            return
+
+        with open(path, encoding="utf-8") as file:
+            saved = json.load(file)
+        if saved["source"] != self.state["source"]:
+            raise ValueError(
+                f"Checkpoint {path} is for another file: {saved['source']}"
+            )
+        if saved["tiers"] != self.state["tiers"]:
+            raise ValueError(f"Checkpoint {path} was written with other tiers")
+        self.state = saved
+
+    def save(self, outfile, input_offset, progress):
+        """
+        Flushes the output and saves the offsets and counters, atomically.
+        """
+        if self.path is None:
+            return
+
+        outfile.flush()
+        self.state.update(
+            input_offset=input_offset,
+            output_offset=outfile.tell(),
+            rows=progress.rows,
+            invalid=progress.invalid,
+            results=dict(progress.results),
+        )
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(self.state, file)
+        os.replace(temporary, self.path)
+
+    def remove(self):
+        """
+        Removes the checkpoint file of a finished job.
+        """
+        if self.path is not None and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def _guess_format(path):
+    """
+    Returns the format of a file from its extension.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"Cannot guess the format of {path}")
+
+
+def _csv_columns(header, fields):
+    """
+    Returns the column indexes of the given fields in a CSV header line.
+    """
+    names = next(csv.reader([header.decode("utf-8-sig").strip()]), [])
+    try:
+        return tuple(names.index(field) for field in fields)
+    except ValueError as error:
+        raise ValueError(f"Missing column in CSV header: {error}") from None
@@ -0,0 +1,395 @@
+# -*- coding: utf-8 -*-
+
+"""
+Opt-in memoization of pure functions behind bounded LRU or ARC caches.
+"""
+import contextlib
+import functools
+import inspect
+import threading
+from collections import OrderedDict
+
+POLICIES = ("lru", "arc")
+
+_MISSING = object()
+_KWARGS = object()  # Separates positional and keyword arguments in keys
+
+
+def _stats(hits, misses, evictions, size, maxsize):
+    """
+    Returns the statistics of a cache as a dict.
+    """
+    lookups = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "evictions": evictions,
+        "size": size,
+        "maxsize": maxsize,
+        "hit_ratio": hits / lookups if lookups else 0.0,
+    }
+
+
+class LRUCache:
+    """
+    Bounded cache of the results of a function, evicting the least recently
+    used entry.
+
+    The cache is functools.lru_cache, whose lookups are done in C and are
+    thread-safe, so the wrapper it builds (call) is the fastest memoization
+    available; this class keeps its statistics across clears and counts
+    evictions, which lru_cache does not. Evictions are derived from the
+    misses whose result was stored, so calls that raise are not counted;
+    with threads racing to compute the same key the count may be slightly
+    high.
+    """
+
+    def __init__(self, func, maxsize=256):
+        """
+        Builds the caching wrapper of a function, keeping maxsize entries.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self._hits = 0  # Statistics from before the last clear
+        self._misses = 0
+        self._evictions = 0
+        self._failures = 0  # Misses that raised since the last clear
+
+        @functools.wraps(func)
+        def compute(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except BaseException:
+                self._failures += 1
+                raise
+
+        self.call = functools.lru_cache(maxsize)(compute)
+
+    def __len__(self):
+        """
+        Returns the number of entries.
+        """
+        return self.call.cache_info().currsize
+
+    def clear(self):
+        """
+        Removes every entry. The statistics are kept.
+        """
+        info = self.call.cache_info()
+        self.call.cache_clear()
+        self._hits += info.hits
+        self._misses += info.misses
+        self._evictions += info.misses - self._failures - info.currsize
+        self._failures = 0
+
+    def stats(self):
+        """
+        Returns the statistics of the cache as a dict.
+        """
+        info = self.call.cache_info()
+        return _stats(
+            self._hits + info.hits,
+            self._misses + info.misses,
+            self._evictions + info.misses - self._failures - info.currsize,
+            info.currsize,
+            self.maxsize,
+        )
+
+
+class ARCCache:  # pylint: disable=too-many-instance-attributes
+    """
+    Bounded cache with the Adaptive Replacement Cache policy (Megiddo and
+    Modha, 2003).
+
+    Entries seen once (recent) and seen again (frequent) are kept in two LRU
+    lists, and the keys recently evicted from each are remembered without
+    their values. A miss on a remembered key shows that its list was too
+    small, and moves the target split between the two lists towards it, so
+    the cache adapts between recency and frequency. Unlike plain LRU, a scan
+    of values seen once cannot flush the frequent ones.
+    """
+
+    def __init__(self, maxsize=256):
+        """
+        Sets the number of entries kept.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self.recent = OrderedDict()  # Entries seen once (T1)
+        self.frequent = OrderedDict()  # Entries seen again (T2)
+        self.recent_ghosts = OrderedDict()  # Keys evicted from recent (B1)
+        self.frequent_ghosts = OrderedDict()  # Keys evicted from frequent (B2)
+        self.target = 0  # Target size of recent (p)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        """
+        Returns the number of entries.
+        """
+        return len(self.recent) + len(self.frequent)
+
+    def get(self, key, default=None):
+        """
+        Returns the value of a key, or default on a miss.
+        """
+        value = self.frequent.get(key, _MISSING)
+        if value is not _MISSING:
+            self.frequent.move_to_end(key)
+        else:
+            value = self.recent.pop(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self.frequent[key] = value
+
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """
+        Stores the value of a key, evicting an entry if the cache is full.
+        """
+        if key in self.frequent:
+            self.frequent[key] = value
+            return
+        if key in self.recent:
+            self.recent[key] = value
+            return
+
+        maxsize = self.maxsize
+        if key in self.recent_ghosts:
+            ratio = len(self.frequent_ghosts) / len(self.recent_ghosts)
+            self.target = min(maxsize, self.target + max(ratio, 1))
+            del self.recent_ghosts[key]
+            self._replace(False)
+            self.frequent[key] = value
+            return
+        if key in self.frequent_ghosts:
+            ratio = len(self.recent_ghosts) / len(self.frequent_ghosts)
+            self.target = max(0, self.target - max(ratio, 1))
+            del self.frequent_ghosts[key]
+            self._replace(True)
+            self.frequent[key] = value
+            return
+
+        recent = len(self.recent) + len(self.recent_ghosts)
+        if recent >= maxsize:
+            if len(self.recent) < maxsize:
+                self.recent_ghosts.popitem(last=False)
+                self._replace(False)
+            else:
+                self.recent.popitem(last=False)
+                self.evictions += 1
+        else:
+            total = recent + len(self.frequent) + len(self.frequent_ghosts)
+            if total >= 2 * maxsize:
+                self.frequent_ghosts.popitem(last=False)
+            if total >= maxsize:
+                self._replace(False)
+        self.recent[key] = value
+
+    def _replace(self, frequent_ghost):
+        """
+        Evicts the least recently used entry of the list over its target
+        size, if the cache is full, and remembers its key.
+        """
+        if len(self) < self.maxsize:
+            return
+
+        if self.recent and (
+            not self.frequent
+            or len(self.recent) > self.target
+            or (frequent_ghost and len(self.recent) == self.target)
+        ):
+            key, _ = self.recent.popitem(last=False)
+            self.recent_ghosts[key] = None
+        else:
+            key, _ = self.frequent.popitem(last=False)
+            self.frequent_ghosts[key] = None
+        self.evictions += 1
+
+    def clear(self):
+        """
+        Removes every entry and forgets the evicted keys. The statistics are
+        kept.
+        """
+        self.recent.clear()
+        self.frequent.clear()
+        self.recent_ghosts.clear()
+        self.frequent_ghosts.clear()
+        self.target = 0
+
+    def stats(self):
+        """
+        Returns the statistics of the cache as a dict.
+        """
+        return _stats(self.hits, self.misses, self.evictions, len(self), self.maxsize)
+
+
+def memoize(func, maxsize=256, policy="lru", thread_safe=False):
+    """
+    Returns a wrapper of a function that looks its results up in a cache of
+    maxsize entries first, exposed as its cache attribute. The arguments
+    must be hashable. LRU caches are always thread-safe; ARC caches are
+    guarded by a lock (the cache_lock attribute) only with thread_safe.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown cache policy: {policy!r}")
+
+    if policy == "lru":
+        cache = LRUCache(func, maxsize)
+        wrapper = cache.call
+        wrapper.cache = cache
+        wrapper.cache_lock = contextlib.nullcontext()
+        return wrapper
+
+    cache = ARCCache(maxsize)
+    get, put = cache.get, cache.put
+
+    if not thread_safe:
+        lock = contextlib.nullcontext()
+
+        @functools.wraps(func)
+        def unlocked_wrapper(*args, **kwargs):
+            key = args if not kwargs else (*args, _KWARGS, *sorted(kwargs.items()))
+            result = get(key, _MISSING)
+            if result is _MISSING:
+                result = func(*args, **kwargs)
+                put(key, result)
+            return result
+
+        wrapper = unlocked_wrapper
+
+    else:
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def locked_wrapper(*args, **kwargs):
+            key = args if not kwargs else (*args, _KWARGS, *sorted(kwargs.items()))
+            with lock:
+                result = get(key, _MISSING)
+            if result is _MISSING:
+                # Computed outside the lock, possibly twice by racing threads
+                result = func(*args, **kwargs)
+                with lock:
+                    put(key, result)
+            return result
+
+        wrapper = locked_wrapper
+
+    wrapper.cache = cache
+    wrapper.cache_lock = lock
+    return wrapper
+
+
+class Memoizer:
+    """
+    Registry of memoized functions.
+
+    Enabling a function replaces the attribute it is looked up through (on
+    its module or class) with a caching wrapper, and disabling it puts the
+    original back, as with instrumentation.Registry. Only pure functions of
+    hashable arguments should be memoized. A cache whose function depends
+    on configuration (e.g. a lookup table that gets replaced) must be
+    invalidated when that configuration changes.
+
+    LRU caches are thread-safe. ARC caches are not safe to share between
+    threads unless enabled with thread_safe, which guards every lookup with
+    a lock.
+    """
+
+    def __init__(self):
+        """
+        Starts with no memoized function.
+        """
+        self.caches = {}
+        # name -> (owner, attribute, original value, wrapper)
+        self._originals = {}
+        self._lock = threading.Lock()
+
+    def enable(
+        self, owner, path, maxsize=256, policy="lru", thread_safe=False
+    ):  # pylint: disable=too-many-arguments
+        """
+        Memoizes the function or method at the dotted path in a module or
+        class, e.g. enable(white_box, "get_grade"), with a cache of maxsize
+        entries. Returns the cache.
+        """
+        *parents, attribute = path.split(".")
+        for parent in parents:
+            owner = getattr(owner, parent)
+        name = f"{owner.__qualname__}.{attribute}" if inspect.isclass(owner) else path
+        getattr(owner, attribute)  # Imports the names of lazy modules (PEP 562)
+
+        with self._lock:
+            if name in self._originals:
+                return self.caches[name]
+
+            original = inspect.getattr_static(owner, attribute)
+            if isinstance(original, (staticmethod, classmethod)):
+                func = original.__func__
+            elif callable(original):
+                func = original
+            else:
+                raise TypeError(f"{name} is not a function or method")
+
+            wrapper = memoize(func, maxsize, policy, thread_safe)
+            if isinstance(original, (staticmethod, classmethod)):
+                setattr(owner, attribute, type(original)(wrapper))
+            else:
+                setattr(owner, attribute, wrapper)
+            self._originals[name] = (owner, attribute, original, wrapper)
+            self.caches[name] = wrapper.cache
+
+        return wrapper.cache
+
+    def disable(self, name):
+        """
+        Restores a memoized function and drops its cache.
+        """
+        with self._lock:
+            entry = self._originals.pop(name, None)
+            if entry is not None:
+                owner, attribute, original, _ = entry
+                setattr(owner, attribute, original)
+                del self.caches[name]
+
+    def disable_all(self):
+        """
+        Restores every memoized function.
+        """
+        for name in list(self._originals):
+            self.disable(name)
+
+    @property
+    def enabled(self):
+        """
+        Names of the functions currently memoized.
+        """
+        return sorted(self._originals)
+
+    def invalidate(self, name=None):
+        """
+        Empties the cache of a memoized function, or of all of them, after
+        a change that makes their results stale.
+        """
+        with self._lock:
+            for cache_name, (*_, wrapper) in self._originals.items():
+                if name is None or cache_name == name:
+                    with wrapper.cache_lock:
+                        wrapper.cache.clear()
+
+    def stats(self):
+        """
+        Returns the statistics of every cache as a dict.
+        """
+        return {name: cache.stats() for name, cache in sorted(self.caches.items())}
+
+
+default_memoizer = Memoizer()
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+"""
+Precompiled shipping rate cards.
+"""
+import math
+from bisect import bisect_left
+
+import numpy as np
+
+from .decision import DecisionTable
+
+
+class RateCard:  # pylint: disable=too-many-instance-attributes
+    """
+    Shipping rate card compiled into lookup tables.
+
+    Orders are priced by shipping method and weight band: weight_limits are
+    the ascending, inclusive upper bounds of the bands and every method has
+    one rate per band plus one for heavier orders. Packages are priced by the
+    first package class they fit in, or package_default if none. A package
+    class is a dict with a "cost" and optional "weight" and "side" ranges;
+    the weight range excludes its lower bound and the side range (applied to
+    length, width and height) includes both bounds. The package classes are
+    compiled into a DecisionTable, so a class that can never be reached
+    because of the classes before it is rejected.
+    """
+
+    def __init__(self, weight_limits, methods, package_classes=(), package_default=0):
+        """
+        Validates the card and compiles it into lookup tables.
+        """
+        if list(weight_limits) != sorted(weight_limits):
+            raise ValueError("Weight limits must be in ascending order")
+
+        self.weight_limits = list(weight_limits)
+        self.method_codes = {}
+        self.rates = []
+        for code, (method, rates) in enumerate(methods.items()):
+            if len(rates) != len(self.weight_limits) + 1:
+                raise ValueError(f"Method {method!r} needs one rate per weight band")
+            self.method_codes[method] = code
+            self.rates.append(list(rates))
+
+        self.package_classes = [_compile_package_class(c) for c in package_classes]
+        self.package_default = package_default
+        self.package_table = DecisionTable(
+            ["weight", "length", "width", "height"],
+            [
+                (
+                    {
+                        "weight": (min_weight, max_weight, "right"),
+                        **{
+                            side: (min_side, max_side, "both")
+                            for side in ("length", "width", "height")
+                        },
+                    },
+                    cost,
+                )
+                for cost, min_weight, max_weight, min_side, max_side in (
+                    self.package_classes
+                )
+            ],
+            default=package_default,
+        )
+
+        self._limits = np.array(self.weight_limits, dtype=np.float64)
+        self._rates = np.array(self.rates)
+
+    @classmethod
+    def from_dict(cls, card):
+        """
+        Builds a rate card from its dict form (e.g. a parsed JSON document).
+        """
+        return cls(
+            card["weight_limits"],
+            card["methods"],
+            card.get("package_classes", ()),
+            card.get("package_default", 0),
+        )
+
+    def _method_code(self, method):
+        """
+        Returns the code of a shipping method.
+        """
+        try:
+            return self.method_codes[method]
+        except (KeyError, TypeError):
+            raise ValueError("Invalid shipping method") from None
+
+    def quote(self, total_weight, shipping_method):
+        """
+        Returns the shipping cost of an order.
+        """
+        rates = self.rates[self._method_code(shipping_method)]
+        return rates[bisect_left(self.weight_limits, total_weight)]
+
+    def quote_many(self, total_weights, shipping_methods):
+        """
+        Returns the shipping cost of every order given as columns of total
+        weights and shipping methods (or a single method for all orders).
+        """
+        bands = np.searchsorted(self._limits, np.asarray(total_weights), side="left")
+        if isinstance(shipping_methods, str):
+            return self._rates[self._method_code(shipping_methods)][bands]
+
+        methods, inverse = np.unique(np.asarray(shipping_methods), return_inverse=True)
+        codes = np.array([self._method_code(m) for m in methods.tolist()], dtype=int)
+        return self._rates[codes[inverse.ravel()], bands]
+
+    def package_cost(self, weight, length, width, height):
+        """
+        Returns the shipping cost of a package.
+        """
+        return self.package_table.decide(weight, length, width, height)
+
+    def package_costs(self, weights, lengths, widths, heights):
+        """
+        Returns the shipping cost of every package given as columns of
+        weights and dimensions.
+        """
+        return self.package_table.decide_many(weights, lengths, widths, heights)
+
+
+class ShippingQuoter:
+    """
+    Quotes shipping costs from a rate card that can be replaced while quoting.
+
+    Every quote reads the current card once, so in-flight quotes finish with
+    the card they started with and new ones pick up a reloaded card.
+    """
+
+    def __init__(self, rate_card):
+        """
+        Sets the initial rate card.
+        """
+        self.rate_card = rate_card
+
+    def reload(self, rate_card):
+        """
+        Replaces the rate card, given as a RateCard or in its dict form.
+        """
+        if not isinstance(rate_card, RateCard):
+            rate_card = RateCard.from_dict(rate_card)
+        self.rate_card = rate_card
+
+    def quote(self, total_weight, shipping_method):
+        """
+        Returns the shipping cost of an order.
+        """
+        return self.rate_card.quote(total_weight, shipping_method)
+
+    def quote_many(self, total_weights, shipping_methods):
+        """
+        Returns the shipping cost of every order of a batch.
+        """
+        return self.rate_card.quote_many(total_weights, shipping_methods)
+
+    def package_cost(self, weight, length, width, height):
+        """
+        Returns the shipping cost of a package.
+        """
+        return self.rate_card.package_cost(weight, length, width, height)
+
+    def package_costs(self, weights, lengths, widths, heights):
+        """
+        Returns the shipping cost of every package of a batch.
+        """
+        return self.rate_card.package_costs(weights, lengths, widths, heights)
+
+
+def _compile_package_class(package_class):
+    """
+    Converts a package class dict to a (cost, min_weight, max_weight,
+    min_side, max_side) tuple, with missing bounds set to infinity.
+    """
+    min_weight, max_weight = package_class.get("weight", (None, None))
+    min_side, max_side = package_class.get("side", (None, None))
+    return (
+        package_class["cost"],
+        -math.inf if min_weight is None else min_weight,
+        math.inf if max_weight is None else max_weight,
+        -math.inf if min_side is None else min_side,
+        math.inf if max_side is None else max_side,
+    )
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+"""
+Per-key rate limiting.
+"""
+import math
+import threading
+import time
+from collections import OrderedDict
+
+MODES = ("token_bucket", "sliding_window")
+
+
+class RateLimiter:  # pylint: disable=too-many-instance-attributes
+    """
+    Limits how often each key (a username, a source address, ...) may act.
+
+    In "token_bucket" mode every key can burst up to limit requests and
+    regains limit tokens per window seconds. In "sliding_window" mode every
+    key may make limit requests in any window, estimated from the counts of
+    the current and previous fixed windows. Either way a key only costs a
+    few numbers of state, and keys idle for idle_ttl seconds are evicted.
+    """
+
+    def __init__(
+        self,
+        limit,
+        window=1.0,
+        mode="token_bucket",
+        idle_ttl=300.0,
+        clock=time.monotonic,
+    ):
+        """
+        Sets the number of requests allowed per window of seconds.
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown rate limiting mode: {mode!r}")
+
+        self.limit = limit
+        self.window = window
+        self.mode = mode
+        self.idle_ttl = max(idle_ttl, window)
+        self.clock = clock
+        self._allow = (
+            self._allow_token_bucket
+            if mode == "token_bucket"
+            else self._allow_sliding_window
+        )
+        self._keys = OrderedDict()  # key -> state, least recently seen first
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """
+        Number of keys being tracked.
+        """
+        return len(self._keys)
+
+    def allow(self, key):
+        """
+        Records a request for the key and returns whether it is allowed.
+        """
+        now = self.clock()
+        with self._lock:
+            keys = self._keys
+            state = keys.get(key)
+            if state is None:
+                state = keys[key] = self._new_state(now)
+            else:
+                keys.move_to_end(key)
+            allowed = self._allow(state, now)
+            state[0] = now
+
+            # Evict a couple of idle keys per request, oldest first
+            for _ in range(2):
+                oldest = next(iter(keys.values()))
+                if now - oldest[0] < self.idle_ttl:
+                    break
+                keys.popitem(last=False)
+
+        return allowed
+
+    def allow_all(self, keys):
+        """
+        Records a request for each of the keys and returns whether it is
+        allowed for all of them.
+        """
+        # A list, not a generator: every key records the request, even after
+        # one of them is refused
+        return all([self.allow(key) for key in keys])  # pylint: disable=use-a-generator
+
+    def _new_state(self, now):
+        """
+        Returns the state of a key seen for the first time: the last time it
+        was seen, then the mode's own fields.
+        """
+        if self.mode == "token_bucket":
+            return [now, float(self.limit)]  # tokens left
+        # Index of the current window, then the counts of the previous and
+        # current windows
+        return [now, math.floor(now / self.window), 0, 0]
+
+    def _allow_token_bucket(self, state, now):
+        """
+        Refills the bucket for the elapsed time and takes a token from it.
+        """
+        tokens = state[1] + (now - state[0]) * self.limit / self.window
+        tokens = min(tokens, self.limit)
+        if tokens >= 1:
+            state[1] = tokens - 1
+            return True
+
+        state[1] = tokens
+        return False
+
+    def _allow_sliding_window(self, state, now):
+        """
+        Estimates the requests of the last window and counts the new one.
+        """
+        index = math.floor(now / self.window)
+        if index != state[1]:
+            previous = state[3] if index == state[1] + 1 else 0
+            state[1:] = [index, previous, 0]
+
+        elapsed = now / self.window - index
+        if state[2] * (1 - elapsed) + state[3] + 1 > self.limit:
+            return False
+
+        state[3] += 1
+        return True
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+"""
+Sharded in-memory session store with TTL expiry.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+
+class _Shard:  # pylint: disable=too-few-public-methods
+    """
+    A lock and the sessions it guards, ordered by expiry time.
+    """
+
+    __slots__ = ("lock", "sessions")
+
+    def __init__(self):
+        """
+        Creates an empty shard.
+        """
+        self.lock = threading.Lock()
+        self.sessions = OrderedDict()  # key -> expiry time
+
+
+class SessionStore:
+    """
+    Session store with lock striping across shards and TTL expiry.
+
+    Sessions expire ttl seconds after their last login or touch. Since the
+    TTL is the same for every session, each shard keeps its sessions in
+    expiry order and reaps expired ones lazily from the front, a few on each
+    operation, so login, logout and lookup are all O(1). reap can also be
+    called periodically to remove every expired session at once.
+
+    The store can stand in for a set of logged-in users: it supports in,
+    len, add and discard.
+    """
+
+    def __init__(self, ttl=1800.0, shards=16, clock=time.monotonic, reap_batch=8):
+        """
+        Sets the session TTL in seconds, the number of shards and the clock.
+        """
+        self.ttl = ttl
+        self.clock = clock
+        self.reap_batch = reap_batch
+        self._shards = [_Shard() for _ in range(shards)]
+
+    def _shard(self, key):
+        """
+        Returns the shard owning a key.
+        """
+        return self._shards[hash(key) % len(self._shards)]
+
+    def _reap(self, sessions, now, limit):
+        """
+        Removes up to limit expired sessions from the front of a shard.
+        Must be called with the shard lock held.
+        """
+        reaped = 0
+        while sessions and reaped != limit:
+            key, expiry = next(iter(sessions.items()))
+            if expiry > now:
+                break
+            del sessions[key]
+            reaped += 1
+        return reaped
+
+    def login(self, key):
+        """
+        Starts a session. Returns False if the key already had an active one.
+        """
+        shard = self._shard(key)
+        now = self.clock()
+        with shard.lock:
+            sessions = shard.sessions
+            self._reap(sessions, now, self.reap_batch)
+            expiry = sessions.get(key)
+            if expiry is not None and expiry > now:
+                return False
+
+            sessions[key] = now + self.ttl
+            sessions.move_to_end(key)
+            return True
+
+    def logout(self, key):
+        """
+        Ends a session. Returns whether the key had an active one.
+        """
+        shard = self._shard(key)
+        now = self.clock()
+        with shard.lock:
+            self._reap(shard.sessions, now, self.reap_batch)
+            expiry = shard.sessions.pop(key, None)
+            return expiry is not None and expiry > now
+
+    def touch(self, key):
+        """
+        Extends an active session by the TTL. Returns whether it was active.
+        """
+        shard = self._shard(key)
+        now = self.clock()
+        with shard.lock:
+            expiry = shard.sessions.get(key)
+            if expiry is None or expiry <= now:
+                return False
+
+            shard.sessions[key] = now + self.ttl
+            shard.sessions.move_to_end(key)
+            return True
+
+    def is_active(self, key):
+        """
+        Returns whether the key has an active session.
+        """
+        expiry = self._shard(key).sessions.get(key)
+        return expiry is not None and expiry > self.clock()
+
+    def reap(self):
+        """
+        Removes every expired session and returns how many were removed.
+        """
+        now = self.clock()
+        reaped = 0
+        for shard in self._shards:
+            with shard.lock:
+                reaped += self._reap(shard.sessions, now, None)
+        return reaped
+
+    def __contains__(self, key):
+        """
+        Same as is_active.
+        """
+        return self.is_active(key)
+
+    def __len__(self):
+        """
+        Number of active sessions.
+        """
+        self.reap()
+        return sum(len(shard.sessions) for shard in self._shards)
+
+    def add(self, key):
+        """
+        Set-like alias of login.
+        """
+        self.login(key)
+
+    def discard(self, key):
+        """
+        Set-like alias of logout.
+        """
+        self.logout(key)
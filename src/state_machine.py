@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+"""
+Table-driven finite state machine engine.
+"""
+import numpy as np
+
+
+class MachineSpec:  # pylint: disable=too-many-instance-attributes
+    """
+    State machine compiled from a declared transition table.
+
+    transitions maps every event to the states it is valid in, and each of
+    those to a (next state, message) pair; the first state is the initial
+    one. Firing an event in any other state keeps the state and returns the
+    invalid message. States and events are compiled to integer codes and
+    the transitions to a dense next-state array, usable on whole NumPy
+    arrays of states with step_all.
+    """
+
+    def __init__(self, states, transitions, invalid=None):
+        """
+        Validates and compiles the transition table.
+        """
+        self.states = tuple(states)
+        self.state_codes = {state: code for code, state in enumerate(self.states)}
+        if len(self.state_codes) != len(self.states) or not self.states:
+            raise ValueError("States must be unique and non-empty")
+
+        self.events = tuple(transitions)
+        self.event_codes = {event: code for code, event in enumerate(self.events)}
+        self.invalid = invalid
+
+        dtype = np.min_scalar_type(len(self.states) - 1)
+        self.next_states = np.empty((len(self.states), len(self.events)), dtype)
+        self.next_states[:] = np.arange(len(self.states), dtype=dtype)[:, None]
+        self.accepted = np.zeros(self.next_states.shape, dtype=bool)
+        # Per event, the (next state code, message) pair of every state
+        self.actions = [
+            [(code, invalid) for code in range(len(self.states))] for _ in self.events
+        ]
+
+        for event, moves in transitions.items():
+            event_code = self.event_code(event)
+            for state, (next_state, message) in moves.items():
+                code, next_code = self.encode(state), self.encode(next_state)
+                self.next_states[code, event_code] = next_code
+                self.accepted[code, event_code] = True
+                self.actions[event_code][code] = (next_code, message)
+
+    def encode(self, state):
+        """
+        Returns the code of a state.
+        """
+        try:
+            return self.state_codes[state]
+        except KeyError:
+            raise ValueError(f"Unknown state: {state!r}") from None
+
+    def event_code(self, event):
+        """
+        Returns the code of an event.
+        """
+        try:
+            return self.event_codes[event]
+        except KeyError:
+            raise ValueError(f"Unknown event: {event!r}") from None
+
+    def encode_all(self, states):
+        """
+        Returns a NumPy array with the codes of the given states.
+        """
+        return np.array(
+            [self.encode(state) for state in states], self.next_states.dtype
+        )
+
+    def decode_all(self, codes):
+        """
+        Returns the names of the given state codes.
+        """
+        return [self.states[code] for code in np.asarray(codes).tolist()]
+
+    def step_all(self, codes, event, out=None):
+        """
+        Advances a NumPy array of state codes by one event and returns the
+        new codes (written to out if given, which may be codes itself).
+        States in which the event is invalid are left unchanged.
+        """
+        column = self.next_states[:, self.event_code(event)]
+        return np.take(column, codes, out=out)
+
+    def accepts_all(self, codes, event):
+        """
+        Returns a boolean mask of the state codes in which the event is valid.
+        """
+        return self.accepted[:, self.event_code(event)][codes]
+
+    def event_method(self, event, doc=None):
+        """
+        Builds a StateMachine method firing the event and returning its
+        message.
+        """
+        actions = self.actions[self.event_code(event)]
+
+        def fire(machine):
+            machine.code, message = actions[machine.code]
+            return message
+
+        fire.__name__ = fire.__qualname__ = event
+        fire.__doc__ = doc
+        return fire
+
+
+class StateMachine:  # pylint: disable=too-few-public-methods
+    """
+    Base class of the state machines, storing only the current state code.
+    Subclasses set spec to a MachineSpec and declare their events with
+    spec.event_method.
+    """
+
+    __slots__ = ("code",)
+    spec = None
+
+    def __init__(self):
+        """
+        Sets the initial state.
+        """
+        self.code = 0
+
+    @property
+    def state(self):
+        """
+        Name of the current state.
+        """
+        return self.spec.states[self.code]
+
+    @state.setter
+    def state(self, state):
+        """
+        Sets the current state by name.
+        """
+        self.code = self.spec.encode(state)
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+"""
+Hierarchical timing wheel and a traffic light scheduler built on it.
+"""
+import time
+
+
+class Timer:  # pylint: disable=too-few-public-methods
+    """
+    Handle of a scheduled item, used to cancel it.
+    """
+
+    __slots__ = ("deadline", "item", "bucket")
+
+    def __init__(self, deadline, item):
+        """
+        Sets the tick the item is due at.
+        """
+        self.deadline = deadline
+        self.item = item
+        self.bucket = None  # Slot the timer is stored in, None once expired
+
+
+class TimingWheel:
+    """
+    Hierarchical timing wheel with O(1) scheduling and cancellation.
+
+    Time advances in integer ticks. Level 0 has one slot per tick and every
+    higher level has one slot per full turn of the level below, so `levels`
+    wheels of 2**bits slots cover 2**(bits * levels) ticks; timers further
+    away wait in an overflow list. When a lower wheel completes a turn, the
+    next slot of the wheel above is cascaded down.
+    """
+
+    def __init__(self, bits=8, levels=4):
+        """
+        Creates empty wheels, starting at tick 0.
+        """
+        self.bits = bits
+        self.levels = levels
+        self.tick = 0
+        self._mask = (1 << bits) - 1
+        self._wheels = [[{} for _ in range(1 << bits)] for _ in range(levels)]
+        self._overflow = {}
+        self._count = 0
+
+    def __len__(self):
+        """
+        Number of pending timers.
+        """
+        return self._count
+
+    def schedule(self, delay, item):
+        """
+        Schedules an item to expire after the given number of ticks (at least
+        one) and returns its timer.
+        """
+        timer = Timer(self.tick + max(int(delay), 1), item)
+        self._place(timer)
+        self._count += 1
+        return timer
+
+    def cancel(self, timer):
+        """
+        Cancels a pending timer. Returns whether it was still pending.
+        """
+        if timer.bucket is None:
+            return False
+
+        del timer.bucket[timer]
+        timer.bucket = None
+        self._count -= 1
+        return True
+
+    def advance(self, ticks=1):
+        """
+        Advances the wheel by the given number of ticks and returns the items
+        that expired, in deadline order.
+        """
+        expired = []
+        for _ in range(ticks):
+            self.tick += 1
+            self._cascade()
+            slot = self._wheels[0][self.tick & self._mask]
+            if slot:
+                self._wheels[0][self.tick & self._mask] = {}
+                for timer in slot:
+                    timer.bucket = None
+                    expired.append(timer.item)
+
+        self._count -= len(expired)
+        return expired
+
+    def _place(self, timer):
+        """
+        Stores a timer in the slot of the lowest level whose current turn
+        contains its deadline.
+        """
+        deadline, shift = timer.deadline, 0
+        for wheel in self._wheels:
+            # Same turn of the level above as the current tick
+            if deadline >> (shift + self.bits) == self.tick >> (shift + self.bits):
+                bucket = wheel[(deadline >> shift) & self._mask]
+                break
+            shift += self.bits
+        else:
+            bucket = self._overflow
+
+        bucket[timer] = None
+        timer.bucket = bucket
+
+    def _cascade(self):
+        """
+        Moves the timers of the next slot of each higher level down, for the
+        levels whose lower wheel just completed a turn.
+        """
+        shift = self.bits
+        for wheel in self._wheels[1:]:
+            if self.tick & ((1 << shift) - 1):
+                return
+            index = (self.tick >> shift) & self._mask
+            bucket, wheel[index] = wheel[index], {}
+            for timer in bucket:
+                self._place(timer)
+            shift += self.bits
+
+        if not self.tick & ((1 << shift) - 1):
+            bucket, self._overflow = self._overflow, {}
+            for timer in bucket:
+                self._place(timer)
+
+
+class TrafficLightScheduler:
+    """
+    Changes the state of many traffic lights on their own schedules.
+
+    Every light stays in each state for the duration (in seconds) configured
+    for it, and all the lights due at the same tick are changed in one batch.
+    The scheduler runs on simulated time through advance, or on the real
+    clock through run.
+    """
+
+    def __init__(self, durations, tick=1.0, wheel=None):
+        """
+        Sets the duration of every state and the length of a tick in seconds.
+        """
+        self.durations = {
+            state: max(round(seconds / tick), 1) for state, seconds in durations.items()
+        }
+        self.tick = tick
+        self.wheel = TimingWheel() if wheel is None else wheel
+        self._timers = {}
+
+    def add(self, light, offset=0.0):
+        """
+        Starts scheduling a light; its first change happens after the duration
+        of its current state plus the given offset in seconds.
+        """
+        self.remove(light)
+        delay = self.durations[light.state] + round(offset / self.tick)
+        self._timers[light] = self.wheel.schedule(delay, light)
+
+    def remove(self, light):
+        """
+        Stops scheduling a light.
+        """
+        timer = self._timers.pop(light, None)
+        if timer is not None:
+            self.wheel.cancel(timer)
+
+    def advance(self, seconds):
+        """
+        Advances the simulated time, changing the lights that are due in
+        batches. Returns the number of state changes.
+        """
+        changes = 0
+        for _ in range(round(seconds / self.tick)):
+            changes += self._change(self.wheel.advance())
+        return changes
+
+    def run(self, seconds, clock=time.monotonic, sleep=time.sleep):
+        """
+        Runs the scheduler on the real clock for the given number of seconds.
+        Returns the number of state changes.
+        """
+        changes = 0
+        start = clock()
+        for tick in range(1, round(seconds / self.tick) + 1):
+            delay = start + tick * self.tick - clock()
+            if delay > 0:
+                sleep(delay)
+            changes += self._change(self.wheel.advance())
+        return changes
+
+    def _change(self, lights):
+        """
+        Changes the state of a batch of due lights and schedules their next
+        change.
+        """
+        durations, schedule, timers = self.durations, self.wheel.schedule, self._timers
+        for light in lights:
+            light.change_state()
+            timers[light] = schedule(durations[light.state], light)
+        return len(lights)
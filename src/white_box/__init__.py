@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+"""
+White-box code examples.
+
+The examples are split into subsystem modules, each imported the first time
+one of its names is looked up on the package (PEP 562), so importing the
+package costs next to nothing and a process only pays for the subsystems it
+uses: the scalar validators import neither NumPy nor re, while their batch
+variants, the decision-table rules and the other subsystems come with their
+engines. from src.white_box import * still imports every name.
+
+Assigning a name on the package, e.g. to replace a table or instrument a
+function, assigns it in its subsystem module too, so that the functions of
+that module calling it see the new value. Deleting it from the package, as
+unittest.mock.patch does on exit, puts the value of the subsystem module
+back.
+"""
+import importlib
+import sys
+import types
+
+# Public names of each subsystem module
+_SUBMODULES = {
+    "validators": (
+        "is_even",
+        "divide",
+        "GRADES",
+        "get_grade",
+        "is_triangle",
+        "check_number_status",
+        "PASSWORD_MIN_LENGTH",
+        "PASSWORD_SPECIAL_CHARS",
+        "PASSWORD_RULES",
+        "password_failures",
+        "validate_password",
+        "validate_passwords",
+        "validate_login",
+        "verify_age",
+        "validate_email",
+        "CELSIUS_MIN",
+        "CELSIUS_MAX",
+        "celsius_to_fahrenheit",
+        "validate_credit_card",
+        "CARD_MIN_LENGTH",
+        "CARD_MAX_LENGTH",
+        "DATE_MIN_YEAR",
+        "DATE_MAX_YEAR",
+        "DATE_OK",
+        "DATE_BAD_FORMAT",
+        "DATE_BAD_YEAR",
+        "DATE_BAD_MONTH",
+        "DATE_BAD_DAY",
+        "DATE_REASONS",
+        "validate_date",
+        "URL_MAX_LENGTH",
+        "URL_RULES",
+        "url_failure",
+        "validate_url",
+        "validate_urls",
+        "read_log_urls",
+        "FILE_SIZE_LIMIT",
+        "check_file_size",
+    ),
+    "batch": (
+        "celsius_to_fahrenheit_many",
+        "convert_celsius_file",
+        "validate_credit_cards",
+        "validate_dates",
+        "parse_iso_dates",
+        "validate_iso_dates",
+        "check_file_sizes",
+    ),
+    "rules": (
+        "FLIGHT_RULES",
+        "check_flight_eligibility",
+        "LOAN_RULES",
+        "check_loan_eligibility",
+        "QUIZ_RULES",
+        "grade_quiz",
+        "WEATHER_RULES",
+        "get_weather_advisory",
+    ),
+    "pricing": (
+        "TOTAL_DISCOUNT_RATES",
+        "calculate_total_discount",
+        "calculate_order_total",
+        "calculate_order_totals",
+        "SHIPPING_QUOTER",
+        "calculate_items_shipping_cost",
+        "PRODUCT_CATEGORIES",
+        "categorize_product",
+        "QUANTITY_DISCOUNTS",
+        "calculate_quantity_discount",
+        "calculate_shipping_cost",
+    ),
+    "fsm": (
+        "VendingMachine",
+        "TrafficLight",
+        "UserAuthentication",
+        "DocumentEditingSystem",
+        "ElevatorSystem",
+    ),
+    "banking": (
+        "authenticate_user",
+        "BankAccount",
+        "DEFAULT_OPENING_BALANCE",
+        "FEE_ACCOUNT",
+        "TRANSFER_FEES",
+        "lock_accounts",
+        "BankingSystem",
+    ),
+    "cart": ("Product", "ShoppingCart"),
+}
+
+# Subsystem module of each public name
+_LOCATIONS = {name: module for module, names in _SUBMODULES.items() for name in names}
+
+__all__ = list(_LOCATIONS)
+
+# Values of the subsystem modules replaced through the package, by name
+_REPLACED = {}
+
+
+def _submodule(module):
+    """
+    Returns a subsystem module, importing it if needed.
+    """
+    return importlib.import_module(f"{__name__}.{module}")
+
+
+def __getattr__(name):
+    """
+    Imports the subsystem module defining a name on its first lookup, and
+    copies all its public names to the package so later lookups are plain
+    attribute accesses.
+    """
+    module = _LOCATIONS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    submodule = _submodule(module)
+    for public_name in _SUBMODULES[module]:
+        globals().setdefault(public_name, getattr(submodule, public_name))
+    return globals()[name]
+
+
+def __dir__():
+    """
+    Lists the names of the package, including those not imported yet.
+    """
+    return sorted({*globals(), *__all__})
+
+
+class _Package(types.ModuleType):
+    """
+    Module type of the package, forwarding the assignments and deletions of
+    public names to their subsystem module.
+    """
+
+    def __setattr__(self, name, value):
+        module = _LOCATIONS.get(name)
+        if module is not None:
+            submodule = _submodule(module)
+            original = _REPLACED.setdefault(name, getattr(submodule, name))
+            if value is original:
+                del _REPLACED[name]
+            setattr(submodule, name, value)
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        module = _LOCATIONS.get(name)
+        if module is None:
+            super().__delattr__(name)
+            return
+
+        # The original value is looked up again from the subsystem module
+        if name in _REPLACED:
+            setattr(_submodule(module), name, _REPLACED.pop(name))
+        self.__dict__.pop(name, None)
+
+
+sys.modules[__name__].__class__ = _Package
@@ -0,0 +1,358 @@
+# -*- coding: utf-8 -*-
+
+"""
+User authentication, bank accounts and the banking system of the
+white-box examples.
+"""
+import itertools
+import math
+import numbers
+import threading
+from contextlib import ExitStack, contextmanager
+
+import numpy as np
+
+from ..events import default_sink
+
+
+# 20
+def _login_allowed(rate_limiter, username, source):
+    """
+    Records a login attempt with a rate limiter, keyed by username and by
+    source if one is given, and returns whether it may go ahead.
+    """
+    if rate_limiter is None:
+        return True
+    if source is None:
+        return rate_limiter.allow(("user", username))
+    return rate_limiter.allow_all([("user", username), ("source", source)])
+
+
+def authenticate_user(
+    username, password, credentials=None, rate_limiter=None, source=None
+):
+    """
+    Authenticates users based on their username and password.
+    If a credential store is given, the admin password is checked against
+    its hash there instead of the built-in one. If a rate limiter is given,
+    attempts over the limit for the username or source are rejected before
+    any check.
+    """
+    if not _login_allowed(rate_limiter, username, source):
+        return "Rate Limited"
+
+    if username == "admin":
+        if credentials is None:
+            is_admin = password == "admin123"
+        else:
+            is_admin = credentials.verify(username, password)
+        if is_admin:
+            return "Admin"
+
+    if len(username) >= 5 and len(password) >= 8:
+        return "User"
+
+    return "Invalid"
+
+
+# Creation order of the accounts, the order in which lock_accounts locks them
+_ACCOUNT_IDS = itertools.count()
+
+
+# 27
+class BankAccount:  # pylint: disable=too-few-public-methods
+    """
+    Bank account class.
+    """
+
+    def __init__(self, account_number, balance, sink=None):
+        """
+        Set the bank account details.
+        """
+        self.account_number = account_number
+        self.balance = balance
+        self.lock = threading.Lock()
+        self.lock_order = next(_ACCOUNT_IDS)
+        self.sink = default_sink if sink is None else sink
+
+    def view_account(self):
+        """
+        Function to display the account details.
+        """
+        self.sink.emit(
+            "account_viewed",
+            f"The account {self.account_number} has a balance of {self.balance}",
+            account_number=self.account_number,
+            balance=self.balance,
+        )
+
+
+DEFAULT_OPENING_BALANCE = 1000
+FEE_ACCOUNT = "fees"
+TRANSFER_FEES = {"regular": 0.02, "express": 0.05, "scheduled": 0.01}
+
+
+def _valid_amount(amount):
+    """
+    Checks that a transfer amount is a positive real number.
+    """
+    return (
+        isinstance(amount, numbers.Real) and not isinstance(amount, bool) and amount > 0
+    )
+
+
+@contextmanager
+def lock_accounts(*accounts):
+    """
+    Locks the given accounts in a fixed (creation) order, so that concurrent
+    transfers between the same accounts can't deadlock. Account numbers
+    of any type can be mixed, as they are not compared.
+    """
+    unique = {id(account): account for account in accounts}.values()
+    with ExitStack() as stack:
+        for account in sorted(unique, key=lambda account: account.lock_order):
+            stack.enter_context(account.lock)
+        yield
+
+
+class BankingSystem:  # pylint: disable=too-many-instance-attributes
+    """
+    Banking system class.
+    Balances are kept in an in-memory ledger of bank accounts, each guarded
+    by its own lock so that disjoint transfers can run in parallel.
+    """
+
+    def __init__(
+        self, sink=None, session_store=None, credentials=None, rate_limiter=None
+    ):
+        """
+        Mock users.
+        Messages go to the given event sink, printed by default. Logged-in
+        users are kept in a set, or in the given session store so that they
+        expire. Passwords are checked against the given credential store of
+        hashes, if any, instead of the plaintext users dict. Login attempts
+        go through the given rate limiter, if any.
+        """
+        self.users = {"user123": "pass123"}  # Simplified user database
+        self.credentials = credentials
+        self.rate_limiter = rate_limiter
+        self.logged_in_users = set() if session_store is None else session_store
+        self.sink = default_sink if sink is None else sink
+        self.accounts = {}
+        self.fee_account = BankAccount(FEE_ACCOUNT, 0, self.sink)
+        self._accounts_lock = threading.Lock()
+
+    def open_account(self, account_number, balance=DEFAULT_OPENING_BALANCE):
+        """
+        Adds a new account to the ledger.
+        """
+        with self._accounts_lock:
+            if account_number in self.accounts:
+                raise ValueError(f"Account {account_number} already exists")
+
+            account = BankAccount(account_number, balance, self.sink)
+            self.accounts[account_number] = account
+
+        return account
+
+    def get_account(self, account_number):
+        """
+        Returns an account of the ledger, opening it with the default balance
+        the first time it is used.
+        """
+        account = self.accounts.get(account_number)
+        if account is None:
+            with self._accounts_lock:
+                account = self.accounts.get(account_number)
+                if account is None:
+                    account = BankAccount(
+                        account_number, DEFAULT_OPENING_BALANCE, self.sink
+                    )
+                    self.accounts[account_number] = account
+
+        return account
+
+    def authenticate(self, username, password, source=None):
+        """
+        User authentication function.
+        """
+        if not self._attempt_allowed(username, source):
+            return False
+
+        if self.credentials is not None:
+            valid = self.credentials.verify(username, password)
+        else:
+            valid = username in self.users and self.users[username] == password
+        return self._log_in(username, valid)
+
+    async def authenticate_async(self, username, password, source=None):
+        """
+        User authentication function for asyncio code: the password hash is
+        checked off the event loop by the credential store.
+        """
+        if self.credentials is None:
+            return self.authenticate(username, password, source)
+        if not self._attempt_allowed(username, source):
+            return False
+
+        valid = await self.credentials.authenticate_async(username, password)
+        return self._log_in(username, valid)
+
+    def _attempt_allowed(self, username, source):
+        """
+        Checks a login attempt against the rate limiter.
+        """
+        if _login_allowed(self.rate_limiter, username, source):
+            return True
+
+        self.sink.emit(
+            "rate_limited",
+            "Too many login attempts.",
+            username=username,
+            source=source,
+        )
+        return False
+
+    def _log_in(self, username, valid):
+        """
+        Logs a user in after checking their password.
+        """
+        if valid:
+            if username not in self.logged_in_users:
+                self.logged_in_users.add(username)
+                self.sink.emit(
+                    "authenticated",
+                    f"User {username} authenticated successfully.",
+                    username=username,
+                )
+                return True
+
+            self.sink.emit(
+                "already_logged_in", "User already logged in.", username=username
+            )
+        else:
+            self.sink.emit(
+                "authentication_failed", "Authentication failed.", username=username
+            )
+
+        return False
+
+    def transfer_money(self, sender, receiver, amount, transaction_type):
+        """
+        Function to perform a money transfer.
+        The sender is debited the amount plus the fee and the receiver is
+        credited the amount atomically, under the locks of these two accounts
+        only so that disjoint transfers run in parallel; the fee account is
+        credited the fee right after. The amount must be a positive number.
+        """
+        if sender not in self.logged_in_users:
+            self.sink.emit(
+                "sender_not_authenticated", "Sender not authenticated.", sender=sender
+            )
+            return False
+
+        if transaction_type not in TRANSFER_FEES:
+            self.sink.emit(
+                "invalid_transaction_type",
+                "Invalid transaction type.",
+                transaction_type=transaction_type,
+            )
+            return False
+
+        if not _valid_amount(amount):
+            self.sink.emit("invalid_amount", "Invalid amount.", amount=amount)
+            return False
+
+        fee = TRANSFER_FEES[transaction_type] * amount
+        sender_account = self.get_account(sender)
+        receiver_account = self.get_account(receiver)
+
+        with lock_accounts(sender_account, receiver_account):
+            if sender_account.balance < (amount + fee):
+                self.sink.emit(
+                    "insufficient_funds",
+                    "Insufficient funds.",
+                    sender=sender,
+                    amount=amount,
+                    fee=fee,
+                )
+                return False
+
+            sender_account.balance -= amount + fee
+            receiver_account.balance += amount
+
+        with self.fee_account.lock:
+            self.fee_account.balance += fee
+
+        self.sink.emit(
+            "transfer_processed",
+            f"Money transfer of ${amount} ({transaction_type} transfer)"
+            f" from {sender} to {receiver} processed successfully.",
+            sender=sender,
+            receiver=receiver,
+            amount=amount,
+            fee=fee,
+            transaction_type=transaction_type,
+        )
+        return True
+
+    def settle_transfers(self, transfers):  # pylint: disable=too-many-locals
+        """
+        Settles a window of (sender, receiver, amount, transaction_type)
+        transfers at once. Transfers are accepted or rejected in order with
+        the same rules as transfer_money, but fees are computed in bulk and
+        the flows are netted, so every account balance changes only once.
+        Returns whether each transfer was accepted.
+        """
+        transfers = list(transfers)
+        if not transfers:
+            return []
+
+        _, _, amounts, transaction_types = zip(*transfers)
+        valid = [_valid_amount(amount) for amount in amounts]
+        rates = [TRANSFER_FEES.get(kind, math.nan) for kind in transaction_types]
+        amounts = [amount if ok else math.nan for amount, ok in zip(amounts, valid)]
+        fees = (np.array(rates) * np.array(amounts, dtype=np.float64)).tolist()
+
+        # Only transfers that would reach the funds check touch the ledger
+        candidates = [
+            index
+            for index, (sender, _, _, kind) in enumerate(transfers)
+            if sender in self.logged_in_users and kind in TRANSFER_FEES and valid[index]
+        ]
+        accounts = {}
+        for index in candidates:
+            sender, receiver, _, _ = transfers[index]
+            accounts[sender] = self.get_account(sender)
+            accounts[receiver] = self.get_account(receiver)
+
+        accepted = [False] * len(transfers)
+        net = dict.fromkeys(accounts, 0)
+        total_fees = 0
+        with lock_accounts(*accounts.values()):
+            for index in candidates:
+                sender, receiver, amount, _ = transfers[index]
+                fee = fees[index]
+                if accounts[sender].balance + net[sender] < (amount + fee):
+                    continue
+
+                net[sender] -= amount + fee
+                net[receiver] += amount
+                total_fees += fee
+                accepted[index] = True
+
+            for account_number, delta in net.items():
+                if delta:
+                    accounts[account_number].balance += delta
+
+        with self.fee_account.lock:
+            self.fee_account.balance += total_fees
+
+        self.sink.emit(
+            "transfers_settled",
+            f"Settled {sum(accepted)} of {len(transfers)} transfers.",
+            accepted=sum(accepted),
+            transfers=len(transfers),
+            fees=total_fees,
+        )
+        return accepted
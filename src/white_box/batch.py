@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+
+"""
+NumPy batch variants of the white-box validators.
+"""
+import os
+
+import numpy as np
+
+from .validators import (
+    _DAYS_IN_MONTH,
+    CARD_MAX_LENGTH,
+    CARD_MIN_LENGTH,
+    CELSIUS_MAX,
+    CELSIUS_MIN,
+    DATE_BAD_DAY,
+    DATE_BAD_FORMAT,
+    DATE_BAD_MONTH,
+    DATE_BAD_YEAR,
+    DATE_MAX_YEAR,
+    DATE_MIN_YEAR,
+    DATE_OK,
+    FILE_SIZE_LIMIT,
+    _is_leap_year,
+)
+
+
+def _buffer_array(buffer, dtype):
+    """
+    Wraps any object supporting the buffer protocol in an array without
+    copying it. The dtype is needed for untyped buffers such as mmap.
+    """
+    if dtype is None:
+        return np.asarray(buffer)
+    return np.frombuffer(buffer, dtype=dtype)
+
+
+def _mask_array(buffer):
+    """
+    Wraps a mask buffer of one byte per sample (bytearray, array.array("b"),
+    memoryview...) in a boolean array without copying it.
+    """
+    mask = np.asarray(buffer)
+    if mask.dtype != bool:
+        if mask.dtype.itemsize != 1:
+            raise ValueError("mask must have one byte per sample")
+        mask = mask.view(bool)
+    return mask
+
+
+def celsius_to_fahrenheit_many(celsius, out=None, mask=None, fill=np.nan, dtype=None):
+    """
+    Converts a buffer of temperatures (array.array, memoryview, mmap, NumPy
+    array...) from Celsius to Fahrenheit, writing into the out buffer if one
+    is given, which may be the input itself.
+    Out-of-range samples are flagged in the mask buffer (one boolean byte
+    per sample) if one is given, and set to fill in the output unless fill
+    is None.
+    Returns the output array.
+    """
+    celsius = _buffer_array(celsius, dtype)
+    if out is None:
+        out = np.empty(celsius.shape, np.result_type(celsius.dtype, np.float32))
+    else:
+        out = _buffer_array(out, dtype)
+    if out.shape != celsius.shape:
+        raise ValueError("out must have as many samples as the input")
+
+    # The range check runs first, since out may be the input
+    invalid = None
+    if mask is not None or fill is not None:
+        invalid = np.empty(celsius.shape, bool) if mask is None else _mask_array(mask)
+        np.less(celsius, CELSIUS_MIN, out=invalid)
+        invalid |= ~(celsius <= CELSIUS_MAX)  # Also catches NaN samples
+
+    # Same operation order as celsius_to_fahrenheit
+    np.multiply(celsius, 9, out=out)
+    np.divide(out, 5, out=out)
+    np.add(out, 32, out=out)
+
+    if fill is not None:
+        np.copyto(out, fill, where=invalid)
+
+    return out
+
+
+def convert_celsius_file(
+    source, destination, dtype=np.float32, chunk_size=1 << 20, fill=np.nan
+):
+    """
+    Converts a file of raw Celsius samples into a file of Fahrenheit samples
+    of the same dtype, memory-mapping both and working in chunks of samples
+    so memory use stays bounded. Out-of-range samples are set to fill.
+    Returns the number of out-of-range samples.
+    """
+    if os.path.getsize(source) == 0:
+        with open(destination, "wb"):
+            return 0  # Empty files cannot be mapped
+
+    samples = np.memmap(source, dtype=dtype, mode="r")
+    converted = np.memmap(destination, dtype=dtype, mode="w+", shape=samples.shape)
+    mask = np.empty(min(chunk_size, len(samples)), bool)
+    invalid = 0
+    for start in range(0, len(samples), chunk_size):
+        chunk = samples[start : start + chunk_size]
+        chunk_mask = mask[: len(chunk)]
+        celsius_to_fahrenheit_many(
+            chunk, converted[start : start + len(chunk)], chunk_mask, fill
+        )
+        invalid += int(np.count_nonzero(chunk_mask))
+
+    converted.flush()
+    del converted
+    return invalid
+
+
+# Luhn value of a digit in a doubled position, padded to 256 entries so any
+# uint8 can be looked up (non-digits are rejected separately)
+_LUHN_DOUBLED = np.zeros(256, dtype=np.uint8)
+_LUHN_DOUBLED[:10] = [0, 2, 4, 6, 8, 1, 3, 5, 7, 9]
+
+
+def validate_credit_cards(card_numbers, luhn=True, labels=False):
+    """
+    Validates a batch of credit card numbers with array operations.
+    The numbers are loaded into a fixed-width uint8 digit matrix on which the
+    length, digit and (optionally) Luhn checksum checks run column-wise.
+    Returns a boolean mask, or "Valid Card"/"Invalid Card" labels if requested.
+    """
+    cards = np.asarray(card_numbers, dtype=str).ravel()
+    lengths = np.char.str_len(cards)
+    valid = (lengths >= CARD_MIN_LENGTH) & (lengths <= CARD_MAX_LENGTH)
+    valid &= np.char.isdigit(cards)
+
+    if luhn:
+        # Unicode strings are stored as UCS-4, so the code points can be read
+        # in place; only the first CARD_MAX_LENGTH columns can hold valid data.
+        width = cards.dtype.itemsize // 4
+        codes = cards.view(np.uint32).reshape(len(cards), width)
+        codes = codes[:, :CARD_MAX_LENGTH]
+        ascii_digits = (codes >= 48) & (codes <= 57)
+        digits = (codes - 48).astype(np.uint8)
+
+        # Counting from the last digit, every second digit is doubled: column j
+        # of a number of length n is doubled when n and j have the same parity.
+        columns = np.arange(codes.shape[1])
+        in_number = columns < lengths[:, None]
+        doubled = in_number & ((columns % 2 == 1) == (lengths % 2 == 1)[:, None])
+        digits = np.where(doubled, _LUHN_DOUBLED[digits], digits)
+        checksums = np.where(in_number, digits, 0).sum(axis=1, dtype=np.uint16)
+
+        valid &= np.all(ascii_digits == in_number, axis=1)
+        valid &= checksums % 10 == 0
+
+    if labels:
+        return np.where(valid, "Valid Card", "Invalid Card")
+
+    return valid
+
+
+_DAYS_IN_MONTH_TABLE = np.array(_DAYS_IN_MONTH, dtype=np.uint8)
+
+# Positions of the digits of a YYYY-MM-DD date and their place values
+_ISO_DATE_LENGTH = 10
+_ISO_DATE_DIGITS = [0, 1, 2, 3, 5, 6, 8, 9]
+_ISO_DATE_DASHES = [4, 7]
+_ISO_DATE_PLACES = np.array(
+    [
+        [1000, 100, 10, 1, 0, 0, 0, 0],
+        [0, 0, 0, 0, 10, 1, 0, 0],
+        [0, 0, 0, 0, 0, 0, 10, 1],
+    ],
+    dtype=np.int32,
+).T
+
+
+def _date_field(values):
+    """
+    Returns a column of date fields as int64, with a mask of the rows that
+    hold an integer: NaN (a missing cell), infinite and fractional floats
+    don't, and are zero in the column.
+    """
+    values = np.asarray(values).ravel()
+    if values.dtype.kind in "biu":
+        return values.astype(np.int64, copy=False), np.ones(len(values), dtype=bool)
+
+    values = values.astype(np.float64)
+    integral = np.isfinite(values) & (values == np.floor(values))
+    # Clipped so that the cast is defined; such values fail the range checks
+    fields = np.clip(np.where(integral, values, 0), -(2.0**62), 2.0**62)
+    return fields.astype(np.int64), integral
+
+
+def validate_dates(years, months, days, min_year=DATE_MIN_YEAR, max_year=DATE_MAX_YEAR):
+    """
+    Validates a batch of dates given as year, month and day arrays.
+    Returns a boolean mask and a uint8 array with the DATE_* reason code of
+    every row: DATE_BAD_FORMAT for a field that isn't an integer (NaN or a
+    fractional float), else the first of the year, month and day checks
+    that failed.
+    """
+    years, integral_years = _date_field(years)
+    months, integral_months = _date_field(months)
+    days, integral_days = _date_field(days)
+    if not len(years) == len(months) == len(days):
+        raise ValueError("years, months and days must have the same length")
+
+    valid_years = (years >= min_year) & (years <= max_year)
+    valid_months = (months >= 1) & (months <= 12)
+    # Invalid months are looked up as month 0, which has no days
+    month_days = _DAYS_IN_MONTH_TABLE[
+        _is_leap_year(years).view(np.uint8), np.where(valid_months, months, 0)
+    ]
+    valid_days = (days >= 1) & (days <= month_days)
+
+    well_formed = integral_years & integral_months & integral_days
+    reasons = np.select(
+        [~well_formed, ~valid_years, ~valid_months, ~valid_days],
+        [DATE_BAD_FORMAT, DATE_BAD_YEAR, DATE_BAD_MONTH, DATE_BAD_DAY],
+        DATE_OK,
+    ).astype(np.uint8)
+    return reasons == DATE_OK, reasons
+
+
+def parse_iso_dates(dates):
+    """
+    Parses a column of YYYY-MM-DD strings (str or bytes) in bulk, reading
+    the characters in place from a fixed-width array.
+    Returns year, month and day arrays, zero on badly formatted rows, and a
+    boolean mask of the well-formed rows.
+    """
+    dates = np.asarray(dates).ravel()
+    if dates.dtype.kind not in "SU":
+        dates = dates.astype(str)
+
+    # Unicode strings are stored as UCS-4 and byte strings as single bytes
+    code_type = np.uint32 if dates.dtype.kind == "U" else np.uint8
+    width = dates.dtype.itemsize // np.dtype(code_type).itemsize
+    if width < _ISO_DATE_LENGTH:
+        zeros = np.zeros(len(dates), dtype=np.int32)
+        return zeros, zeros, zeros, np.zeros(len(dates), dtype=bool)
+
+    codes = dates.view(code_type).reshape(len(dates), width)
+    digits = codes[:, _ISO_DATE_DIGITS].astype(np.int32) - 48
+    well_formed = np.all((digits >= 0) & (digits <= 9), axis=1)
+    well_formed &= np.all(codes[:, _ISO_DATE_DASHES] == ord("-"), axis=1)
+    if width > _ISO_DATE_LENGTH:
+        # Shorter strings are padded with nulls
+        well_formed &= codes[:, _ISO_DATE_LENGTH] == 0
+
+    fields = digits @ _ISO_DATE_PLACES
+    fields[~well_formed] = 0
+    return fields[:, 0], fields[:, 1], fields[:, 2], well_formed
+
+
+def validate_iso_dates(dates, min_year=DATE_MIN_YEAR, max_year=DATE_MAX_YEAR):
+    """
+    Validates a column of YYYY-MM-DD strings in bulk.
+    Returns a boolean mask and the DATE_* reason code of every row, as
+    validate_dates does, with DATE_BAD_FORMAT for rows that do not parse.
+    """
+    years, months, days, well_formed = parse_iso_dates(dates)
+    valid, reasons = validate_dates(years, months, days, min_year, max_year)
+    reasons[~well_formed] = DATE_BAD_FORMAT
+    return valid & well_formed, reasons
+
+
+def check_file_sizes(sizes, limit=FILE_SIZE_LIMIT):
+    """
+    Checks a batch of file sizes at once. Returns a boolean mask.
+    """
+    sizes = np.asarray(sizes)
+    if sizes.dtype.kind not in "iuf":
+        sizes = sizes.astype(np.float64)
+    return (sizes >= 0) & (sizes <= limit)
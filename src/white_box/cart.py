@@ -0,0 +1,379 @@
+# -*- coding: utf-8 -*-
+
+"""
+Products and shopping cart of the white-box examples.
+"""
+import math
+from collections import Counter
+from collections.abc import MutableSequence, Sequence
+
+from ..events import default_sink
+
+
+# 28
+class Product:  # pylint: disable=too-few-public-methods
+    """
+    Product class.
+    """
+
+    def __init__(self, name, price):
+        """
+        Set the product details.
+        """
+        self.name = name
+        self.price = price
+
+    def view_product(self):
+        """
+        Function to display the product details.
+        """
+        msg = f"The product {self.name} has a price of {self.price}"
+        print(msg)
+        return msg
+
+
+# Totals are kept as integers in units of 2**-1127: the smallest float is
+# 2**-1074 and its 53-bit mantissa scales to an integer too, so every float
+# price is an exact number of units
+_UNIT_BITS = 1127
+
+
+def _units(amount):
+    """
+    Converts a finite amount to an integer number of units, exactly for ints
+    and floats and rounded down otherwise (e.g. for a Decimal).
+    """
+    if isinstance(amount, float):
+        mantissa, exponent = math.frexp(amount)
+        return int(mantissa * 2.0**53) << (exponent + 1074)
+    numerator, denominator = amount.as_integer_ratio()
+    return (numerator << _UNIT_BITS) // denominator
+
+
+class _CartItem(dict):
+    """
+    Item of a shopping cart: a dict that keeps the cart total up to date when
+    it is changed in place. Copies and pickles of it are plain dicts.
+    """
+
+    __slots__ = ("cart", "units", "kind")
+
+    def __init__(self, item):
+        """
+        Copies the item into a dict that no cart counts yet.
+        """
+        super().__init__(item)
+        self.cart = None
+        self.units = 0  # Price counted in the cart total, in units
+        self.kind = 0  # How it was counted, see ShoppingCart._count
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+    def __setitem__(self, key, value):
+        self._change(dict.__setitem__, key, value)
+
+    def __delitem__(self, key):
+        self._change(dict.__delitem__, key)
+
+    def __ior__(self, other):
+        self._change(dict.update, other)
+        return self
+
+    def update(self, *args, **kwargs):
+        self._change(lambda item: dict.update(item, *args, **kwargs))
+
+    def pop(self, *args):
+        return self._change(dict.pop, *args)
+
+    def popitem(self):
+        return self._change(dict.popitem)
+
+    def setdefault(self, *args):
+        return self._change(dict.setdefault, *args)
+
+    def clear(self):
+        self._change(dict.clear)
+
+    def _change(self, method, *args):
+        """
+        Applies a dict method, then counts the new price of the item in the
+        cart total instead of the old one.
+        """
+        result = method(self, *args)
+        if self.cart is not None:
+            self.cart._recount(self)  # pylint: disable=protected-access
+        return result
+
+
+class _CartItems(MutableSequence):
+    """
+    Live list view of the items of a shopping cart, in the order they were
+    added. Changing it changes the cart; every item must be for a different
+    product. Items added through the view are copied.
+    """
+
+    def __init__(self, cart):
+        """
+        Wraps the cart.
+        """
+        self._cart = cart
+
+    def __len__(self):
+        """
+        Returns the number of items.
+        """
+        return len(self._items())
+
+    def __iter__(self):
+        """
+        Iterates over the items.
+        """
+        return iter(self._items())
+
+    def __reversed__(self):
+        """
+        Iterates over the items from the last one added.
+        """
+        return reversed(self._items())
+
+    def __contains__(self, item):
+        """
+        Whether an item is in the cart.
+        """
+        return item in self._items()
+
+    def __getitem__(self, index):
+        """
+        Returns the item (or list of items) at the index (or slice).
+        """
+        return list(self._items())[index]
+
+    def __setitem__(self, index, item):
+        """
+        Replaces the item (or items) at the index (or slice).
+        """
+        items = list(self._items())
+        items[index] = item
+        self._cart.items = items
+
+    def __delitem__(self, index):
+        """
+        Removes the item (or items) at the index (or slice).
+        """
+        items = list(self._items())
+        del items[index]
+        self._cart.items = items
+
+    def __eq__(self, other):
+        """
+        Compares the items with another sequence, as a list would.
+        """
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return list(self._items()) == list(other)
+
+    def __repr__(self):
+        """
+        Shows the items as a list.
+        """
+        return repr(list(self._items()))
+
+    def index(self, value, start=0, stop=None):
+        """
+        Returns the index of the first occurrence of an item.
+        """
+        items = list(self._items())
+        return items.index(value, start, len(items) if stop is None else stop)
+
+    def insert(self, index, value):
+        """
+        Inserts an item before the index; appending is O(1).
+        """
+        if index >= len(self):
+            self._cart._add_item(value)  # pylint: disable=protected-access
+            return
+
+        items = list(self._items())
+        items.insert(index, value)
+        self._cart.items = items
+
+    def clear(self):
+        """
+        Removes every item.
+        """
+        self._cart.items = []
+
+    def _items(self):
+        """
+        Returns the items of the cart index.
+        """
+        return self._cart._index.values()  # pylint: disable=protected-access
+
+
+class ShoppingCart:
+    """
+    Shopping cart class.
+    Items are indexed by product and the total is kept up to date on every
+    change, so adding and removing products and checking out are O(1)
+    operations. The total is summed exactly, in integer units, so it carries
+    no rounding residue from earlier changes. Item dicts changed in place update
+    it too; prices are read when an item changes.
+    """
+
+    def __init__(self, sink=None):
+        """
+        Initialize the shopping cart.
+        Messages go to the given event sink, printed by default.
+        """
+        self._index = {}  # product -> item, in insertion order
+        self._total = 0  # Exact sum of the finite item prices, in units
+        self._inexact = 0  # Number of items with a non-integer price
+        self._non_finite = Counter()  # Infinite or NaN item prices
+        self.sink = default_sink if sink is None else sink
+
+    @property
+    def items(self):
+        """
+        Live list view of the cart items, in the order they were added.
+        """
+        return _CartItems(self)
+
+    @items.setter
+    def items(self, items):
+        """
+        Replaces the cart items.
+        """
+        index = {}
+        for item in items:
+            if item["product"] in index:
+                raise ValueError(f"{item['product'].name} is already in the cart")
+            if not (isinstance(item, _CartItem) and item.cart is self):
+                item = _CartItem(item)
+            index[item["product"]] = item
+
+        for item in self._index.values():
+            item.cart = None
+        self._index = {}
+        self._total, self._inexact = 0, 0
+        self._non_finite.clear()
+        for item in index.values():
+            self._add_item(item)
+
+    @property
+    def total(self):
+        """
+        Total price of the cart.
+        """
+        if not self._inexact:
+            return self._total >> _UNIT_BITS
+        try:
+            total = self._total / (1 << _UNIT_BITS)  # Correctly rounded
+        except OverflowError:
+            total = math.copysign(math.inf, self._total)
+        return total + sum(
+            amount for amount, count in self._non_finite.items() if count
+        )
+
+    def add_product(self, product, quantity=1):
+        """
+        Function to add a product to the shopping cart.
+        """
+        item = self._index.get(product)
+        if item is None:
+            self._add_item({"product": product, "quantity": quantity})
+        else:
+            dict.__setitem__(item, "quantity", item["quantity"] + quantity)
+            self._recount(item)
+
+    def remove_product(self, product, quantity=1):
+        """
+        Function to remove a product from the shopping cart.
+        """
+        item = self._index.get(product)
+        if item is None:
+            return
+
+        if item["quantity"] <= quantity:
+            del self._index[product]
+            self._uncount(item)
+            item.cart = None
+        else:
+            dict.__setitem__(item, "quantity", item["quantity"] - quantity)
+            self._recount(item)
+
+    def view_cart(self):
+        """
+        Function to display the shopping cart content.
+        """
+        for item in self._index.values():
+            product, quantity = item["product"], item["quantity"]
+            self.sink.emit(
+                "cart_item",
+                f"{quantity} x {product.name} - ${product.price * quantity}",
+                product=product.name,
+                quantity=quantity,
+                price=product.price,
+            )
+
+    def checkout(self):
+        """
+        Function to checkout the items from the shopping cart.
+        """
+        total = self.total
+        self.sink.emit("checkout_total", f"Total: ${total}", total=total)
+        self.sink.emit(
+            "checkout_completed", "Checkout completed. Thank you for shopping!"
+        )
+
+    def _add_item(self, item):
+        """
+        Adds an item for a product that is not in the cart yet.
+        """
+        if item["product"] in self._index:
+            raise ValueError(f"{item['product'].name} is already in the cart")
+        if not (isinstance(item, _CartItem) and item.cart is None):
+            item = _CartItem(item)
+        item.cart = self
+        self._index[item["product"]] = item
+        self._count(item)
+
+    def _count(self, item):
+        """
+        Adds the price of an item to the total. Its kind is 0 for an integer
+        price, 1 for another finite price and the price itself otherwise.
+        """
+        try:
+            amount = item["product"].price * item["quantity"]
+        except KeyError:
+            amount = 0  # Not a complete item yet
+        if isinstance(amount, int):
+            units, kind = amount << _UNIT_BITS, 0
+        elif math.isfinite(amount):
+            units, kind = _units(amount), 1
+        else:
+            units, kind = 0, math.nan if math.isnan(amount) else amount
+            self._non_finite[kind] += 1
+
+        if kind:
+            self._inexact += 1
+        item.units, item.kind = units, kind
+        self._total += units
+
+    def _uncount(self, item):
+        """
+        Subtracts the price counted for an item from the total.
+        """
+        self._total -= item.units
+        if item.kind:
+            self._inexact -= 1
+            if item.kind != 1:
+                self._non_finite[item.kind] -= 1
+
+    def _recount(self, item):
+        """
+        Counts the current price of an item in the total instead of the one
+        counted before.
+        """
+        self._uncount(item)
+        self._count(item)
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+"""
+State machines of the white-box examples.
+"""
+from ..state_machine import MachineSpec, StateMachine
+
+
+# 22
+class VendingMachine(StateMachine):  # pylint: disable=too-few-public-methods
+    """
+    A simple vending machine that dispenses drinks.
+    It has two states: "Ready" and "Dispensing."
+    """
+
+    __slots__ = ()
+    spec = MachineSpec(
+        states=["Ready", "Dispensing"],
+        transitions={
+            "insert_coin": {
+                "Ready": ("Dispensing", "Coin Inserted. Select your drink.")
+            },
+            "select_drink": {"Dispensing": ("Ready", "Drink Dispensed. Thank you!")},
+        },
+        invalid="Invalid operation in current state.",
+    )
+
+    insert_coin = spec.event_method(
+        "insert_coin", "Function called when a coin is inserted."
+    )
+    select_drink = spec.event_method(
+        "select_drink", "Function called after selecting a drink."
+    )
+
+
+# 23
+class TrafficLight(StateMachine):
+    """
+    A traffic light system with three states: "Green," "Yellow," and "Red."
+    """
+
+    __slots__ = ()
+    spec = MachineSpec(
+        states=["Red", "Green", "Yellow"],
+        transitions={
+            "change_state": {
+                "Red": ("Green", None),
+                "Green": ("Yellow", None),
+                "Yellow": ("Red", None),
+            },
+        },
+    )
+
+    change_state = spec.event_method(
+        "change_state", "Function that changes the traffic light state."
+    )
+
+    def get_current_state(self):
+        """
+        Provides the current traffic light state.
+        """
+        return self.state
+
+
+# 24
+class UserAuthentication(StateMachine):
+    """
+    A user authentication system with states "Logged Out" and "Logged In."
+    If a session store is given, the user's state is kept in the store
+    instead, under the given username, and expires with its session.
+    """
+
+    __slots__ = ("username", "store")
+    spec = MachineSpec(
+        states=["Logged Out", "Logged In"],
+        transitions={
+            "login": {"Logged Out": ("Logged In", "Login successful")},
+            "logout": {"Logged In": ("Logged Out", "Logout successful")},
+        },
+        invalid="Invalid operation in current state",
+    )
+
+    _login = spec.event_method("login")
+    _logout = spec.event_method("logout")
+
+    def __init__(self, username=None, store=None):
+        """
+        Defines the user initial state.
+        """
+        super().__init__()
+        self.username = username
+        self.store = store
+
+    @property
+    def state(self):
+        """
+        Name of the current state.
+        """
+        if self.store is not None:
+            return "Logged In" if self.username in self.store else "Logged Out"
+        return self.spec.states[self.code]
+
+    @state.setter
+    def state(self, state):
+        """
+        Sets the current state by name.
+        """
+        self.code = self.spec.encode(state)
+
+    def login(self):
+        """
+        Function to login a user.
+        """
+        if self.store is not None:
+            # The store tells atomically whether the user was logged out
+            logged_out = self.store.login(self.username)
+            self.state = "Logged Out" if logged_out else "Logged In"
+        return self._login()
+
+    def logout(self):
+        """
+        Function to logout a user.
+        """
+        if self.store is not None:
+            logged_in = self.store.logout(self.username)
+            self.state = "Logged In" if logged_in else "Logged Out"
+        return self._logout()
+
+
+# 25
+class DocumentEditingSystem(StateMachine):  # pylint: disable=too-few-public-methods
+    """
+    A document editing system with states "Editing" and "Saved."
+    """
+
+    __slots__ = ()
+    spec = MachineSpec(
+        states=["Editing", "Saved"],
+        transitions={
+            "save_document": {"Editing": ("Saved", "Document saved successfully")},
+            "edit_document": {"Saved": ("Editing", "Editing resumed")},
+        },
+        invalid="Invalid operation in current state",
+    )
+
+    save_document = spec.event_method("save_document", "Function to save a document.")
+    edit_document = spec.event_method("edit_document", "Function to edit a document.")
+
+
+# 26
+class ElevatorSystem(StateMachine):  # pylint: disable=too-few-public-methods
+    """
+    An elevator system with states "Idle," "Moving Up," and "Moving Down."
+    """
+
+    __slots__ = ()
+    spec = MachineSpec(
+        states=["Idle", "Moving Up", "Moving Down"],
+        transitions={
+            "move_up": {"Idle": ("Moving Up", "Elevator moving up")},
+            "move_down": {"Idle": ("Moving Down", "Elevator moving down")},
+            "stop": {
+                "Moving Up": ("Idle", "Elevator stopped"),
+                "Moving Down": ("Idle", "Elevator stopped"),
+            },
+        },
+        invalid="Invalid operation in current state",
+    )
+
+    move_up = spec.event_method("move_up", "Function to move up the elevator.")
+    move_down = spec.event_method("move_down", "Function to move down the elevator.")
+    stop = spec.event_method("stop", "Function to stop the elevator.")
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+"""
+Discount, order total, category and shipping pricing of the white-box
+examples.
+"""
+import math
+
+import numpy as np
+
+from ..intervals import IntervalTable
+from ..rate_card import RateCard, ShippingQuoter
+
+# 3
+TOTAL_DISCOUNT_RATES = IntervalTable(
+    [
+        (-math.inf, 100, 0),
+        (100, 500, 0.1, "both"),
+        (500, math.inf, 0.2, "right"),
+    ],
+    default=0.2,  # NaN, which fails every comparison of the original code
+)
+
+
+def calculate_total_discount(total_amount):
+    """
+    Calculates the discount for a customer's purchase based on the total amount.
+    """
+    rate = TOTAL_DISCOUNT_RATES.lookup(total_amount)
+    if not rate:
+        return 0
+
+    return rate * total_amount
+
+
+# 4
+def calculate_order_total(items):
+    """
+    Processes user orders in an e-commerce system.
+    The function calculates the total price of the items in the order,
+    applying different discounts based on the quantity of each item.
+    """
+    total_price = 0
+
+    for item in items:
+        quantity = item["quantity"]
+        price_per_item = item["price"]
+
+        # Apply discounts based on quantity
+        if 1 <= quantity <= 5:
+            total_price += quantity * price_per_item
+        elif 6 <= quantity <= 10:
+            total_price += 0.95 * quantity * price_per_item  # 5% discount
+        else:
+            total_price += 0.9 * quantity * price_per_item  # 10% discount
+
+    return total_price
+
+
+def calculate_order_totals(order_ids, quantities, prices):
+    """
+    Columnar variant of calculate_order_total for large batches of line items.
+    The three columns can be NumPy arrays or any object supporting the buffer
+    protocol. Returns the sorted unique order ids and the total of each order,
+    computed with the same discount tiers and summation order as the scalar
+    function so that results match it exactly.
+    """
+    order_ids = np.asarray(order_ids)
+    quantities = np.asarray(quantities)
+    prices = np.asarray(prices, dtype=np.float64)
+
+    if not order_ids.shape == quantities.shape == prices.shape:
+        raise ValueError("Columns must have the same length")
+
+    # Apply discounts based on quantity
+    factors = np.full(quantities.shape, 0.9)  # 10% discount
+    factors[(quantities >= 6) & (quantities <= 10)] = 0.95  # 5% discount
+    factors[(quantities >= 1) & (quantities <= 5)] = 1.0
+    line_totals = factors * quantities * prices
+
+    # bincount accumulates each order in input order, like the scalar loop
+    unique_ids, groups = np.unique(order_ids, return_inverse=True)
+    totals = np.bincount(groups.ravel(), weights=line_totals, minlength=len(unique_ids))
+    return unique_ids, totals
+
+
+# 5
+SHIPPING_QUOTER = ShippingQuoter(
+    RateCard(
+        weight_limits=[5, 10],
+        methods={"standard": [10, 15, 20], "express": [20, 30, 40]},
+        package_classes=[
+            {"cost": 5, "weight": (None, 1), "side": (None, 10)},
+            {"cost": 10, "weight": (1, 5), "side": (11, 30)},
+        ],
+        package_default=20,
+    )
+)
+
+
+def calculate_items_shipping_cost(items, shipping_method):
+    """
+    Calculates shipping costs for an online shopping system.
+    The function calculates shipping costs based on the total weight of the
+    items in the order and the shipping method chosen by the customer.
+    """
+    total_weight = sum(item["weight"] for item in items)
+    return SHIPPING_QUOTER.quote(total_weight, shipping_method)
+
+
+# 8
+PRODUCT_CATEGORIES = IntervalTable(
+    [
+        (10, 51, "Category A"),
+        (51, 101, "Category B"),
+        (101, 200, "Category C", "both"),
+    ],
+    default="Category D",
+)
+
+
+def categorize_product(price):
+    """
+    Determines the price category of a product based on its price.
+    """
+    return PRODUCT_CATEGORIES.lookup(price)
+
+
+# 15
+QUANTITY_DISCOUNTS = IntervalTable(
+    [
+        (1, 5, "No Discount", "both"),
+        # Fractional quantities between the tiers, as in calculate_order_total
+        (5, 6, "10% Discount", "neither"),
+        (6, 10, "5% Discount", "both"),
+    ],
+    default="10% Discount",
+)
+
+
+def calculate_quantity_discount(quantity):
+    """
+    Calculates discounts based on the quantity of a product.
+    """
+    return QUANTITY_DISCOUNTS.lookup(quantity)
+
+
+# 18
+def calculate_shipping_cost(weight, length, width, height):
+    """
+    Calculates the shipping cost based on the package weight and dimensions.
+    """
+    return SHIPPING_QUOTER.package_cost(weight, length, width, height)
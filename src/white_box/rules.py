@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+"""
+Eligibility and advisory rules of the white-box examples, as decision
+tables.
+"""
+from ..decision import DecisionTable
+
+# 13
+FLIGHT_RULES = DecisionTable(
+    ["age", "frequent_flyer"],
+    [
+        ({"age": (18, 65, "both")}, "Eligible to Book"),
+        ({"frequent_flyer": True}, "Eligible to Book"),
+    ],
+    default="Not Eligible to Book",
+)
+
+
+check_flight_eligibility = FLIGHT_RULES.function(
+    "check_flight_eligibility",
+    "Checks the eligibility of a passenger to book a flight.",
+    __name__,
+)
+
+
+# 17
+LOAN_RULES = DecisionTable(
+    ["income", "credit_score"],
+    [
+        ({"income": (None, 30000)}, "Not Eligible"),
+        (
+            {"income": (30000, 60000, "both"), "credit_score": (700, None, "neither")},
+            "Standard Loan",
+        ),
+        ({"income": (30000, 60000, "both")}, "Secured Loan"),
+        ({"credit_score": (750, None, "neither")}, "Premium Loan"),
+    ],
+    default="Standard Loan",
+)
+
+
+check_loan_eligibility = LOAN_RULES.function(
+    "check_loan_eligibility",
+    "Checks if and which loan can be granted based on the income and credit score.",
+    __name__,
+)
+
+
+# 19
+QUIZ_RULES = DecisionTable(
+    ["correct_answers", "incorrect_answers"],
+    [
+        (
+            {"correct_answers": (7, None), "incorrect_answers": (None, 2, "right")},
+            "Pass",
+        ),
+        (
+            {"correct_answers": (5, None), "incorrect_answers": (None, 3, "right")},
+            "Conditional Pass",
+        ),
+    ],
+    default="Fail",
+)
+
+
+grade_quiz = QUIZ_RULES.function(
+    "grade_quiz",
+    "Grades online quizzes based on the number of correct and incorrect answers.",
+    __name__,
+)
+
+
+# 21
+WEATHER_RULES = DecisionTable(
+    ["temperature", "humidity"],
+    [
+        (
+            {"temperature": (30, None, "neither"), "humidity": (70, None, "neither")},
+            "High Temperature and Humidity. Stay Hydrated.",
+        ),
+        ({"temperature": (None, 0)}, "Low Temperature. Bundle Up!"),
+    ],
+    default="No Specific Advisory",
+)
+
+
+get_weather_advisory = WEATHER_RULES.function(
+    "get_weather_advisory",
+    "Provides weather advisories based on temperature and humidity.",
+    __name__,
+)
@@ -0,0 +1,387 @@
+# -*- coding: utf-8 -*-
+
+"""
+Scalar validators and classifiers of the white-box examples.
+
+Importing them loads neither NumPy nor re, so that scripts validating a
+few values start quickly: the batch variants live in the batch module and
+the URL patterns are compiled on first use.
+"""
+import math
+import mmap
+import os
+
+from ..intervals import IntervalTable
+
+
+def is_even(num):
+    """
+    Checks if a number is even.
+    """
+    return num % 2 == 0
+
+
+def divide(a, b):
+    """
+    Simple division function.
+    """
+    result = 0
+    if b != 0:
+        result = a / b
+    return result
+
+
+GRADES = IntervalTable(
+    [
+        (-math.inf, 70, "F"),
+        (70, 80, "C"),
+        (80, 90, "B"),
+        (90, math.inf, "A", "both"),
+    ],
+    default="F",  # NaN, which fails every comparison of the original code
+)
+
+
+def get_grade(score):
+    """
+    Grade function.
+    """
+    return GRADES.lookup(score)
+
+
+def is_triangle(a, b, c):
+    """
+    Determines if 3 numbers can form a triangle.
+    """
+    if a + b > c and a + c > b and b + c > a:
+        return "Yes, it's a triangle!"
+
+    return "No, it's not a triangle."
+
+
+# 1
+def check_number_status(number):
+    """
+    Checks if a given number is positive, negative, or zero.
+    """
+    if number > 0:
+        return "Positive"
+
+    if number < 0:
+        return "Negative"
+
+    return "Zero"
+
+
+# 2
+PASSWORD_MIN_LENGTH = 8
+PASSWORD_SPECIAL_CHARS = "!@#$%&"
+PASSWORD_RULES = ("length", "uppercase", "lowercase", "digit", "special")
+
+# Maps every character of interest to the initial of its character class, so
+# a single str.translate call classifies the whole password.
+# The letters are spelled out as the string module would import re.
+_PASSWORD_CLASSES = str.maketrans(
+    {
+        **dict.fromkeys("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "U"),
+        **dict.fromkeys("abcdefghijklmnopqrstuvwxyz", "L"),
+        **dict.fromkeys("0123456789", "D"),
+        **dict.fromkeys(PASSWORD_SPECIAL_CHARS, "S"),
+    }
+)
+_PASSWORD_CLASS_RULES = (("U", "uppercase"), ("L", "lowercase"), ("D", "digit"))
+
+
+def _password_classes(password):
+    """
+    Classifies every character of the password in a single pass and returns
+    the set of character classes found.
+    """
+    classes = set(password.translate(_PASSWORD_CLASSES))
+    # Like re's \d, non-ASCII decimal digits count as digits too.
+    if "D" not in classes and not password.isascii():
+        if any(char.isdecimal() for char in password):
+            classes.add("D")
+    return classes
+
+
+def password_failures(password):
+    """
+    Returns the names of the password rules the given password breaks.
+    """
+    failures = []
+    if len(password) < PASSWORD_MIN_LENGTH:
+        failures.append("length")
+
+    classes = _password_classes(password)
+    for char_class, rule in _PASSWORD_CLASS_RULES:
+        if char_class not in classes:
+            failures.append(rule)
+    if "S" not in classes:
+        failures.append("special")
+
+    return failures
+
+
+def validate_password(password):
+    """
+    Validates user passwords.
+    """
+    # Check length
+    if len(password) < PASSWORD_MIN_LENGTH:
+        return False
+
+    # Check for at least one uppercase letter, one lowercase letter,
+    # one digit, and one special character.
+    return {"U", "L", "D", "S"} <= _password_classes(password)
+
+
+def validate_passwords(passwords, failures=None):
+    """
+    Validates a stream of passwords, yielding one result per password.
+    When a failures mapping (e.g. a collections.Counter) is given, the
+    number of passwords breaking each rule is accumulated into it.
+    """
+    if failures is None:
+        for password in passwords:
+            yield validate_password(password)
+        return
+
+    for rule in PASSWORD_RULES:
+        failures.setdefault(rule, 0)
+
+    for password in passwords:
+        broken = password_failures(password)
+        for rule in broken:
+            failures[rule] += 1
+        yield not broken
+
+
+# 6
+def validate_login(username, password):
+    """
+    Validates user login credentials.
+    """
+    if 5 <= len(username) <= 20 and 8 <= len(password) <= 15:
+        return "Login Successful"
+
+    return "Login Failed"
+
+
+# 7
+def verify_age(age):
+    """
+    Determines whether a person is eligible for a certain service based on their age.
+    """
+    if 18 <= age <= 65:
+        return "Eligible"
+
+    return "Not Eligible"
+
+
+# 9
+def validate_email(email):
+    """
+    Validates email addresses.
+    """
+    if 5 <= len(email) <= 50 and "@" in email and "." in email:
+        return "Valid Email"
+
+    return "Invalid Email"
+
+
+# 10
+CELSIUS_MIN = -100
+CELSIUS_MAX = 100
+
+
+def celsius_to_fahrenheit(celsius):
+    """
+    Converts temperatures from Celsius to Fahrenheit.
+    """
+    if CELSIUS_MIN <= celsius <= CELSIUS_MAX:
+        return (celsius * 9 / 5) + 32
+
+    return "Invalid Temperature"
+
+
+# 11
+def validate_credit_card(card_number):
+    """
+    Validates credit card numbers.
+    """
+    if 13 <= len(card_number) <= 16 and card_number.isdigit():
+        return "Valid Card"
+
+    return "Invalid Card"
+
+
+CARD_MIN_LENGTH = 13
+CARD_MAX_LENGTH = 16
+
+
+# 12
+DATE_MIN_YEAR = 1900
+DATE_MAX_YEAR = 2100
+
+# Reason codes of validate_dates, in order of precedence
+DATE_OK, DATE_BAD_FORMAT, DATE_BAD_YEAR, DATE_BAD_MONTH, DATE_BAD_DAY = range(5)
+DATE_REASONS = ("ok", "format", "year", "month", "day")
+
+# Days in each month of a common and of a leap year, month 0 having none
+_DAYS_IN_MONTH = (
+    (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31),
+    (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31),
+)
+
+
+def _is_leap_year(year):
+    """
+    Gregorian leap year rule; works on integers and integer arrays.
+    """
+    return (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+
+
+def validate_date(year, month, day, min_year=DATE_MIN_YEAR, max_year=DATE_MAX_YEAR):
+    """
+    Validates dates.
+    The day must exist in the month of that year, so February 29 is only
+    valid in leap years. Years, months and days must be integral, though
+    not necessarily ints (2.0 is February).
+    """
+    if min_year <= year <= max_year and 1 <= month <= 12:
+        # x % 1 is NaN, not 0, for infinite days
+        if year % 1 == 0 and month % 1 == 0 and day % 1 == 0:
+            if 1 <= day <= _DAYS_IN_MONTH[_is_leap_year(year)][int(month)]:
+                return "Valid Date"
+
+    return "Invalid Date"
+
+
+# 14
+URL_MAX_LENGTH = 255
+URL_RULES = ("length", "scheme", "host", "path")
+
+_URL_SCHEMES = ("http://", "https://")
+_URL_LABEL = r"[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?"
+_URL_AUTHORITY = (
+    r"https?://(?:[^@/?#\s]*@)?"  # Optional user info
+    rf"(?:{_URL_LABEL}(?:\.{_URL_LABEL})*\.?|\[[0-9A-Fa-f:.]+\])"  # Host
+    r"(?::[0-9]{1,5})?"  # Optional port
+)
+_URL_PATTERNS = None  # Full URL and authority patterns, compiled on first use
+
+
+def _url_patterns():
+    """
+    Returns the full URL and authority patterns, compiling them the first
+    time a URL is checked so that only the processes validating URLs
+    import re.
+    """
+    global _URL_PATTERNS  # pylint: disable=global-statement
+
+    if _URL_PATTERNS is None:
+        import re  # pylint: disable=import-outside-toplevel
+
+        # Assigned as a whole, so racing threads never see a partial tuple
+        _URL_PATTERNS = (
+            re.compile(_URL_AUTHORITY + r"(?:[/?#]\S*)?", re.ASCII),
+            re.compile(_URL_AUTHORITY + r"(?:[/?#]|\Z)", re.ASCII),
+        )
+    return _URL_PATTERNS
+
+
+def url_failure(url):
+    """
+    Returns the first rule of URL_RULES that a URL breaks, or None if it is
+    valid. Valid URLs are checked in a single pass of a precompiled pattern.
+    """
+    if len(url) > URL_MAX_LENGTH:
+        return "length"
+    url_pattern, authority_pattern = _url_patterns()
+    if url_pattern.fullmatch(url):
+        return None
+
+    if not url.startswith(_URL_SCHEMES):
+        return "scheme"
+    if authority_pattern.match(url):
+        return "path"
+    return "host"
+
+
+def validate_url(url):
+    """
+    Validates URLs.
+    A valid URL has an http or https scheme, a well-formed host and at most
+    URL_MAX_LENGTH characters.
+    """
+    if url_failure(url) is None:
+        return "Valid URL"
+
+    return "Invalid URL"
+
+
+def validate_urls(urls, failures=None):
+    """
+    Validates a stream of URLs, yielding one result per URL.
+    When a failures mapping (e.g. a collections.Counter) is given, the
+    number of URLs breaking each rule is accumulated into it.
+    """
+    if failures is None:
+        for url in urls:
+            yield url_failure(url) is None
+        return
+
+    for rule in URL_RULES:
+        failures.setdefault(rule, 0)
+
+    for url in urls:
+        broken = url_failure(url)
+        if broken is not None:
+            failures[broken] += 1
+        yield broken is None
+
+
+def read_log_urls(path, field=None, use_mmap=False, encoding="utf-8"):
+    """
+    Reads the URLs of a log file lazily, one per line: the whole line, or
+    its whitespace-separated field of the given index. The file is read line
+    by line, or through a memory map if use_mmap is set.
+    """
+    if use_mmap:
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return  # Empty files cannot be mapped
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for line in iter(mapped.readline, b""):
+                    yield _log_url(line.decode(encoding, "replace"), field)
+        return
+
+    with open(path, encoding=encoding, errors="replace") as file:
+        for line in file:
+            yield _log_url(line, field)
+
+
+def _log_url(line, field):
+    """
+    Extracts the URL of a log line.
+    """
+    if field is None:
+        return line.strip()
+
+    fields = line.split()
+    return fields[field] if -len(fields) <= field < len(fields) else ""
+
+
+# 16
+FILE_SIZE_LIMIT = 1048576  # 1 MB in bytes
+
+
+def check_file_size(size_in_bytes, limit=FILE_SIZE_LIMIT):
+    """
+    Checks if the size is valid for a file.
+    """
+    if 0 <= size_in_bytes <= limit:
+        return "Valid File Size"
+
+    return "Invalid File Size"
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark suite unit tests.
+"""
+import os
+import tempfile
+import unittest
+
+from benchmarks import bench_white_box  # pylint: disable=unused-import
+from benchmarks.suite import (
+    BENCHMARKS,
+    compare,
+    format_groups,
+    load_baseline,
+    run,
+    save_baseline,
+    time_callable,
+    uncovered,
+)
+from src import white_box
+
+
+def result(seconds, items=1, group=None):
+    return {
+        "seconds": seconds,
+        "items": items,
+        "per_item": seconds / items,
+        "group": group,
+    }
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_covers_white_box(self):
+        self.assertEqual(uncovered(white_box), [])
+
+    def test_time_callable(self):
+        calls = []
+        seconds = time_callable(lambda: calls.append(1), repeat=2, min_time=0.001)
+        self.assertGreater(seconds, 0)
+        self.assertGreater(len(calls), 2)
+
+    def test_run(self):
+        results = run(["is_even"], repeat=1, min_time=0.001)
+        self.assertEqual(results["is_even"]["items"], BENCHMARKS["is_even"].items)
+
+    def test_compare(self):
+        baseline = {"a": result(1.0), "b": result(1.0), "c": result(1.0)}
+        results = {"a": result(1.2), "b": result(2.0), "d": result(5.0)}
+        regressions = compare(results, baseline, threshold=0.25)
+        self.assertEqual([regression.name for regression in regressions], ["b"])
+        self.assertAlmostEqual(regressions[0].change, 1.0)
+        self.assertEqual(len(compare(results, baseline, threshold=0.1)), 2)
+
+    def test_baseline_round_trip(self):
+        results = {"a": result(0.5, 10, "group")}
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            save_baseline(path, results)
+            self.assertEqual(load_baseline(path), results)
+
+    def test_groups(self):
+        results = {
+            "scalar": result(1.0, 10, "g"),
+            "batch": result(0.1, 10, "g"),
+            "other": result(1.0),
+        }
+        lines = format_groups(results)
+        self.assertEqual(lines[0], "[g]")
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[2].endswith("10.0x"))
+
+
+if __name__ == "__main__":
+    unittest.main()
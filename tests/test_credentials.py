@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+"""
+Credential store unit tests.
+"""
+import asyncio
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import patch
+
+from src import credentials
+from src.credentials import CredentialStore
+from src.events import MemorySink
+from src.white_box import BankingSystem, authenticate_user
+
+# Cheap hashing parameters for tests
+FAST = {"cost": 1000}
+
+
+class TestCredentialStore(unittest.TestCase):
+    def setUp(self):
+        self.clock_now = 0.0
+        self.store = CredentialStore(clock=lambda: self.clock_now, **FAST)
+        self.store.set_password("alice", "s3cret!")
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_stores_salted_hashes(self):
+        self.store.set_password("bob", "s3cret!")
+        alice, bob = self.store._records["alice"], self.store._records["bob"]
+
+        self.assertNotEqual(alice[0], bob[0])
+        self.assertNotEqual(alice[1], bob[1])
+        self.assertNotIn(b"s3cret!", alice[1])
+
+    def test_verify(self):
+        self.assertTrue(self.store.verify("alice", "s3cret!"))
+        self.assertFalse(self.store.verify("alice", "wrong"))
+        self.assertFalse(self.store.verify("nobody", "s3cret!"))
+
+    def test_unknown_user_is_hashed(self):
+        with patch.object(credentials, "hash_password", return_value=b"") as hashed:
+            self.assertFalse(self.store.verify("nobody", "s3cret!"))
+            self.assertFalse(self.store.verify("nobody", ""))
+            self.assertFalse(
+                asyncio.run(self.store.authenticate_async("nobody", "s3cret!"))
+            )
+            self.assertEqual(hashed.call_count, 3)
+            self.assertEqual(hashed.call_args.args[2:], ("pbkdf2_sha256", 1000))
+        self.assertNotIn("nobody", self.store._cache)
+
+    def test_scrypt(self):
+        store = CredentialStore("scrypt", cost=2**4)
+        store.set_password("alice", "s3cret!")
+        self.assertTrue(store.verify("alice", "s3cret!"))
+        self.assertFalse(store.verify("alice", "wrong"))
+
+    def test_unknown_algorithm(self):
+        with self.assertRaises(ValueError):
+            CredentialStore("md5")
+
+    def test_cache_skips_hashing(self):
+        self.store.verify("alice", "s3cret!")
+        with patch.object(credentials, "hash_password", return_value=b"") as hashed:
+            self.assertTrue(self.store.verify("alice", "s3cret!"))
+            self.assertFalse(self.store.verify("alice", "wrong"))
+            hashed.assert_called_once()
+
+    def test_cache_expires(self):
+        self.store.verify("alice", "s3cret!")
+        self.clock_now = 30.0
+        with patch.object(credentials, "hash_password", return_value=b"") as hashed:
+            self.assertFalse(self.store.verify("alice", "s3cret!"))
+            hashed.assert_called_once()
+
+    def test_password_change_invalidates_cache(self):
+        self.store.verify("alice", "s3cret!")
+        self.store.set_password("alice", "n3w!")
+        self.assertFalse(self.store.verify("alice", "s3cret!"))
+        self.assertTrue(self.store.verify("alice", "n3w!"))
+
+    def test_cache_is_bounded(self):
+        store = CredentialStore(cache_size=2, **FAST)
+        for user in ("a", "b", "c"):
+            store.set_password(user, user)
+            store.verify(user, user)
+        self.assertEqual(list(store._cache), ["b", "c"])
+
+    def test_authenticate_async(self):
+        async def authenticate_many():
+            return await asyncio.gather(
+                self.store.authenticate_async("alice", "s3cret!"),
+                self.store.authenticate_async("alice", "wrong"),
+                self.store.authenticate_async("nobody", "s3cret!"),
+            )
+
+        self.assertEqual(asyncio.run(authenticate_many()), [True, False, False])
+
+    def test_close_keeps_given_executor(self):
+        with ThreadPoolExecutor(1) as executor:
+            store = CredentialStore(executor=executor, **FAST)
+            store.close()
+            self.assertEqual(executor.submit(int, "1").result(), 1)
+
+        executor = self.store.executor
+        self.store.close()
+        with self.assertRaises(RuntimeError):
+            executor.submit(int, "1")
+
+    def test_process_pool(self):
+        with ProcessPoolExecutor(1) as executor:
+            store = CredentialStore(executor=executor, **FAST)
+            store.set_password("alice", "s3cret!")
+            result = asyncio.run(store.authenticate_async("alice", "s3cret!"))
+        self.assertTrue(result)
+
+
+class TestCredentialStoreIntegration(unittest.TestCase):
+    def setUp(self):
+        self.store = CredentialStore.from_plaintext(
+            {"user123": "pass123", "admin": "n3w-admin-pass"}, **FAST
+        )
+
+    def test_authenticate_user(self):
+        self.assertEqual(
+            authenticate_user("admin", "n3w-admin-pass", self.store), "Admin"
+        )
+        # The old built-in password only passes the generic user rule
+        self.assertEqual(authenticate_user("admin", "admin123", self.store), "User")
+
+    def test_banking_system(self):
+        sink = MemorySink()
+        banking_system = BankingSystem(sink, credentials=self.store)
+
+        self.assertFalse(banking_system.authenticate("user123", "wrong"))
+        self.assertTrue(banking_system.authenticate("user123", "pass123"))
+        self.assertEqual(
+            [event.name for event in sink.events],
+            ["authentication_failed", "authenticated"],
+        )
+
+    def test_banking_system_async(self):
+        banking_system = BankingSystem(MemorySink(), credentials=self.store)
+
+        result = asyncio.run(banking_system.authenticate_async("user123", "pass123"))
+
+        self.assertTrue(result)
+        self.assertIn("user123", banking_system.logged_in_users)
+
+    def test_banking_system_async_without_store(self):
+        banking_system = BankingSystem(MemorySink())
+        result = asyncio.run(banking_system.authenticate_async("user123", "pass123"))
+        self.assertTrue(result)
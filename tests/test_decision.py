@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+"""
+Decision-table engine unit tests.
+"""
+import math
+import unittest
+
+import numpy as np
+
+from src.decision import DecisionTable
+
+
+class TestDecisionTable(unittest.TestCase):
+    def setUp(self):
+        self.table = DecisionTable(
+            ["income", "score"],
+            [
+                ({"income": (None, 100)}, "low"),
+                (
+                    {"income": (100, 200, "both"), "score": (50, None, "neither")},
+                    "mid+",
+                ),
+                ({"income": (100, 200, "both")}, "mid"),
+            ],
+            default="high",
+        )
+
+    def test_decide_respects_closures_and_order(self):
+        self.assertEqual(self.table.decide(99, 0), "low")
+        self.assertEqual(self.table.decide(100, 50), "mid")
+        self.assertEqual(self.table.decide(100, 51), "mid+")
+        self.assertEqual(self.table.decide(200, 0), "mid")
+        self.assertEqual(self.table.decide(201, 0), "high")
+
+    def test_decide_many_matches_decide(self):
+        incomes = [-math.inf, 0, 99.5, 100, 150, 200, 200.5, math.inf, math.nan]
+        scores = [0, 50, 50.5, 100, 0, 51, 49, 50, 70]
+        results = self.table.decide_many(np.array(incomes), np.array(scores))
+        self.assertEqual(
+            results.tolist(),
+            [self.table.decide(i, s) for i, s in zip(incomes, scores)],
+        )
+
+    def test_decide_many_broadcasts_scalars(self):
+        results = self.table.decide_many(np.array([50, 150]), 60)
+        self.assertEqual(results.tolist(), ["low", "mid+"])
+
+    def test_decide_many_without_rules_returns_default(self):
+        table = DecisionTable(["x"], [], default="none")
+        self.assertEqual(table.decide(1), "none")
+        self.assertEqual(table.decide_many(np.arange(3)).tolist(), ["none"] * 3)
+
+    def test_truth_conditions(self):
+        table = DecisionTable(
+            ["age", "member"],
+            [({"age": (18, 65, "both")}, "yes"), ({"member": True}, "yes")],
+            default="no",
+        )
+        self.assertEqual(table.decide(17, True), "yes")
+        self.assertEqual(table.decide(17, False), "no")
+        self.assertEqual(
+            table.decide_many(np.array([17, 30, 70]), np.array([0, 0, 1])).tolist(),
+            ["no", "yes", "yes"],
+        )
+
+    def test_source_is_an_if_chain(self):
+        self.assertIn("def decide(income, score):", self.table.source)
+        self.assertIn("_low1_0 <= income <= _high1_0", self.table.source)
+        self.assertIn("_low1_1 < score", self.table.source)
+        self.assertTrue(self.table.source.endswith("return _default\n"))
+
+    def test_function_is_named_and_documented(self):
+        func = self.table.function("classify", "Classifies.", "src.example")
+        self.assertEqual(func.__name__, "classify")
+        self.assertEqual(func.__doc__, "Classifies.")
+        self.assertEqual(func.__module__, "src.example")
+        self.assertEqual(func(income=150, score=60), "mid+")
+
+    def test_unreachable_rule_rejected(self):
+        with self.assertRaisesRegex(ValueError, "'narrow' is unreachable"):
+            DecisionTable(
+                ["x"],
+                [({"x": (0, 10)}, "wide"), ({"x": (2, 5)}, "narrow")],
+            )
+
+    def test_rule_shadowed_by_several_rules_rejected(self):
+        with self.assertRaisesRegex(ValueError, "'both' is unreachable"):
+            DecisionTable(
+                ["x", "y"],
+                [
+                    ({"x": (None, 5)}, "x"),
+                    ({"y": (None, 5)}, "y"),
+                    ({"x": (None, 5), "y": (None, 5)}, "both"),
+                ],
+            )
+
+    def test_overlaps_recorded(self):
+        self.assertEqual(self.table.overlaps, [(1, 2)])
+
+    def test_unique_hit_policy_rejects_overlaps(self):
+        with self.assertRaisesRegex(ValueError, "'a' and 'b' overlap"):
+            DecisionTable(
+                ["x"],
+                [({"x": (0, 10)}, "a"), ({"x": (5, 20)}, "b")],
+                hit_policy="unique",
+            )
+
+        table = DecisionTable(
+            ["x"],
+            [({"x": (0, 10)}, "a"), ({"x": (10, 20)}, "b")],
+            hit_policy="unique",
+        )
+        self.assertEqual(table.overlaps, [])
+
+    def test_analysis_skipped_past_max_cells(self):
+        table = DecisionTable(["x"], [({"x": (0, 10)}, "a")], max_cells=2)
+        self.assertIsNone(table.overlaps)
+
+    def test_invalid_tables_rejected(self):
+        with self.assertRaisesRegex(ValueError, "Invalid input name"):
+            DecisionTable(["class"], [])
+        with self.assertRaisesRegex(ValueError, "unique"):
+            DecisionTable(["x", "x"], [])
+        with self.assertRaisesRegex(ValueError, "hit policy"):
+            DecisionTable(["x"], [], hit_policy="any")
+        with self.assertRaisesRegex(ValueError, "Unknown input 'y'"):
+            DecisionTable(["x"], [({"y": (0, 1)}, "a")])
+        with self.assertRaisesRegex(ValueError, "Invalid range closure"):
+            DecisionTable(["x"], [({"x": (0, 1, "open")}, "a")])
+        with self.assertRaisesRegex(ValueError, "Empty range"):
+            DecisionTable(["x"], [({"x": (1, 0)}, "a")])
+        with self.assertRaisesRegex(ValueError, "range and truth"):
+            DecisionTable(["x"], [({"x": (0, 1)}, "a"), ({"x": True}, "b")])
+
+    def test_decide_many_checks_column_count(self):
+        with self.assertRaisesRegex(ValueError, "Expected 2 input columns"):
+            self.table.decide_many(np.arange(3))
+
+
+if __name__ == "__main__":
+    unittest.main()
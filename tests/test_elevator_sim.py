@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+"""
+Elevator simulation unit tests.
+"""
+import unittest
+
+from src.elevator_sim import ElevatorSimulation, nearest_car, round_robin
+
+
+class TestElevatorSimulation(unittest.TestCase):
+    def test_single_call(self):
+        simulation = ElevatorSimulation(cars=1, floors=10, stop_time=2.0)
+
+        report = simulation.run([(1.0, 3, 7)])
+
+        # 3 floors up to the pickup, a 2s stop, then 4 floors up
+        self.assertEqual(report.waits.tolist(), [3.0])
+        self.assertEqual(report.trips.tolist(), [9.0])
+        self.assertEqual(report.served, 1)
+        self.assertEqual(simulation.cars[0].floor, 7)
+        self.assertEqual(simulation.cars[0].elevator.state, "Idle")
+        self.assertTrue(simulation.cars[0].idle)
+
+    def test_calls_queue_on_one_car(self):
+        simulation = ElevatorSimulation(cars=1, floors=10, stop_time=1.0)
+
+        report = simulation.run([(0.0, 0, 5), (0.0, 5, 0)])
+
+        # The second call is picked up after the first drop-off and stop
+        self.assertEqual(report.waits.tolist(), [0.0, 7.0])
+        self.assertEqual(report.trips.tolist(), [6.0, 13.0])
+
+    def test_nearest_car_spreads_calls(self):
+        simulation = ElevatorSimulation(cars=2, floors=10, dispatch=nearest_car)
+
+        report = simulation.run([(0.0, 0, 9), (0.0, 0, 9)])
+
+        self.assertEqual(report.waits.tolist(), [0.0, 0.0])
+        self.assertEqual([car.floor for car in simulation.cars], [9, 9])
+
+    def test_round_robin(self):
+        dispatch = round_robin()
+        cars = ["a", "b", "c"]
+        self.assertEqual([dispatch(cars, None) for _ in range(4)], list("abca"))
+
+    def test_wait_percentiles(self):
+        calls = [(float(t), 0, 1) for t in range(0, 2000, 20)]
+
+        report = ElevatorSimulation(cars=1, floors=2).run(calls)
+
+        # Only the first call finds the car already at the lobby
+        self.assertEqual(
+            report.wait_percentiles((0, 50, 99)), {0: 0.0, 50: 1.0, 99: 1.0}
+        )
+        # Call, pickup, departure, drop-off and departure for every call
+        self.assertEqual(report.events, 500)
+
+    def test_until(self):
+        simulation = ElevatorSimulation(cars=1, floors=10)
+
+        report = simulation.run([(0.0, 0, 5), (100.0, 5, 0)], until=50.0)
+
+        self.assertEqual(report.served, 1)
+        self.assertEqual(report.end_time, 50.0)
+        self.assertEqual(simulation.now, 50.0)
+
+    def test_until_between_events(self):
+        simulation = ElevatorSimulation(cars=1, floors=10, floor_time=1.0)
+
+        report = simulation.run([(0.0, 0, 5)], until=3.0)
+        self.assertEqual((report.served, report.end_time), (0, 3.0))
+
+        report = simulation.run([])
+        self.assertEqual(report.served, 1)
+        self.assertEqual(simulation.now, 15.0)
+
+    def test_invalid_floor(self):
+        with self.assertRaises(ValueError):
+            ElevatorSimulation(floors=5).run([(0.0, 0, 5)])
+
+    def test_empty_run(self):
+        report = ElevatorSimulation().run([])
+        self.assertEqual(report.served, 0)
+        self.assertEqual(report.wait_percentiles(), {50: 0.0, 90: 0.0, 99: 0.0})
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+"""
+Event sink unit tests.
+"""
+from io import StringIO
+import unittest
+from unittest.mock import patch
+
+from src.events import BackgroundSink, BufferedSink, MemorySink, NullSink, PrintSink
+
+
+class FailingSink(MemorySink):
+    def emit(self, name, message, /, **fields):
+        if name == "bad":
+            raise ValueError(message)
+        super().emit(name, message, **fields)
+
+
+class TestEventSinks(unittest.TestCase):
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_print_sink(self, mock_stdout):
+        PrintSink().emit("greeting", "Hello", name="world")
+        self.assertEqual(mock_stdout.getvalue(), "Hello\n")
+
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_null_sink(self, mock_stdout):
+        sink = NullSink()
+        sink.emit("greeting", "Hello")
+        sink.close()
+        self.assertEqual(mock_stdout.getvalue(), "")
+
+    def test_memory_sink(self):
+        sink = MemorySink()
+        sink.emit("greeting", "Hello", name="world")
+
+        self.assertEqual(sink.messages, ["Hello"])
+        self.assertEqual(sink.events[0].name, "greeting")
+        self.assertEqual(sink.events[0].fields, {"name": "world"})
+
+    def test_buffered_sink_writes_in_batches(self):
+        stream = StringIO()
+        sink = BufferedSink(stream, batch_size=2)
+
+        sink.emit("a", "first")
+        self.assertEqual(stream.getvalue(), "")
+        sink.emit("b", "second")
+        self.assertEqual(stream.getvalue(), "first\nsecond\n")
+        sink.emit("c", "third")
+        sink.flush()
+        self.assertEqual(stream.getvalue(), "first\nsecond\nthird\n")
+
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_buffered_sink_defaults_to_stdout(self, mock_stdout):
+        sink = BufferedSink()
+        sink.emit("a", "first")
+        sink.close()
+        self.assertEqual(mock_stdout.getvalue(), "first\n")
+
+    def test_background_sink(self):
+        memory = MemorySink()
+        sink = BackgroundSink(memory)
+        for number in range(100):
+            sink.emit("number", str(number))
+
+        sink.flush()
+        self.assertEqual(memory.messages, [str(number) for number in range(100)])
+        sink.close()
+        self.assertFalse(sink._thread.is_alive())
+
+    def test_background_sink_survives_sink_errors(self):
+        memory, errors = FailingSink(), []
+        sink = BackgroundSink(memory, on_error=lambda *args: errors.append(args))
+        sink.emit("bad", "first")
+        sink.emit("bad", "second")
+        sink.emit("good", "third")
+        sink.flush()
+
+        self.assertEqual(memory.messages, ["third"])
+        self.assertEqual(sink.errors, 2)
+        self.assertEqual([event.message for _, event in errors], ["first", "second"])
+        self.assertIsInstance(errors[0][0], ValueError)
+        sink.close()
+
+    @patch("sys.stderr", new_callable=StringIO)
+    def test_background_sink_reports_errors_to_stderr(self, mock_stderr):
+        sink = BackgroundSink(FailingSink())
+        sink.emit("bad", "message")
+        sink.flush()
+        self.assertIn("bad event not written", mock_stderr.getvalue())
+        sink.close()
+
+    def test_background_sink_fails_fast_when_closed(self):
+        sink = BackgroundSink(MemorySink())
+        sink.close()
+        with self.assertRaisesRegex(RuntimeError, "closed"):
+            sink.emit("late", "message")
+        with self.assertRaisesRegex(RuntimeError, "closed"):
+            sink.flush()
+        sink.close()
+
+    def test_background_sink_fails_fast_when_thread_dead(self):
+        sink = BackgroundSink(MemorySink(), max_queued=1)
+        sink._queue.put(BackgroundSink._CLOSE)  # Stops the writer thread
+        sink._thread.join()
+        with self.assertRaisesRegex(RuntimeError, "stopped"):
+            sink.emit("late", "message")
+        with self.assertRaisesRegex(RuntimeError, "stopped"):
+            sink.flush()
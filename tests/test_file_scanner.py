@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+"""
+File scanner unit tests.
+"""
+import os
+import tempfile
+import unittest
+
+from src.file_scanner import FileScanner
+from src.white_box import check_file_size, check_file_sizes
+
+
+class TestFileSizeLimit(unittest.TestCase):
+    def test_configurable_limit(self):
+        self.assertEqual(check_file_size(2048, limit=1024), "Invalid File Size")
+        self.assertEqual(check_file_size(1024, limit=1024), "Valid File Size")
+
+    def test_batch_matches_scalar(self):
+        sizes = [-1, 0, 1048576, 1048577, 1048576.5, 0.5, float("nan")]
+        expected = [check_file_size(size) == "Valid File Size" for size in sizes]
+        self.assertEqual(check_file_sizes(sizes).tolist(), expected)
+
+
+class TestFileScanner(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = self.directory.name
+        self.sizes = {}
+        for depth in range(3):
+            folder = os.path.join(self.root, *["sub"] * depth)
+            os.makedirs(folder, exist_ok=True)
+            for index in range(5):
+                path = os.path.join(folder, f"file{index}")
+                with open(path, "wb") as file:
+                    file.write(b"x" * (index * 100))
+                self.sizes[path] = index * 100
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_scans_every_file(self):
+        scanner = FileScanner(limit=250, workers=2, batch_size=4)
+        found = {}
+        for batch in scanner.scan(self.root):
+            self.assertLessEqual(len(batch.paths), 4)
+            for path, size, valid in zip(*batch):
+                found[path] = size
+                self.assertEqual(valid, size <= 250)
+
+        self.assertEqual(found, self.sizes)
+        self.assertEqual(scanner.progress.files, 15)
+        self.assertEqual(scanner.progress.directories, 3)
+        self.assertEqual(scanner.progress.invalid, 6)
+        self.assertEqual(scanner.progress.bytes, sum(self.sizes.values()))
+
+    def test_scan_invalid(self):
+        invalid = dict(FileScanner(limit=250).scan_invalid(self.root))
+        expected = {path: size for path, size in self.sizes.items() if size > 250}
+        self.assertEqual(invalid, expected)
+
+    def test_progress_callback(self):
+        reports = []
+        scanner = FileScanner(
+            batch_size=1,
+            progress=lambda progress: reports.append(progress.files),
+            progress_every=5,
+        )
+        list(scanner.scan(self.root))
+        self.assertEqual(reports[-1], 15)
+        self.assertGreater(len(reports), 1)
+
+    def test_missing_directory(self):
+        scanner = FileScanner()
+        self.assertEqual(list(scanner.scan(os.path.join(self.root, "missing"))), [])
+        self.assertEqual(scanner.progress.errors, 1)
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "needs symbolic links")
+    def test_symlink_loops_followed_once(self):
+        os.symlink(self.root, os.path.join(self.root, "sub", "loop"))
+        os.symlink("..", os.path.join(self.root, "sub", "sub", "up"))
+        scanner = FileScanner(follow_symlinks=True)
+        paths = [path for batch in scanner.scan(self.root) for path in batch.paths]
+
+        self.assertEqual(len(paths), 15)
+        self.assertEqual(
+            sorted(os.path.realpath(path) for path in paths),
+            sorted(os.path.realpath(path) for path in self.sizes),
+        )
+        self.assertEqual(scanner.progress.directories, 3)
+
+    def test_stop_early(self):
+        scan = FileScanner(batch_size=1).scan(self.root)
+        next(scan)
+        scan.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+
+"""
+Instrumentation registry unit tests.
+"""
+import threading
+import unittest
+
+from src import white_box
+from src.events import NullSink
+from src.instrumentation import Histogram, Registry
+
+
+class TestHistogram(unittest.TestCase):
+    def test_small_values_are_exact(self):
+        histogram = Histogram(precision=5)
+        for value in range(32):
+            histogram.record(value)
+        self.assertEqual(histogram.buckets(), [(value, 1) for value in range(32)])
+
+    def test_relative_error(self):
+        histogram = Histogram(precision=5)
+        for value in (33, 1000, 123456789, 2**40 + 12345):
+            lowest, highest = histogram.bucket_bounds(histogram.bucket(value))
+            self.assertLessEqual(lowest, value)
+            self.assertLessEqual(value, highest)
+            self.assertLessEqual(highest - lowest, value / 16)
+
+    def test_buckets_are_contiguous(self):
+        histogram = Histogram(precision=3)
+        previous = 7  # Values below 8 have a bucket each
+        for index in range(8, 40):
+            lowest, highest = histogram.bucket_bounds(index)
+            self.assertEqual(lowest, previous + 1)
+            previous = highest
+
+    def test_percentiles(self):
+        histogram = Histogram()
+        self.assertIsNone(histogram.percentile(50))
+        for value in range(1, 1001):
+            histogram.record(value * 1000)
+        self.assertAlmostEqual(histogram.percentile(50), 500_000, delta=500_000 / 16)
+        self.assertEqual(histogram.percentile(100), 1_000_000)
+        self.assertEqual(histogram.min, 1000)
+        self.assertEqual(histogram.count_at_most(10**9), 1000)
+
+
+class TestRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = Registry()
+
+    def tearDown(self):
+        self.registry.disable_all()
+
+    def test_enable_and_disable(self):
+        original = white_box.validate_password
+        self.registry.enable(white_box, "validate_password")
+        self.assertIsNot(white_box.validate_password, original)
+        self.assertEqual(white_box.validate_password.__name__, "validate_password")
+        self.assertEqual(self.registry.enabled, ["validate_password"])
+
+        self.registry.disable("validate_password")
+        self.assertIs(white_box.validate_password, original)
+        self.assertEqual(self.registry.enabled, [])
+
+    def test_calls_and_outcomes(self):
+        self.registry.enable(white_box, "validate_password")
+        self.registry.enable(white_box, "calculate_quantity_discount")
+        for password in ("abAB123@$", "short", "abAB123@$"):
+            white_box.validate_password(password)
+        for quantity in (1, 7, 7, 20):
+            white_box.calculate_quantity_discount(quantity)
+
+        snapshot = self.registry.snapshot()
+        self.assertEqual(snapshot["validate_password"]["calls"], 3)
+        self.assertEqual(
+            snapshot["validate_password"]["outcomes"], {"True": 2, "False": 1}
+        )
+        self.assertEqual(
+            snapshot["calculate_quantity_discount"]["outcomes"],
+            {"No Discount": 1, "5% Discount": 2, "10% Discount": 1},
+        )
+        latency = snapshot["validate_password"]["latency"]
+        self.assertEqual(latency["count"], 3)
+        self.assertLessEqual(latency["min"], latency["p50"])
+        self.assertLessEqual(latency["p50"], latency["max"])
+
+    def test_internal_calls_are_counted(self):
+        self.registry.enable(white_box, "validate_password")
+        list(white_box.validate_passwords(["abAB123@$", "short"]))
+        self.assertEqual(self.registry.snapshot()["validate_password"]["calls"], 2)
+
+    def test_methods(self):
+        self.registry.enable(white_box, "BankingSystem.transfer_money")
+        self.registry.enable(white_box.TrafficLight, "change_state")
+        bank = white_box.BankingSystem(sink=NullSink())
+        bank.logged_in_users.add("alice")
+        bank.transfer_money("alice", "bob", 10, "regular")
+        bank.transfer_money("carol", "bob", 10, "regular")
+        white_box.TrafficLight().change_state()
+
+        snapshot = self.registry.snapshot()
+        self.assertEqual(
+            snapshot["BankingSystem.transfer_money"]["outcomes"],
+            {"True": 1, "False": 1},
+        )
+        self.assertEqual(snapshot["TrafficLight.change_state"]["calls"], 1)
+
+    def test_errors(self):
+        self.registry.enable(white_box, "calculate_items_shipping_cost")
+        with self.assertRaises(ValueError):
+            white_box.calculate_items_shipping_cost([{"weight": 1}], "fastest")
+        snapshot = self.registry.snapshot()["calculate_items_shipping_cost"]
+        self.assertEqual((snapshot["calls"], snapshot["errors"]), (1, 1))
+        self.assertEqual(snapshot["outcomes"], {})
+
+    def test_custom_outcome_and_limit(self):
+        registry = Registry(max_outcomes=2)
+        registry.enable(white_box, "divide", outcome=lambda result: result > 1)
+        registry.enable(white_box, "check_number_status")
+        try:
+            for number in (1, 4, 9):
+                white_box.divide(number, 2)
+            for number in (-1, 0, 1):
+                white_box.check_number_status(number)
+        finally:
+            registry.disable_all()
+
+        snapshot = registry.snapshot()
+        self.assertEqual(snapshot["divide"]["outcomes"], {"False": 1, "True": 2})
+        self.assertEqual(
+            snapshot["check_number_status"]["outcomes"],
+            {"Negative": 1, "Zero": 1, "other": 1},
+        )
+
+    def test_enable_all(self):
+        self.registry.enable_all(white_box)
+        self.assertIn("validate_url", self.registry.enabled)
+        self.assertNotIn("BankingSystem", self.registry.enabled)
+        self.registry.disable_all()
+        self.assertEqual(white_box.validate_url.__module__, "src.white_box.validators")
+        self.assertNotIn("wrapper", repr(white_box.validate_url.__code__))
+
+    def test_reset(self):
+        self.registry.enable(white_box, "is_even")
+        white_box.is_even(2)
+        self.registry.reset()
+        self.assertEqual(self.registry.snapshot()["is_even"]["calls"], 0)
+        self.registry.disable("is_even")
+        self.registry.reset()
+        self.assertEqual(self.registry.snapshot(), {})
+
+    def test_threads(self):
+        self.registry.enable(white_box, "is_even")
+
+        def worker():
+            for number in range(1000):
+                white_box.is_even(number)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        snapshot = self.registry.snapshot()["is_even"]
+        self.assertEqual(snapshot["calls"], 4000)
+        self.assertEqual(snapshot["outcomes"], {"True": 2000, "False": 2000})
+
+    def test_prometheus(self):
+        self.registry.enable(white_box, "validate_url")
+        white_box.validate_url("http://example.com")
+        white_box.validate_url('bad "url"')
+        text = self.registry.to_prometheus(buckets=(1.0,))
+        lines = text.splitlines()
+
+        self.assertIn("# TYPE white_box_calls_total counter", lines)
+        self.assertIn('white_box_calls_total{function="validate_url"} 2', lines)
+        self.assertIn(
+            'white_box_outcomes_total{function="validate_url",outcome="Valid URL"} 1',
+            lines,
+        )
+        self.assertIn("# TYPE white_box_latency_seconds histogram", lines)
+        self.assertIn(
+            'white_box_latency_seconds_bucket{function="validate_url",le="1.0"} 2',
+            lines,
+        )
+        self.assertIn(
+            'white_box_latency_seconds_count{function="validate_url"} 2', lines
+        )
+        self.assertTrue(text.endswith("\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+"""
+Interval-table engine unit tests.
+"""
+import math
+import unittest
+
+import numpy as np
+
+from src.intervals import IntervalTable
+
+
+class TestIntervalTable(unittest.TestCase):
+    def setUp(self):
+        self.table = IntervalTable(
+            [(0, 10, "low"), (10, 20, "mid", "both"), (20, 30, "high", "neither")],
+            default="out",
+        )
+
+    def test_lookup_respects_closures(self):
+        self.assertEqual(self.table.lookup(0), "low")
+        self.assertEqual(self.table.lookup(9.999), "low")
+        self.assertEqual(self.table.lookup(10), "mid")
+        self.assertEqual(self.table.lookup(20), "mid")
+        self.assertEqual(self.table.lookup(20.001), "high")
+        self.assertEqual(self.table.lookup(30), "out")
+        self.assertEqual(self.table.lookup(-1), "out")
+
+    def test_lookup_many_matches_lookup(self):
+        numbers = [-1, 0, 9.999, 10, 20, 20.001, 29.9, 30, 100]
+        results = self.table.lookup_many(np.array(numbers))
+        self.assertEqual(results.tolist(), [self.table.lookup(n) for n in numbers])
+
+    def test_rows_can_be_declared_in_any_order(self):
+        table = IntervalTable([(5, math.inf, "b"), (-math.inf, 5, "a")])
+        self.assertEqual(table.lookup(4), "a")
+        self.assertEqual(table.lookup(5), "b")
+
+    def test_infinite_high_end(self):
+        closed = IntervalTable([(-math.inf, 5, "a"), (5, math.inf, "b", "both")])
+        opened = IntervalTable([(-math.inf, 5, "a"), (5, math.inf, "b")], "out")
+        self.assertEqual(closed.lookup(-math.inf), "a")
+        self.assertEqual(closed.lookup(math.inf), "b")
+        self.assertEqual(opened.lookup(math.inf), "out")
+
+        numbers = [-math.inf, 5, math.inf]
+        self.assertEqual(closed.lookup_many(numbers).tolist(), ["a", "b", "b"])
+        self.assertEqual(opened.lookup_many(numbers).tolist(), ["a", "b", "out"])
+        self.assertEqual(closed.lookup_many(math.inf).tolist(), "b")
+
+    def test_nan_is_outside(self):
+        table = IntervalTable([(-math.inf, math.inf, "a", "both")], default="nan")
+        self.assertEqual(table.lookup(math.nan), "nan")
+        self.assertEqual(table.lookup_many([math.nan, 1]).tolist(), ["nan", "a"])
+
+    def test_overlapping_ranges_rejected(self):
+        with self.assertRaises(ValueError):
+            IntervalTable([(0, 10, "a", "both"), (10, 20, "b")])
+
+    def test_gaps_rejected(self):
+        with self.assertRaises(ValueError):
+            IntervalTable([(0, 10, "a", "both"), (11, 20, "b")])
+
+        with self.assertRaises(ValueError):
+            IntervalTable([(0, 10, "a"), (10, 20, "b", "neither")])
+
+    def test_empty_range_rejected(self):
+        with self.assertRaises(ValueError):
+            IntervalTable([(10, 0, "a")])
+
+    def test_invalid_closure_rejected(self):
+        with self.assertRaises(ValueError):
+            IntervalTable([(0, 10, "a", "open")])
+
+    def test_outside_without_default(self):
+        table = IntervalTable([(0, 10, "a")])
+        with self.assertRaises(ValueError):
+            table.lookup(10)
+
+        with self.assertRaises(ValueError):
+            table.lookup_many([1, 11])
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+
+"""
+Loan scorer unit tests.
+"""
+import json
+import os
+import random
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.loan_scorer import INVALID_ROW, LoanScorer, LoanTiers, loan_table
+from src.white_box import check_loan_eligibility
+
+
+class TestLoanTable(unittest.TestCase):
+    def test_default_tiers_match_check_loan_eligibility(self):
+        table = loan_table()
+        incomes = [-1, 0, 29999, 30000, 45000, 60000, 60001, 1e6, 30000, 60001]
+        scores = [800, 0, 760, 700, 701, 760, 750, 751, 699, 700]
+        self.assertEqual(
+            table.decide_many(np.array(incomes), np.array(scores)).tolist(),
+            [check_loan_eligibility(*row) for row in zip(incomes, scores)],
+        )
+
+    def test_configurable_tiers(self):
+        table = loan_table(LoanTiers(min_income=20000, premium_score=800))
+        self.assertEqual(table.decide(25000, 0), "Secured Loan")
+        self.assertEqual(table.decide(70000, 780), "Standard Loan")
+        self.assertEqual(table.decide(70000, 801), "Premium Loan")
+
+    def test_unreachable_tier_rejected(self):
+        with self.assertRaises(ValueError):
+            LoanScorer(LoanTiers(min_income=70000, max_income=60000))
+
+
+class TestLoanScorer(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        rng = random.Random(0)
+        self.rows = [
+            (round(rng.uniform(0, 100000), 2), rng.randint(300, 850))
+            for _ in range(500)
+        ]
+        self.expected = [check_loan_eligibility(*row) for row in self.rows]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def _write_csv(self, name="applicants.csv"):
+        path = self._path(name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("id,credit_score,income\n")
+            for index, (income, score) in enumerate(self.rows):
+                file.write(f"{index},{score},{income}\n")
+        return path
+
+    def _read_results(self, path):
+        with open(path, encoding="utf-8") as file:
+            lines = file.read().splitlines()
+        self.assertEqual(lines[0], "id,credit_score,income,eligibility")
+        return [line.rsplit(",", 1)[1] for line in lines[1:]]
+
+    def test_csv_results_in_input_order(self):
+        reports = []
+        scorer = LoanScorer(workers=2, chunk_size=37, progress=reports.append)
+        progress = scorer.score_file(self._write_csv(), self._path("out.csv"))
+
+        self.assertEqual(self._read_results(self._path("out.csv")), self.expected)
+        self.assertEqual(progress.rows, 500)
+        self.assertEqual(progress.chunks, 14)
+        self.assertEqual(len(reports), 14)
+        self.assertEqual(sum(progress.results.values()), 500)
+        self.assertGreater(progress.rows_per_second, 0)
+
+    def test_jsonl(self):
+        source = self._path("applicants.jsonl")
+        with open(source, "w", encoding="utf-8") as file:
+            for income, score in self.rows:
+                file.write(json.dumps({"income": income, "score": score}) + "\n")
+            file.write(json.dumps({"income": "n/a", "score": 700}) + "\n")
+            file.write(json.dumps({"income": True, "score": 700}) + "\n")
+            file.write("{bad json\n")
+            file.write("[1, 2]\n")
+            file.write("\n")
+
+        scorer = LoanScorer(workers=2, chunk_size=100, fields=("income", "score"))
+        progress = scorer.score_file(source, self._path("out.jsonl"))
+        with open(self._path("out.jsonl"), encoding="utf-8") as file:
+            records = [json.loads(line) for line in file]
+
+        self.assertEqual(
+            [record["eligibility"] for record in records],
+            [*self.expected, *[INVALID_ROW] * 4],
+        )
+        self.assertEqual(records[0]["income"], self.rows[0][0])
+        self.assertEqual(records[-2]["input"], "{bad json")
+        self.assertEqual(records[-1]["input"], "[1, 2]")
+        self.assertEqual(progress.invalid, 4)
+
+    def test_what_if_tiers(self):
+        tiers = LoanTiers(max_income=80000, standard_score=650)
+        scorer = LoanScorer(tiers, workers=1, chunk_size=100)
+        scorer.score_file(self._write_csv(), self._path("out.csv"))
+
+        table = loan_table(tiers)
+        self.assertEqual(
+            self._read_results(self._path("out.csv")),
+            [table.decide(*row) for row in self.rows],
+        )
+
+    def test_resume_from_checkpoint(self):
+        source, checkpoint = self._write_csv(), self._path("checkpoint.json")
+
+        def interrupt(progress):
+            if progress.chunks == 3:
+                raise KeyboardInterrupt
+
+        scorer = LoanScorer(workers=2, chunk_size=50, progress=interrupt)
+        with self.assertRaises(KeyboardInterrupt):
+            scorer.score_file(source, self._path("out.csv"), checkpoint=checkpoint)
+        with open(checkpoint, encoding="utf-8") as file:
+            self.assertEqual(json.load(file)["rows"], 150)
+
+        # Rows written after the checkpoint are discarded on resume
+        with open(self._path("out.csv"), "a", encoding="utf-8") as file:
+            file.write("partial,row\n")
+
+        scorer = LoanScorer(workers=2, chunk_size=50)
+        progress = scorer.score_file(
+            source, self._path("out.csv"), checkpoint=checkpoint
+        )
+        self.assertEqual(self._read_results(self._path("out.csv")), self.expected)
+        self.assertEqual(progress.rows, 500)
+        self.assertEqual(progress.run_rows, 350)
+        self.assertFalse(os.path.exists(checkpoint))
+
+    def test_checkpoint_for_other_tiers_rejected(self):
+        source, checkpoint = self._write_csv(), self._path("checkpoint.json")
+
+        def interrupt(_):
+            raise KeyboardInterrupt
+
+        scorer = LoanScorer(workers=1, chunk_size=50, progress=interrupt)
+        with self.assertRaises(KeyboardInterrupt):
+            scorer.score_file(source, self._path("out.csv"), checkpoint=checkpoint)
+
+        scorer = LoanScorer(LoanTiers(premium_score=800), workers=1)
+        with self.assertRaisesRegex(ValueError, "other tiers"):
+            scorer.score_file(source, self._path("out.csv"), checkpoint=checkpoint)
+
+    def test_invalid_inputs_rejected(self):
+        with self.assertRaisesRegex(ValueError, "Cannot guess"):
+            LoanScorer(workers=1).score_file(self._path("a.txt"), self._path("b"))
+        with self.assertRaisesRegex(ValueError, "Unknown format"):
+            LoanScorer(workers=1).score_file(self._path("a"), self._path("b"), "xml")
+        with self.assertRaisesRegex(ValueError, "Missing column"):
+            LoanScorer(workers=1, fields=("salary", "score")).score_file(
+                self._write_csv(), self._path("out.csv")
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
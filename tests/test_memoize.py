@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+
+"""
+Memoization unit tests.
+"""
+import random
+import threading
+import unittest
+
+from src import white_box
+from src.intervals import IntervalTable
+from src.memoize import ARCCache, LRUCache, Memoizer, memoize
+from src.rate_card import RateCard
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        calls = []
+        cache = LRUCache(lambda value: calls.append(value) or value * 2, maxsize=2)
+        for value in (1, 2, 1, 3, 2, 1):
+            self.assertEqual(cache.call(value), value * 2)
+
+        self.assertEqual(calls, [1, 2, 3, 2, 1])
+        self.assertEqual(len(cache), 2)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 5))
+        self.assertEqual(stats["evictions"], 3)
+        self.assertAlmostEqual(stats["hit_ratio"], 1 / 6)
+
+    def test_stats_kept_across_clears(self):
+        cache = LRUCache(abs, maxsize=2)
+        for value in (1, 2, 3, 1):
+            cache.call(value)
+        cache.clear()
+        cache.call(1)
+
+        self.assertEqual(len(cache), 1)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (0, 5))
+        self.assertEqual(stats["evictions"], 2)
+
+    def test_failed_calls_are_not_evictions(self):
+        cache = LRUCache(lambda value: 1 / value, maxsize=4)
+        for _ in range(3):
+            with self.assertRaises(ZeroDivisionError):
+                cache.call(0)
+        self.assertEqual(cache.stats()["evictions"], 0)
+
+        for value in range(1, 7):
+            cache.call(value)
+        stats = cache.stats()
+        self.assertEqual(
+            (stats["misses"], stats["evictions"], stats["size"]), (9, 2, 4)
+        )
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            LRUCache(abs, maxsize=0)
+
+
+class TestARCCache(unittest.TestCase):
+    def test_get_and_put(self):
+        cache = ARCCache(maxsize=2)
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("a", 2)
+        self.assertEqual(cache.get("a", 0), 2)
+        self.assertEqual(cache.stats()["hits"], 2)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_invariants(self):
+        rng = random.Random(0)
+        for maxsize in (1, 2, 5, 16):
+            cache = ARCCache(maxsize)
+            for _ in range(5000):
+                key = rng.randint(0, 3 * maxsize)
+                if cache.get(key) is None:
+                    cache.put(key, key)
+                else:
+                    self.assertEqual(cache.get(key), key)
+
+                self.assertLessEqual(len(cache), maxsize)
+                self.assertLessEqual(
+                    len(cache.recent) + len(cache.recent_ghosts), maxsize
+                )
+                self.assertLessEqual(
+                    len(cache) + len(cache.recent_ghosts) + len(cache.frequent_ghosts),
+                    2 * maxsize,
+                )
+                self.assertTrue(0 <= cache.target <= maxsize)
+            stats = cache.stats()
+            self.assertEqual(stats["misses"] - stats["evictions"], len(cache))
+
+    def test_scan_resistance(self):
+        arc, lru = ARCCache(100), LRUCache(lambda key: key, maxsize=100)
+        for scan in range(10):
+            keys = [*range(50), *range(50)]
+            keys += range(1000 + scan * 200, 1200 + scan * 200)
+            for key in keys:
+                if arc.get(key) is None:
+                    arc.put(key, key)
+                lru.call(key)
+
+        # The hot keys stay cached through the scans with ARC only
+        self.assertEqual(arc.stats()["hits"], 50 * 10 + 50 * 9)
+        self.assertEqual(lru.stats()["hits"], 50 * 10)
+
+    def test_clear(self):
+        cache = ARCCache(maxsize=2)
+        for key in (1, 2, 3, 1):
+            if cache.get(key) is None:
+                cache.put(key, key)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.recent_ghosts, {})
+        self.assertIsNone(cache.get(1))
+
+
+class TestMemoize(unittest.TestCase):
+    def test_policies(self):
+        for policy in ("lru", "arc"):
+            for thread_safe in (False, True):
+                calls = []
+                square = memoize(
+                    lambda value, power=2, calls=calls: calls.append(value)
+                    or value**power,
+                    maxsize=4,
+                    policy=policy,
+                    thread_safe=thread_safe,
+                )
+                self.assertEqual([square(2), square(2), square(3)], [4, 4, 9])
+                self.assertEqual(square(2, power=3), 8)
+                self.assertEqual(square(2, power=3), 8)
+                self.assertEqual(calls, [2, 3, 2])
+                self.assertEqual(square.cache.stats()["hits"], 2)
+
+    def test_unknown_policy(self):
+        with self.assertRaisesRegex(ValueError, "Unknown cache policy"):
+            memoize(abs, policy="lfu")
+
+    def test_unhashable_arguments(self):
+        for policy in ("lru", "arc"):
+            with self.assertRaises(TypeError):
+                memoize(len, policy=policy)([1, 2])
+
+    def test_threads(self):
+        grade = memoize(white_box.get_grade, policy="arc", thread_safe=True)
+
+        def worker():
+            for score in range(100):
+                self.assertEqual(grade(score), white_box.get_grade(score))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = grade.cache.stats()
+        self.assertEqual(stats["hits"] + stats["misses"], 400)
+        self.assertEqual(len(grade.cache), 100)
+
+
+class TestMemoizer(unittest.TestCase):
+    def setUp(self):
+        self.memoizer = Memoizer()
+
+    def tearDown(self):
+        self.memoizer.disable_all()
+
+    def test_enable_and_disable(self):
+        original = white_box.get_grade
+        cache = self.memoizer.enable(white_box, "get_grade", maxsize=8)
+        self.assertIsNot(white_box.get_grade, original)
+        self.assertEqual(white_box.get_grade.__name__, "get_grade")
+        self.assertIs(self.memoizer.enable(white_box, "get_grade"), cache)
+        self.assertEqual(self.memoizer.enabled, ["get_grade"])
+
+        for score in (95, 95, 40):
+            white_box.get_grade(score)
+        self.assertEqual(self.memoizer.stats()["get_grade"]["hits"], 1)
+
+        self.memoizer.disable("get_grade")
+        self.assertIs(white_box.get_grade, original)
+        self.assertEqual(self.memoizer.stats(), {})
+
+    def test_methods(self):
+        self.memoizer.enable(RateCard, "package_cost")
+        card = white_box.SHIPPING_QUOTER.rate_card
+        cost = card.package_cost(2, 20, 20, 20)
+        self.assertEqual(card.package_cost(2, 20, 20, 20), cost)
+        self.assertEqual(self.memoizer.stats()["RateCard.package_cost"]["hits"], 1)
+
+    def test_invalidate(self):
+        grades = white_box.GRADES
+        self.memoizer.enable(white_box, "get_grade", policy="arc")
+        self.memoizer.enable(white_box, "verify_age")
+        try:
+            self.assertEqual(white_box.get_grade(95), "A")
+            white_box.GRADES = IntervalTable([(0, 101, "P")])
+            self.assertEqual(white_box.get_grade(95), "A")  # Stale
+
+            self.memoizer.invalidate("get_grade")
+            self.assertEqual(white_box.get_grade(95), "P")
+        finally:
+            white_box.GRADES = grades
+
+        white_box.verify_age(30)
+        self.memoizer.invalidate()
+        self.assertEqual(self.memoizer.stats()["get_grade"]["size"], 0)
+        self.assertEqual(self.memoizer.stats()["verify_age"]["size"], 0)
+
+    def test_not_callable(self):
+        with self.assertRaises(TypeError):
+            self.memoizer.enable(white_box, "FILE_SIZE_LIMIT")
+
+
+if __name__ == "__main__":
+    unittest.main()
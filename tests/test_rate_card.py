@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+"""
+Shipping rate card unit tests.
+"""
+import unittest
+
+import numpy as np
+
+from src.rate_card import RateCard, ShippingQuoter
+from src.white_box import SHIPPING_QUOTER, calculate_shipping_cost
+
+CARD = {
+    "weight_limits": [5, 10],
+    "methods": {"standard": [10, 15, 20], "express": [20, 30, 40]},
+    "package_classes": [
+        {"cost": 5, "weight": (None, 1), "side": (None, 10)},
+        {"cost": 10, "weight": (1, 5), "side": (11, 30)},
+    ],
+    "package_default": 20,
+}
+
+
+class TestRateCard(unittest.TestCase):
+    def setUp(self):
+        self.card = RateCard.from_dict(CARD)
+
+    def test_quote_weight_bands(self):
+        self.assertEqual(self.card.quote(5, "standard"), 10)
+        self.assertEqual(self.card.quote(5.1, "standard"), 15)
+        self.assertEqual(self.card.quote(10, "express"), 30)
+        self.assertEqual(self.card.quote(10.1, "express"), 40)
+
+    def test_quote_invalid_method(self):
+        with self.assertRaises(ValueError):
+            self.card.quote(1, "fastest")
+
+    def test_quote_many_matches_quote(self):
+        weights = [0, 5, 5.1, 10, 12, 3, 7]
+        methods = ["standard", "express", "express", "standard", "express"] * 2
+        methods = methods[: len(weights)]
+
+        costs = self.card.quote_many(np.array(weights), methods)
+
+        expected = [self.card.quote(w, m) for w, m in zip(weights, methods)]
+        self.assertEqual(costs.tolist(), expected)
+
+    def test_quote_many_single_method(self):
+        costs = self.card.quote_many([4, 7, 12], "express")
+        self.assertEqual(costs.tolist(), [20, 30, 40])
+
+    def test_quote_many_invalid_method(self):
+        with self.assertRaises(ValueError):
+            self.card.quote_many([1, 2], ["standard", "fastest"])
+
+    def test_package_costs_match_package_cost(self):
+        packages = [
+            (0.5, 8, 7, 6),
+            (1, 10, 10, 10),
+            (1, 11, 11, 11),
+            (3, 20, 15, 25),
+            (5, 30, 30, 31),
+            (7, 35, 40, 20),
+        ]
+        columns = [np.array(column) for column in zip(*packages)]
+
+        costs = self.card.package_costs(*columns)
+
+        expected = [calculate_shipping_cost(*package) for package in packages]
+        self.assertEqual(costs.tolist(), expected)
+        self.assertEqual(expected, [5, 5, 20, 10, 20, 20])
+
+    def test_invalid_cards_rejected(self):
+        with self.assertRaises(ValueError):
+            RateCard([10, 5], {"standard": [1, 2, 3]})
+
+        with self.assertRaises(ValueError):
+            RateCard([5, 10], {"standard": [1, 2]})
+
+    def test_unreachable_package_class_rejected(self):
+        with self.assertRaisesRegex(ValueError, "unreachable"):
+            RateCard(
+                [5],
+                {"standard": [1, 2]},
+                [{"cost": 5, "weight": (0, 10)}, {"cost": 3, "weight": (1, 2)}],
+            )
+
+
+class TestShippingQuoter(unittest.TestCase):
+    def test_reload(self):
+        quoter = ShippingQuoter(RateCard.from_dict(CARD))
+        old_card = quoter.rate_card
+
+        quoter.reload({**CARD, "methods": {"standard": [1, 2, 3]}})
+
+        self.assertEqual(quoter.quote(7, "standard"), 2)
+        self.assertEqual(old_card.quote(7, "standard"), 15)
+        with self.assertRaises(ValueError):
+            quoter.quote(7, "express")
+
+    def test_default_quoter(self):
+        self.assertEqual(SHIPPING_QUOTER.quote(7, "standard"), 15)
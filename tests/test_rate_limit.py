@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+"""
+Rate limiter unit tests.
+"""
+import asyncio
+import unittest
+
+from src.events import MemorySink
+from src.rate_limit import RateLimiter
+from src.white_box import BankingSystem, authenticate_user
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.limiter = RateLimiter(3, window=1.0, clock=self.clock)
+
+    def test_burst_then_refill(self):
+        self.assertEqual(
+            [self.limiter.allow("alice") for _ in range(4)], [True] * 3 + [False]
+        )
+        self.clock.now = 0.34
+        self.assertTrue(self.limiter.allow("alice"))
+        self.assertFalse(self.limiter.allow("alice"))
+
+    def test_bucket_is_capped(self):
+        self.clock.now = 100
+        self.assertEqual(
+            [self.limiter.allow("alice") for _ in range(4)], [True] * 3 + [False]
+        )
+
+    def test_keys_are_independent(self):
+        for _ in range(3):
+            self.limiter.allow("alice")
+        self.assertFalse(self.limiter.allow("alice"))
+        self.assertTrue(self.limiter.allow("bob"))
+
+    def test_idle_keys_are_evicted(self):
+        limiter = RateLimiter(3, idle_ttl=10, clock=self.clock)
+        for key in range(5):
+            limiter.allow(key)
+        self.assertEqual(len(limiter), 5)
+        self.clock.now = 10
+        for _ in range(3):
+            limiter.allow("alice")
+        self.assertEqual(len(limiter), 1)
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            RateLimiter(3, mode="leaky")
+
+
+class TestSlidingWindow(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.limiter = RateLimiter(
+            4, window=10.0, mode="sliding_window", clock=self.clock
+        )
+
+    def test_limit_per_window(self):
+        self.assertEqual(
+            [self.limiter.allow("alice") for _ in range(5)], [True] * 4 + [False]
+        )
+
+    def test_previous_window_is_weighted(self):
+        for _ in range(4):
+            self.limiter.allow("alice")
+        # Half of the previous window still counts: 2 requests
+        self.clock.now = 15
+        self.assertEqual(
+            [self.limiter.allow("alice") for _ in range(3)], [True] * 2 + [False]
+        )
+
+    def test_old_windows_are_forgotten(self):
+        for _ in range(4):
+            self.limiter.allow("alice")
+        self.clock.now = 25
+        self.assertEqual(
+            [self.limiter.allow("alice") for _ in range(5)], [True] * 4 + [False]
+        )
+
+
+class TestAuthenticationRateLimit(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.limiter = RateLimiter(2, window=60.0, clock=self.clock)
+
+    def test_authenticate_user(self):
+        results = [
+            authenticate_user("admin", "guess", rate_limiter=self.limiter)
+            for _ in range(3)
+        ]
+        self.assertEqual(results, ["Invalid", "Invalid", "Rate Limited"])
+        self.assertEqual(authenticate_user("admin", "admin123"), "Admin")
+
+    def test_authenticate_user_by_source(self):
+        for username in ("alice", "bob"):
+            authenticate_user(
+                username, "guess", rate_limiter=self.limiter, source="10.0.0.1"
+            )
+        result = authenticate_user(
+            "carol", "password123", rate_limiter=self.limiter, source="10.0.0.1"
+        )
+        self.assertEqual(result, "Rate Limited")
+
+    def test_banking_system(self):
+        sink = MemorySink()
+        bank = BankingSystem(sink=sink, rate_limiter=self.limiter)
+        self.assertFalse(bank.authenticate("user123", "wrong"))
+        self.assertFalse(bank.authenticate("user123", "wrong"))
+        self.assertFalse(bank.authenticate("user123", "pass123"))
+        self.assertEqual(sink.events[-1].name, "rate_limited")
+        self.assertEqual(sink.events[-1].fields["username"], "user123")
+        self.assertNotIn("user123", bank.logged_in_users)
+
+        self.clock.now = 30
+        self.assertTrue(bank.authenticate("user123", "pass123"))
+
+    def test_banking_system_async(self):
+        sink = MemorySink()
+        bank = BankingSystem(sink=sink, rate_limiter=self.limiter)
+
+        async def attempts():
+            return [
+                await bank.authenticate_async("user123", "wrong", source="10.0.0.1")
+                for _ in range(3)
+            ]
+
+        self.assertEqual(asyncio.run(attempts()), [False] * 3)
+        self.assertEqual(sink.events[-1].fields["source"], "10.0.0.1")
+
+
+if __name__ == "__main__":
+    unittest.main()
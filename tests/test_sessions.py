@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+"""
+Session store unit tests.
+"""
+import threading
+import unittest
+
+from src.events import NullSink
+from src.sessions import SessionStore
+from src.white_box import BankingSystem, UserAuthentication
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSessionStore(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.store = SessionStore(ttl=10, shards=4, clock=self.clock)
+
+    def test_login_logout(self):
+        self.assertTrue(self.store.login("alice"))
+        self.assertFalse(self.store.login("alice"))
+        self.assertIn("alice", self.store)
+        self.assertTrue(self.store.logout("alice"))
+        self.assertFalse(self.store.logout("alice"))
+        self.assertNotIn("alice", self.store)
+
+    def test_sessions_expire(self):
+        self.store.login("alice")
+        self.clock.now = 9.9
+        self.assertTrue(self.store.is_active("alice"))
+        self.clock.now = 10
+        self.assertFalse(self.store.is_active("alice"))
+        self.assertFalse(self.store.logout("alice"))
+        self.assertTrue(self.store.login("alice"))
+
+    def test_touch_extends_session(self):
+        self.store.login("alice")
+        self.clock.now = 5
+        self.assertTrue(self.store.touch("alice"))
+        self.clock.now = 14
+        self.assertIn("alice", self.store)
+        self.clock.now = 15
+        self.assertFalse(self.store.touch("alice"))
+
+    def test_lazy_reaping(self):
+        store = SessionStore(ttl=10, shards=1, clock=self.clock, reap_batch=2)
+        for number in range(5):
+            store.login(number)
+        self.clock.now = 10
+
+        store.login("new")
+
+        self.assertEqual(len(store._shards[0].sessions), 4)
+        self.assertEqual(store.reap(), 3)
+        self.assertEqual(len(store), 1)
+
+    def test_set_interface(self):
+        self.store.add("alice")
+        self.store.add("bob")
+        self.store.discard("alice")
+        self.assertEqual(len(self.store), 1)
+
+    def test_concurrent_logins(self):
+        store = SessionStore(ttl=60, shards=8)
+        results = []
+
+        def login_all():
+            results.append(sum(store.login(number) for number in range(1000)))
+
+        threads = [threading.Thread(target=login_all) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sum(results), 1000)
+        self.assertEqual(len(store), 1000)
+
+
+class TestSessionStoreIntegration(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.store = SessionStore(ttl=10, clock=self.clock)
+
+    def test_user_authentication(self):
+        user = UserAuthentication("alice", self.store)
+        other = UserAuthentication("alice", self.store)
+
+        self.assertEqual(user.login(), "Login successful")
+        self.assertEqual(other.state, "Logged In")
+        self.assertEqual(other.login(), "Invalid operation in current state")
+        self.clock.now = 10
+        self.assertEqual(user.state, "Logged Out")
+        self.assertEqual(user.logout(), "Invalid operation in current state")
+        self.assertEqual(user.login(), "Login successful")
+        self.assertEqual(other.logout(), "Logout successful")
+        self.assertEqual(user.state, "Logged Out")
+
+    def test_banking_system(self):
+        banking_system = BankingSystem(NullSink(), session_store=self.store)
+
+        self.assertTrue(banking_system.authenticate("user123", "pass123"))
+        self.assertFalse(banking_system.authenticate("user123", "pass123"))
+        self.assertTrue(banking_system.transfer_money("user123", "bob", 1, "regular"))
+        self.clock.now = 10
+        self.assertFalse(banking_system.transfer_money("user123", "bob", 1, "regular"))
+        self.assertTrue(banking_system.authenticate("user123", "pass123"))
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+"""
+State machine engine unit tests.
+"""
+import unittest
+
+import numpy as np
+
+from src.state_machine import MachineSpec, StateMachine
+from src.white_box import ElevatorSystem, TrafficLight, VendingMachine
+
+
+class Door(StateMachine):
+    __slots__ = ()
+    spec = MachineSpec(
+        states=["Closed", "Open", "Locked"],
+        transitions={
+            "open": {"Closed": ("Open", "opened")},
+            "close": {"Open": ("Closed", "closed")},
+            "lock": {"Closed": ("Locked", "locked")},
+        },
+        invalid="invalid",
+    )
+
+    open = spec.event_method("open", "Opens the door.")
+    close = spec.event_method("close")
+    lock = spec.event_method("lock")
+
+
+class TestMachineSpec(unittest.TestCase):
+    def test_instance_transitions(self):
+        door = Door()
+        self.assertEqual(door.state, "Closed")
+        self.assertEqual(door.open(), "opened")
+        self.assertEqual(door.lock(), "invalid")
+        self.assertEqual(door.state, "Open")
+        self.assertEqual(door.close(), "closed")
+        self.assertEqual(door.lock(), "locked")
+        self.assertEqual(door.state, "Locked")
+
+    def test_event_method_metadata(self):
+        self.assertEqual(Door.open.__name__, "open")
+        self.assertEqual(Door.open.__doc__, "Opens the door.")
+
+    def test_instances_use_slots(self):
+        door = Door()
+        with self.assertRaises(AttributeError):
+            door.color = "red"
+        self.assertFalse(hasattr(VendingMachine(), "__dict__"))
+
+    def test_state_setter(self):
+        door = Door()
+        door.state = "Locked"
+        self.assertEqual(door.code, 2)
+        with self.assertRaises(ValueError):
+            door.state = "Ajar"
+
+    def test_dense_transition_array(self):
+        self.assertEqual(Door.spec.next_states.dtype, np.uint8)
+        self.assertEqual(
+            Door.spec.next_states.tolist(), [[1, 0, 2], [1, 0, 1], [2, 2, 2]]
+        )
+
+    def test_step_all(self):
+        codes = Door.spec.encode_all(["Closed", "Open", "Locked", "Closed"])
+
+        opened = Door.spec.step_all(codes, "open")
+
+        self.assertEqual(
+            Door.spec.decode_all(opened), ["Open", "Open", "Locked", "Open"]
+        )
+        self.assertEqual(
+            Door.spec.accepts_all(codes, "open").tolist(), [True, False, False, True]
+        )
+
+    def test_step_all_in_place(self):
+        lights = np.zeros(6, dtype=TrafficLight.spec.next_states.dtype)
+        for _ in range(4):
+            TrafficLight.spec.step_all(lights, "change_state", out=lights)
+
+        self.assertEqual(set(TrafficLight.spec.decode_all(lights)), {"Green"})
+
+    def test_step_all_matches_instances(self):
+        elevators = [ElevatorSystem() for _ in range(3)]
+        elevators[1].move_up()
+        elevators[2].move_down()
+        codes = np.array([elevator.code for elevator in elevators])
+
+        codes = ElevatorSystem.spec.step_all(codes, "stop")
+        for elevator in elevators:
+            elevator.stop()
+
+        self.assertEqual(codes.tolist(), [elevator.code for elevator in elevators])
+
+    def test_invalid_tables_rejected(self):
+        with self.assertRaises(ValueError):
+            MachineSpec(["A", "A"], {})
+        with self.assertRaises(ValueError):
+            MachineSpec(["A"], {"go": {"A": ("B", None)}})
+        with self.assertRaises(ValueError):
+            Door.spec.step_all(np.zeros(1, dtype=int), "kick")
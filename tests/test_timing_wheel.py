@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+"""
+Timing wheel unit tests.
+"""
+import random
+import unittest
+
+from src.timing_wheel import TimingWheel, TrafficLightScheduler
+from src.white_box import TrafficLight
+
+DURATIONS = {"Red": 30, "Green": 25, "Yellow": 5}
+
+
+class TestTimingWheel(unittest.TestCase):
+    def test_expiry_order(self):
+        wheel = TimingWheel(bits=2, levels=2)
+        for delay in (3, 1, 2):
+            wheel.schedule(delay, delay)
+
+        self.assertEqual(wheel.advance(), [1])
+        self.assertEqual(wheel.advance(2), [2, 3])
+        self.assertEqual(len(wheel), 0)
+
+    def test_minimum_delay_is_one_tick(self):
+        wheel = TimingWheel()
+        wheel.schedule(0, "now")
+        self.assertEqual(wheel.advance(), ["now"])
+
+    def test_cancel(self):
+        wheel = TimingWheel()
+        timer = wheel.schedule(5, "a")
+        wheel.schedule(5, "b")
+
+        self.assertTrue(wheel.cancel(timer))
+        self.assertFalse(wheel.cancel(timer))
+        self.assertEqual(len(wheel), 1)
+        self.assertEqual(wheel.advance(5), ["b"])
+        self.assertFalse(wheel.cancel(timer))
+
+    def test_matches_sorted_schedule(self):
+        # Small wheels so timers cascade through every level and the overflow
+        rng = random.Random(0)
+        wheel = TimingWheel(bits=3, levels=2)
+        expected, cancelled = {}, set()
+        for number in range(2000):
+            delay = rng.randint(1, 200)
+            timer = wheel.schedule(delay, number)
+            expected[number] = wheel.tick + delay
+            if rng.random() < 0.2:
+                wheel.cancel(timer)
+                cancelled.add(number)
+            for _ in range(rng.randint(0, 2)):
+                for item in wheel.advance():
+                    self.assertEqual(expected.pop(item), wheel.tick)
+
+        while len(wheel):
+            for item in wheel.advance():
+                self.assertEqual(expected.pop(item), wheel.tick)
+
+        self.assertEqual(set(expected), cancelled)
+
+
+class TestTrafficLightScheduler(unittest.TestCase):
+    def test_per_state_durations(self):
+        light = TrafficLight()
+        scheduler = TrafficLightScheduler(DURATIONS)
+        scheduler.add(light)
+
+        scheduler.advance(29)
+        self.assertEqual(light.state, "Red")
+        scheduler.advance(1)
+        self.assertEqual(light.state, "Green")
+        scheduler.advance(25)
+        self.assertEqual(light.state, "Yellow")
+        scheduler.advance(5)
+        self.assertEqual(light.state, "Red")
+
+    def test_batches_and_offsets(self):
+        lights = [TrafficLight() for _ in range(100)]
+        scheduler = TrafficLightScheduler(DURATIONS, tick=0.5)
+        for index, light in enumerate(lights):
+            scheduler.add(light, offset=index % 2)
+
+        self.assertEqual(scheduler.advance(30), 50)
+        self.assertEqual(scheduler.advance(1), 50)
+        self.assertEqual({light.state for light in lights}, {"Green"})
+
+    def test_remove(self):
+        light = TrafficLight()
+        scheduler = TrafficLightScheduler(DURATIONS)
+        scheduler.add(light)
+        scheduler.remove(light)
+
+        self.assertEqual(scheduler.advance(100), 0)
+        self.assertEqual(light.state, "Red")
+
+    def test_run_on_fake_clock(self):
+        now = [0.0]
+
+        def sleep(seconds):
+            now[0] += seconds
+
+        light = TrafficLight()
+        scheduler = TrafficLightScheduler(DURATIONS)
+        scheduler.add(light)
+
+        changes = scheduler.run(60, clock=lambda: now[0], sleep=sleep)
+
+        self.assertEqual(changes, 3)
+        self.assertEqual(now[0], 60)
+        self.assertEqual(light.state, "Red")
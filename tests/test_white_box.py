@@ -3,11 +3,27 @@
 """
 White-box unit testing examples.
 """
+from array import array
+import ast
+import copy
+from collections import Counter
 from io import StringIO
+import importlib
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import threading
 import unittest
 from unittest.mock import patch
 
+from src import white_box
+from src.events import MemorySink
+from src.instrumentation import public_definitions
+from src.intervals import IntervalTable
 from src.white_box import *
+from src.white_box import validators
 
 class TestWhiteBox(unittest.TestCase):
     """
@@ -291,9 +307,9 @@ class TestWhiteBoxExcersises(unittest.TestCase):
     def test_valid_http_url(self):
         self.assertEqual(validate_url("http://example.com"), "Valid URL")
 
-    def test_valid_https_url(self):
+    def test_too_long_https_url(self):
         too_long_url = "https://" + "a" * 248  # 8 + 248 = 256 chars
-        self.assertEqual(validate_url(too_long_url), "Valid URL")  
+        self.assertEqual(validate_url(too_long_url), "Invalid URL")
 
     def test_url_no_http(self):
         self.assertEqual(validate_url("example.com"), "Invalid URL")
@@ -719,4 +735,747 @@ class TestWhiteBoxShoppingCart(unittest.TestCase):
         self.cart.checkout()
         
         expected_output = "Total: $27.97\nCheckout completed. Thank you for shopping!\n"
-        self.assertEqual(mock_stdout.getvalue(), expected_output)
\ No newline at end of file
+        self.assertEqual(mock_stdout.getvalue(), expected_output)
+
+# 4 (batch)
+class TestWhiteBoxOrderTotals(unittest.TestCase):
+    def test_order_totals_match_scalar(self):
+        order_ids = [7, 3, 7, 3, 9, 7]
+        quantities = [3, 8, 15, 1, 0, 10]
+        prices = [10.0, 2.5, 1.1, 99.99, 5.0, 0.3]
+
+        ids, totals = calculate_order_totals(order_ids, quantities, prices)
+
+        self.assertEqual(ids.tolist(), [3, 7, 9])
+        for order_id, total in zip(ids.tolist(), totals.tolist()):
+            items = [
+                {"quantity": q, "price": p}
+                for o, q, p in zip(order_ids, quantities, prices)
+                if o == order_id
+            ]
+            self.assertEqual(total, calculate_order_total(items))
+
+    def test_order_totals_from_buffers(self):
+        ids, totals = calculate_order_totals(
+            array("q", [1, 1]), array("q", [6, 11]), array("d", [10.0, 10.0])
+        )
+        self.assertEqual(ids.tolist(), [1])
+        items = [{"quantity": 6, "price": 10.0}, {"quantity": 11, "price": 10.0}]
+        self.assertEqual(totals.tolist(), [calculate_order_total(items)])
+
+    def test_order_totals_empty(self):
+        ids, totals = calculate_order_totals([], [], [])
+        self.assertEqual(len(ids), 0)
+        self.assertEqual(len(totals), 0)
+
+    def test_order_totals_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            calculate_order_totals([1, 2], [1], [1.0, 2.0])
+
+
+# 28 (indexed cart)
+class TestWhiteBoxShoppingCartIndex(unittest.TestCase):
+    def setUp(self):
+        self.cart = ShoppingCart()
+        self.product1 = Product("Product 1", 10.99)
+        self.product2 = Product("Product 2", 5.99)
+
+    def test_total_tracks_changes(self):
+        self.cart.add_product(self.product1, 2)
+        self.cart.add_product(self.product2, 3)
+        self.cart.remove_product(self.product2)
+
+        self.assertAlmostEqual(self.cart.total, 10.99 * 2 + 5.99 * 2)
+
+    def test_total_removing_more_than_exists(self):
+        self.cart.add_product(self.product1, 2)
+        self.cart.add_product(self.product2, 1)
+        self.cart.remove_product(self.product1, 5)
+
+        self.assertAlmostEqual(self.cart.total, 5.99)
+
+    def test_total_reset_when_empty(self):
+        self.cart.add_product(self.product1, 3)
+        self.cart.remove_product(self.product1, 3)
+
+        self.assertEqual(self.cart.total, 0)
+
+    def test_items_keep_insertion_order(self):
+        self.cart.add_product(self.product1)
+        self.cart.add_product(self.product2)
+        self.cart.remove_product(self.product1)
+        self.cart.add_product(self.product1)
+
+        products = [item["product"] for item in self.cart.items]
+        self.assertEqual(products, [self.product2, self.product1])
+
+
+    def test_items_view_is_live(self):
+        self.cart.add_product(self.product1)
+        self.cart.items.append({"product": self.product2, "quantity": 2})
+        self.cart.items[0]["quantity"] = 3
+
+        self.assertEqual(len(self.cart.items), 2)
+        self.assertAlmostEqual(self.cart.total, 10.99 * 3 + 5.99 * 2)
+        self.cart.remove_product(self.product2)
+        self.assertEqual(self.cart.items[1]["quantity"], 1)
+
+        del self.cart.items[0]
+        self.assertEqual(self.cart.items, [{"product": self.product2, "quantity": 1}])
+        self.cart.items.clear()
+        self.assertEqual(self.cart.items, [])
+        self.assertEqual(self.cart.total, 0)
+
+    def test_items_assignment(self):
+        self.cart.add_product(self.product1)
+        self.cart.items = [{"product": self.product2, "quantity": 2}]
+
+        self.assertEqual(self.cart.total, 5.99 * 2)
+        self.cart.add_product(self.product2)
+        self.assertEqual(self.cart.items[0]["quantity"], 3)
+        with self.assertRaises(ValueError):
+            self.cart.items.append({"product": self.product2, "quantity": 1})
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_checkout_total_has_no_residue(self, mock_stdout):
+        product1, product2 = Product("A", 0.1), Product("B", 0.2)
+        self.cart.add_product(product1)
+        self.cart.add_product(product2)
+        self.cart.remove_product(product1)
+
+        self.cart.checkout()
+
+        self.assertEqual(mock_stdout.getvalue().splitlines()[0], "Total: $0.2")
+
+    def test_total_is_exact(self):
+        products = [Product(str(index), index / 7 + 0.01) for index in range(50)]
+        for index, product in enumerate(products):
+            self.cart.add_product(product, index % 4 + 1)
+        for product in products[::3]:
+            self.cart.remove_product(product)
+
+        amounts = [item["product"].price * item["quantity"] for item in self.cart.items]
+        self.assertEqual(self.cart.total, math.fsum(amounts))
+
+    def test_total_keeps_price_types(self):
+        self.cart.add_product(Product("A", 3), 2)
+        self.assertEqual(repr(self.cart.total), "6")
+        self.cart.add_product(Product("B", 1.0))
+        self.assertEqual(repr(self.cart.total), "7.0")
+        self.cart.add_product(Product("C", float("inf")))
+        self.assertEqual(self.cart.total, float("inf"))
+
+    def test_items_changed_in_place(self):
+        self.cart.add_product(self.product1)
+        item = self.cart.items[0]
+        item.update(quantity=4)
+        self.assertAlmostEqual(self.cart.total, 10.99 * 4)
+        del item["quantity"]
+        self.assertEqual(self.cart.total, 0)
+        item.setdefault("quantity", 2)
+        self.assertAlmostEqual(self.cart.total, 10.99 * 2)
+        self.assertEqual(type(copy.copy(item)), dict)
+
+        self.cart.remove_product(self.product1, 2)
+        item["quantity"] = 10
+        self.assertEqual(self.cart.total, 0)
+
+    def test_items_iteration_is_linear(self):
+        self.cart.add_product(self.product1)
+        self.cart.add_product(self.product2)
+        with patch.object(type(self.cart.items), "__getitem__") as getitem:
+            products = [item["product"] for item in self.cart.items]
+            self.assertIn({"product": self.product2, "quantity": 1}, self.cart.items)
+            self.assertEqual(len(self.cart.items), 2)
+        getitem.assert_not_called()
+        self.assertEqual(products, [self.product1, self.product2])
+
+# 2 (batch)
+class TestWhiteBoxPasswordBatch(unittest.TestCase):
+    def test_unicode_digit_counts_as_digit(self):
+        self.assertTrue(validate_password("abAB٣cde@"))
+
+    def test_password_failures(self):
+        self.assertEqual(password_failures("abAB123@$"), [])
+        self.assertEqual(password_failures("ab1"), ["length", "uppercase", "special"])
+
+    def test_validate_passwords_streams_results(self):
+        results = validate_passwords(iter(["abAB123@$", "aA1@"]))
+        self.assertEqual(next(results), True)
+        self.assertEqual(next(results), False)
+
+    def test_validate_passwords_counts_failures(self):
+        failures = Counter()
+        passwords = ["abAB123@$", "abab123@$", "ABAB", "abAB123?-"]
+
+        results = list(validate_passwords(passwords, failures))
+
+        self.assertEqual(results, [True, False, False, False])
+        self.assertEqual(
+            failures,
+            {"length": 1, "uppercase": 1, "lowercase": 1, "digit": 1, "special": 2},
+        )
+
+
+# 10 (buffers)
+class TestWhiteBoxTemperatureBuffers(unittest.TestCase):
+    def test_matches_scalar(self):
+        samples = [-100, -40.5, 0, 36.6, 100]
+        results = celsius_to_fahrenheit_many(array("d", samples))
+        self.assertEqual(results.tolist(), [celsius_to_fahrenheit(c) for c in samples])
+
+    def test_out_of_range_fill(self):
+        results = celsius_to_fahrenheit_many(array("f", [-101, 0, 101, float("nan")]))
+        self.assertEqual(results.dtype.itemsize, 4)
+        self.assertEqual(
+            [result != result for result in results.tolist()],
+            [True, False, True, True],
+        )
+
+    def test_writes_into_out_buffer(self):
+        samples = array("f", [0, 100, 200])
+        out = array("f", [0.0] * 3)
+        mask = bytearray(3)
+        results = celsius_to_fahrenheit_many(
+            memoryview(samples), out, mask=memoryview(mask).cast("?"), fill=None
+        )
+        self.assertEqual(out.tolist(), [32, 212, 392])
+        self.assertEqual(list(mask), [0, 0, 1])
+        results[0] = 1
+        self.assertEqual(out[0], 1)
+
+    def test_plain_buffer_mask(self):
+        samples = array("d", [-101, 0, 101])
+        for mask in (bytearray(3), array("b", [1, 1, 1]), array("B", [0, 0, 0])):
+            celsius_to_fahrenheit_many(samples, mask=mask, fill=None)
+            self.assertEqual(list(mask), [1, 0, 1])
+
+        with self.assertRaises(ValueError):
+            celsius_to_fahrenheit_many(samples, mask=array("i", [0, 0, 0]))
+
+    def test_in_place(self):
+        samples = array("d", [10, 150])
+        celsius_to_fahrenheit_many(samples, samples, fill=-1)
+        self.assertEqual(samples.tolist(), [50, -1])
+
+    def test_untyped_buffer(self):
+        samples = bytearray(array("d", [5, 20]).tobytes())
+        results = celsius_to_fahrenheit_many(samples, dtype="d")
+        self.assertEqual(results.tolist(), [41, 68])
+
+    def test_shape_mismatch(self):
+        with self.assertRaises(ValueError):
+            celsius_to_fahrenheit_many(array("d", [1, 2]), array("d", [0]))
+
+    def test_convert_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "celsius.f32")
+            destination = os.path.join(directory, "fahrenheit.f32")
+            with open(source, "wb") as file:
+                array("f", [0, 100, -150, 37, 25, 500, -40]).tofile(file)
+
+            invalid = convert_celsius_file(source, destination, chunk_size=3)
+
+            self.assertEqual(invalid, 2)
+            with open(destination, "rb") as file:
+                results = array("f", file.read())
+            self.assertEqual(results[:2].tolist(), [32, 212])
+            self.assertNotEqual(results[2], results[2])
+            self.assertEqual(results[-1], -40)
+
+
+    def test_convert_empty_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "celsius.f32")
+            destination = os.path.join(directory, "fahrenheit.f32")
+            open(source, "wb").close()
+
+            self.assertEqual(convert_celsius_file(source, destination), 0)
+            self.assertEqual(os.path.getsize(destination), 0)
+
+# 11 (batch)
+class TestWhiteBoxCreditCardBatch(unittest.TestCase):
+    def test_luhn_checksum(self):
+        cards = ["4111111111111111", "4111111111111112", "378282246310005"]
+        self.assertEqual(validate_credit_cards(cards).tolist(), [True, False, True])
+
+    def test_length_and_digits(self):
+        cards = ["411111111111", "41111111111111111", "4111-1111-1111", ""]
+        self.assertEqual(validate_credit_cards(cards).tolist(), [False] * 4)
+
+    def test_without_luhn_matches_scalar(self):
+        cards = ["12345678901234", "123456789012", "12345678a90123"]
+        results = validate_credit_cards(cards, luhn=False, labels=True)
+        self.assertEqual(results.tolist(), [validate_credit_card(c) for c in cards])
+
+    def test_labels(self):
+        results = validate_credit_cards(["4111111111111111", "1"], labels=True)
+        self.assertEqual(results.tolist(), ["Valid Card", "Invalid Card"])
+
+
+# 12 (calendar)
+class TestWhiteBoxDates(unittest.TestCase):
+    def test_days_in_month(self):
+        self.assertEqual(validate_date(2023, 4, 30), "Valid Date")
+        self.assertEqual(validate_date(2023, 4, 31), "Invalid Date")
+        self.assertEqual(validate_date(2023, 2, 30), "Invalid Date")
+
+    def test_leap_years(self):
+        self.assertEqual(validate_date(2024, 2, 29), "Valid Date")
+        self.assertEqual(validate_date(2023, 2, 29), "Invalid Date")
+        self.assertEqual(validate_date(2000, 2, 29), "Valid Date")
+        self.assertEqual(validate_date(1900, 2, 29), "Invalid Date")
+
+    def test_float_months(self):
+        self.assertEqual(validate_date(2023, 2.0, 1), "Valid Date")
+        self.assertEqual(validate_date(2024, 2.0, 29.0), "Valid Date")
+        self.assertEqual(validate_date(2023, 2.5, 1), "Invalid Date")
+        self.assertEqual(validate_date(2023, float("nan"), 1), "Invalid Date")
+        self.assertEqual(validate_date(2023, 2, 2.5), "Invalid Date")
+        self.assertEqual(validate_date(2023.5, 2, 1), "Invalid Date")
+        self.assertEqual(validate_date(2023, 2, float("inf")), "Invalid Date")
+
+    def test_year_window(self):
+        self.assertEqual(validate_date(1850, 1, 1, min_year=1800), "Valid Date")
+        self.assertEqual(validate_date(2023, 1, 1, max_year=2000), "Invalid Date")
+
+    def test_batch_reasons(self):
+        valid, reasons = validate_dates(
+            [2024, 2023, 1899, 2023, 2023], [2, 2, 5, 13, 6], [29, 29, 1, 1, 0]
+        )
+        self.assertEqual(valid.tolist(), [True, False, False, False, False])
+        self.assertEqual(
+            reasons.tolist(),
+            [DATE_OK, DATE_BAD_DAY, DATE_BAD_YEAR, DATE_BAD_MONTH, DATE_BAD_DAY],
+        )
+
+    def test_batch_matches_scalar(self):
+        dates = [
+            (y, m, d) for y in (1900, 2000, 2023) for m in range(14) for d in range(33)
+        ]
+        valid, _ = validate_dates(*zip(*dates))
+        expected = [validate_date(*date) == "Valid Date" for date in dates]
+        self.assertEqual(valid.tolist(), expected)
+
+    def test_batch_float_fields(self):
+        nan = float("nan")
+        years = [2024.0, 2023, 2023, 2100.5, 2023, nan, 2023]
+        months = [2.0, 2.5, 2, 2, nan, 1, 1]
+        days = [29.0, 1, 28.5, 1, 1, 1, float("inf")]
+
+        valid, reasons = validate_dates(years, months, days)
+
+        self.assertEqual(valid.tolist(), [True] + [False] * 6)
+        self.assertEqual(reasons.tolist(), [DATE_OK] + [DATE_BAD_FORMAT] * 6)
+        for date, date_valid in zip(zip(years, months, days), valid.tolist()):
+            self.assertEqual(validate_date(*date) == "Valid Date", date_valid)
+
+    def test_batch_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            validate_dates([2023], [1, 2], [1])
+
+    def test_iso_strings(self):
+        dates = ["2024-02-29", "2023-02-29", "2023-1-01", "2023-01-01T00"]
+        dates.append("1800-01-01")
+        valid, reasons = validate_iso_dates(dates)
+        self.assertEqual(valid.tolist(), [True, False, False, False, False])
+        self.assertEqual(
+            [DATE_REASONS[reason] for reason in reasons],
+            ["ok", "day", "format", "format", "year"],
+        )
+
+    def test_iso_bytes(self):
+        valid, _ = validate_iso_dates([b"2023-12-31", b"2023-12-32"])
+        self.assertEqual(valid.tolist(), [True, False])
+
+    def test_parse_iso_dates(self):
+        years, months, days, well_formed = parse_iso_dates(["2023-07-04", "short"])
+        self.assertEqual(years.tolist(), [2023, 0])
+        self.assertEqual(months.tolist(), [7, 0])
+        self.assertEqual(days.tolist(), [4, 0])
+        self.assertEqual(well_formed.tolist(), [True, False])
+
+
+# 14 (stream)
+class TestWhiteBoxUrlStream(unittest.TestCase):
+    def test_https_url(self):
+        self.assertEqual(validate_url("https://example.com/path?q=1"), "Valid URL")
+
+    def test_failure_reasons(self):
+        self.assertIsNone(url_failure("https://user@[::1]:8080/index.html"))
+        self.assertEqual(url_failure("https://" + "a" * 248), "length")
+        self.assertEqual(url_failure("ftp://example.com"), "scheme")
+        self.assertEqual(url_failure("http://"), "host")
+        self.assertEqual(url_failure("http://-example.com"), "host")
+        self.assertEqual(url_failure("http://example.com/a b"), "path")
+
+    def test_counts(self):
+        urls = ["http://example.com", "example.com", "http://", "http://a.io/ x"]
+        failures = Counter()
+        results = list(validate_urls(urls, failures))
+        self.assertEqual(results, [True, False, False, False])
+        self.assertEqual(failures, {"length": 0, "scheme": 1, "host": 1, "path": 1})
+
+    def test_stream_is_lazy(self):
+        def urls():
+            yield "http://example.com"
+            raise AssertionError("read too far")
+
+        self.assertTrue(next(validate_urls(urls(), Counter())))
+
+    def test_read_log(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "access.log")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write("1.2.3.4 GET http://example.com/ 200\n")
+                file.write("1.2.3.5 GET example.com 404\n")
+                file.write("short\n")
+
+            for use_mmap in (False, True):
+                urls = list(read_log_urls(path, field=2, use_mmap=use_mmap))
+                self.assertEqual(urls, ["http://example.com/", "example.com", ""])
+            lines = list(read_log_urls(path, use_mmap=True))
+            self.assertEqual(lines[-1], "short")
+
+    def test_read_empty_log(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "empty.log")
+            open(path, "w", encoding="utf-8").close()
+            self.assertEqual(list(read_log_urls(path, use_mmap=True)), [])
+
+
+# Interval tables
+class TestWhiteBoxIntervalTables(unittest.TestCase):
+    def test_grade_boundaries(self):
+        self.assertEqual(get_grade(90), "A")
+        self.assertEqual(get_grade(89.5), "B")
+        self.assertEqual(get_grade(70), "C")
+        self.assertEqual(get_grade(69.9), "F")
+
+    def test_category_gaps_closed(self):
+        self.assertEqual(categorize_product(50.5), "Category A")
+        self.assertEqual(categorize_product(100.5), "Category B")
+        self.assertEqual(categorize_product(200), "Category C")
+        self.assertEqual(categorize_product(200.5), "Category D")
+        self.assertEqual(categorize_product(9.99), "Category D")
+
+    def test_total_discount_boundaries(self):
+        self.assertEqual(calculate_total_discount(100), 0.1 * 100)
+        self.assertEqual(calculate_total_discount(500), 0.1 * 500)
+        self.assertEqual(calculate_total_discount(500.5), 0.2 * 500.5)
+
+    def test_quantity_discount_outside_tiers(self):
+        self.assertEqual(calculate_quantity_discount(0), "10% Discount")
+        self.assertEqual(calculate_quantity_discount(10), "5% Discount")
+
+    def test_non_finite_numbers(self):
+        self.assertEqual(get_grade(float("inf")), "A")
+        self.assertEqual(get_grade(float("-inf")), "F")
+        self.assertEqual(get_grade(float("nan")), "F")
+        self.assertEqual(calculate_total_discount(float("inf")), float("inf"))
+        self.assertEqual(calculate_total_discount(float("-inf")), 0)
+
+    def test_quantities_between_tiers(self):
+        self.assertEqual(calculate_quantity_discount(5.5), "10% Discount")
+        self.assertEqual(calculate_quantity_discount(10.5), "10% Discount")
+        discounts = QUANTITY_DISCOUNTS.lookup_many([5, 5.5, 6, 10.5])
+        self.assertEqual(
+            discounts.tolist(),
+            ["No Discount", "10% Discount", "5% Discount", "10% Discount"],
+        )
+        # The order total applies the same tiers
+        items = [{"quantity": 5.5, "price": 2}]
+        self.assertAlmostEqual(calculate_order_total(items), 0.9 * 5.5 * 2)
+
+    def test_batch_lookup(self):
+        grades = GRADES.lookup_many([95, 85, 75, 65])
+        self.assertEqual(grades.tolist(), ["A", "B", "C", "F"])
+
+
+# 27 (ledger)
+class TestWhiteBoxBankingLedger(unittest.TestCase):
+    def setUp(self):
+        self.banking_system = BankingSystem()
+        self.banking_system.logged_in_users.update({"alice", "bob"})
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_transfer_updates_balances(self, mock_stdout):
+        self.banking_system.open_account("alice", 500)
+
+        result = self.banking_system.transfer_money("alice", "bob", 100, "express")
+
+        self.assertTrue(result)
+        self.assertEqual(self.banking_system.get_account("alice").balance, 395)
+        self.assertEqual(self.banking_system.get_account("bob").balance, 1100)
+        self.assertEqual(self.banking_system.fee_account.balance, 5)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_transfer_insufficient_funds(self, mock_stdout):
+        self.banking_system.open_account("alice", 100)
+
+        result = self.banking_system.transfer_money("alice", "bob", 100, "regular")
+
+        self.assertFalse(result)
+        self.assertEqual(mock_stdout.getvalue(), "Insufficient funds.\n")
+        self.assertEqual(self.banking_system.get_account("alice").balance, 100)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_transfer_unauthenticated_sender(self, mock_stdout):
+        result = self.banking_system.transfer_money("carol", "bob", 10, "regular")
+
+        self.assertFalse(result)
+        self.assertEqual(mock_stdout.getvalue(), "Sender not authenticated.\n")
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_transfer_invalid_type(self, mock_stdout):
+        result = self.banking_system.transfer_money("alice", "bob", 10, "instant")
+
+        self.assertFalse(result)
+        self.assertEqual(mock_stdout.getvalue(), "Invalid transaction type.\n")
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_transfer_invalid_amount(self, mock_stdout):
+        for amount in (-500, 0, "10", True, float("nan")):
+            result = self.banking_system.transfer_money(
+                "alice", "bob", amount, "regular"
+            )
+            self.assertFalse(result)
+
+        self.assertEqual(mock_stdout.getvalue(), "Invalid amount.\n" * 5)
+        self.assertEqual(self.banking_system.get_account("alice").balance, 1000)
+        self.assertEqual(self.banking_system.get_account("bob").balance, 1000)
+        self.assertEqual(self.banking_system.fee_account.balance, 0)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_transfer_mixed_account_number_types(self, mock_stdout):
+        self.banking_system.logged_in_users.add(7)
+
+        self.assertTrue(self.banking_system.transfer_money("alice", 42, 10, "regular"))
+        self.assertTrue(self.banking_system.transfer_money(7, "bob", 10, "regular"))
+        self.assertEqual(self.banking_system.get_account(42).balance, 1010)
+        self.assertEqual(self.banking_system.get_account(7).balance, 989.8)
+
+    def test_open_existing_account(self):
+        self.banking_system.open_account("alice")
+        with self.assertRaises(ValueError):
+            self.banking_system.open_account("alice")
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_concurrent_transfers_conserve_money(self, mock_stdout):
+        def transfers(sender, receiver):
+            for _ in range(200):
+                self.banking_system.transfer_money(sender, receiver, 3, "regular")
+
+        threads = [
+            threading.Thread(target=transfers, args=("alice", "bob")),
+            threading.Thread(target=transfers, args=("bob", "alice")),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        total = (
+            self.banking_system.get_account("alice").balance
+            + self.banking_system.get_account("bob").balance
+            + self.banking_system.fee_account.balance
+        )
+        self.assertAlmostEqual(total, 2000)
+        self.assertAlmostEqual(self.banking_system.fee_account.balance, 400 * 0.06)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_settle_transfers(self, mock_stdout):
+        self.banking_system.open_account("alice", 150)
+        self.banking_system.open_account("bob", 0)
+
+        results = self.banking_system.settle_transfers(
+            [
+                ("alice", "bob", 100, "regular"),  # alice: 48, bob: 100
+                ("alice", "bob", 50, "regular"),  # insufficient funds
+                ("bob", "alice", 50, "scheduled"),  # bob: 49.5, alice: 98
+                ("alice", "bob", 95, "express"),  # insufficient funds
+                ("carol", "bob", 10, "regular"),  # not authenticated
+                ("bob", "alice", 10, "instant"),  # invalid type
+            ]
+        )
+
+        self.assertEqual(results, [True, False, True, False, False, False])
+        self.assertAlmostEqual(self.banking_system.get_account("alice").balance, 98)
+        self.assertAlmostEqual(self.banking_system.get_account("bob").balance, 49.5)
+        self.assertAlmostEqual(self.banking_system.fee_account.balance, 2.5)
+        self.assertNotIn("carol", self.banking_system.accounts)
+        self.assertEqual(mock_stdout.getvalue(), "Settled 2 of 6 transfers.\n")
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_settle_transfers_invalid_amount(self, mock_stdout):
+        results = self.banking_system.settle_transfers(
+            [
+                ("alice", "bob", -300, "regular"),
+                ("alice", "bob", "10", "regular"),
+                ("alice", "bob", 100, "regular"),
+            ]
+        )
+
+        self.assertEqual(results, [False, False, True])
+        self.assertAlmostEqual(self.banking_system.get_account("alice").balance, 898)
+        self.assertAlmostEqual(self.banking_system.get_account("bob").balance, 1100)
+        self.assertAlmostEqual(self.banking_system.fee_account.balance, 2)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_settle_transfers_mixed_account_number_types(self, mock_stdout):
+        self.banking_system.logged_in_users.add(7)
+
+        results = self.banking_system.settle_transfers(
+            [("alice", 42, 10, "regular"), (7, "bob", 10, "regular")]
+        )
+
+        self.assertEqual(results, [True, True])
+        self.assertEqual(self.banking_system.get_account(42).balance, 1010)
+        self.assertEqual(self.banking_system.get_account(7).balance, 989.8)
+        self.assertAlmostEqual(self.banking_system.fee_account.balance, 0.4)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_settle_transfers_matches_single_path(self, mock_stdout):
+        transfers = [
+            ("alice", "bob", 600, "express"),
+            ("bob", "alice", 1500, "regular"),
+            ("alice", "bob", 500, "scheduled"),
+        ]
+        single = BankingSystem()
+        single.logged_in_users.update({"alice", "bob"})
+
+        expected = [single.transfer_money(*transfer) for transfer in transfers]
+        results = self.banking_system.settle_transfers(transfers)
+
+        self.assertEqual(results, expected)
+        for name in ("alice", "bob"):
+            self.assertAlmostEqual(
+                self.banking_system.get_account(name).balance,
+                single.get_account(name).balance,
+            )
+
+    def test_settle_no_transfers(self):
+        self.assertEqual(self.banking_system.settle_transfers([]), [])
+
+
+# Event sinks
+class TestWhiteBoxEventSinks(unittest.TestCase):
+    def test_banking_system_events(self):
+        sink = MemorySink()
+        banking_system = BankingSystem(sink=sink)
+
+        banking_system.authenticate("user123", "pass123")
+        banking_system.transfer_money("user123", "user456", 10, "regular")
+        banking_system.get_account("user123").view_account()
+
+        self.assertEqual(
+            [event.name for event in sink.events],
+            ["authenticated", "transfer_processed", "account_viewed"],
+        )
+        self.assertEqual(sink.events[1].fields["fee"], 0.02 * 10)
+        self.assertEqual(
+            sink.messages[2], "The account user123 has a balance of 989.8"
+        )
+
+    def test_shopping_cart_events(self):
+        sink = MemorySink()
+        cart = ShoppingCart(sink=sink)
+        cart.add_product(Product("Product 1", 10.99), 2)
+
+        cart.view_cart()
+        cart.checkout()
+
+        self.assertEqual(
+            sink.messages,
+            [
+                "2 x Product 1 - $21.98",
+                "Total: $21.98",
+                "Checkout completed. Thank you for shopping!",
+            ],
+        )
+
+
+# Package
+class TestWhiteBoxPackage(unittest.TestCase):
+    def _run(self, script):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        completed = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return completed.stdout
+
+    def test_subsystems_imported_on_first_use(self):
+        script = (
+            "import sys\n"
+            "import src.white_box as wb\n"
+            "names = ['src.white_box.validators', 'src.white_box.batch']\n"
+            "names += ['re', 'numpy']\n"
+            "def loaded():\n"
+            "    return [name in sys.modules for name in names]\n"
+            "states = [loaded()]\n"
+            "wb.validate_email('a@b.co')\n"
+            "states.append(loaded())\n"
+            "wb.validate_url('http://example.com')\n"
+            "states.append(loaded())\n"
+            "wb.check_file_sizes([1])\n"
+            "states.append(loaded())\n"
+            "print(states)\n"
+        )
+        self.assertEqual(
+            ast.literal_eval(self._run(script)),
+            [
+                [False, False, False, False],
+                [True, False, False, False],
+                [True, False, True, False],
+                [True, True, True, True],
+            ],
+        )
+
+    def test_patch_before_first_use(self):
+        script = (
+            "from unittest.mock import patch\n"
+            "import src.white_box as wb\n"
+            "with patch('src.white_box.validate_email', len):\n"
+            "    patched = wb.validate_email('ab')\n"
+            "with patch('src.white_box.GRADES', None):\n"
+            "    pass\n"
+            "print([patched, wb.validate_email('a@b.co'), wb.get_grade(95)])\n"
+        )
+        self.assertEqual(
+            ast.literal_eval(self._run(script)), [2, "Valid Email", "A"]
+        )
+
+    def test_delete_restores_subsystem_value(self):
+        original = white_box.validate_email
+        white_box.validate_email = len
+        self.assertIs(validators.validate_email, len)
+        del white_box.validate_email
+        self.assertIs(validators.validate_email, original)
+        self.assertIs(white_box.validate_email, original)
+
+    def test_every_public_name_listed(self):
+        for module, names in white_box._SUBMODULES.items():
+            submodule = importlib.import_module(f"src.white_box.{module}")
+            for name in names:
+                self.assertIs(getattr(white_box, name), getattr(submodule, name))
+            self.assertLessEqual(set(public_definitions(submodule)), set(names))
+        self.assertEqual(len(set(white_box.__all__)), len(white_box.__all__))
+
+    def test_dir(self):
+        self.assertIn("BankingSystem", dir(white_box))
+        with self.assertRaises(AttributeError):
+            white_box.validate_everything  # pylint: disable=pointless-statement
+
+    def test_assignment_reaches_subsystem(self):
+        grades = white_box.GRADES
+        try:
+            white_box.GRADES = IntervalTable([(0, 101, "P")])
+            self.assertIs(validators.GRADES, white_box.GRADES)
+            self.assertEqual(get_grade(95), "P")
+        finally:
+            white_box.GRADES = grades
+        self.assertEqual(get_grade(95), "A")